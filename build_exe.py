@@ -10,6 +10,11 @@ import shutil
 import subprocess
 from pathlib import Path
 
+# 프로그램 시작 시 불러오는 모듈의 import 시간 예산 (ms, 환경변수 IMPORT_TIME_BUDGET_MS로 변경 가능)
+DEFAULT_IMPORT_TIME_BUDGET_MS = 400
+# 처음 사용할 때 불러와야 하는 무거운 모듈 (시작 시 import되면 회귀로 판단)
+DEFERRED_MODULES = ['google.generativeai', 'selenium', 'webdriver_manager']
+
 def clean_build_files():
     """Clean existing build files"""
     print("Cleaning existing build files...")
@@ -40,6 +45,57 @@ def install_dependencies():
         return False
     return True
 
+def measure_import_time(module='main_window'):
+    """python -X importtime 결과를 {모듈: 누적 시간(ms)}으로 반환"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'import failed')
+    
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        parts = line[len('import time:'):].split('|')
+        try:
+            cumulative = int(parts[1]) / 1000
+        except ValueError:
+            continue  # 헤더 줄
+        timings[parts[2].strip()] = cumulative
+    return timings
+
+def check_import_time(module='main_window'):
+    """시작 import 시간이 예산 안인지, 무거운 모듈이 시작 시 import되지 않는지 확인"""
+    print("Checking startup import time...")
+    
+    try:
+        budget = int(os.getenv('IMPORT_TIME_BUDGET_MS', DEFAULT_IMPORT_TIME_BUDGET_MS))
+    except ValueError:
+        budget = DEFAULT_IMPORT_TIME_BUDGET_MS
+    try:
+        timings = measure_import_time(module)
+    except Exception as e:
+        print(f"   Import time check failed: {e}\n")
+        return False
+    
+    total = timings.get(module, 0)
+    print(f"   import {module}: {total:.0f} ms (budget {budget} ms)")
+    offenders = [item for item in timings.items() if item[0] not in (module, 'site')]
+    for name, cumulative in sorted(offenders, key=lambda item: item[1], reverse=True)[:5]:
+        print(f"      {cumulative:8.1f} ms  {name}")
+    
+    ok = total <= budget
+    if not ok:
+        print(f"   Import time over budget by {total - budget:.0f} ms")
+    for name in DEFERRED_MODULES:
+        if name in timings:
+            print(f"   {name} is imported at startup ({timings[name]:.0f} ms) - import it where it is first used")
+            ok = False
+    print("   Import time check passed\n" if ok else "   Import time check failed\n")
+    return ok
+
 def create_spec_file():
     """PyInstaller spec 파일 생성"""
     spec_content = '''
@@ -61,14 +117,34 @@ a = Analysis(
         'PyQt5.QtGui',
         'requests',
         'google.generativeai',
+        'google.api_core.exceptions',
         'selenium',
         'webdriver_manager',
         'pyperclip',
+        'main_window',
         'core.workers',
+        'core.article_store',
+        'core.article_writer',
+        'core.cli',
+        'core.content_generator',
+        'core.context_packer',
+        'core.dedup',
+        'core.gemini_client',
+        'core.job_store',
+        'core.metrics',
+        'core.naver_search',
+        'core.publish_pool',
+        'core.publisher',
+        'core.rate_limiter',
+        'core.response_cache',
+        'core.search_cache',
+        'core.title_generator',
+        'core.title_history',
         'core.tistory_manager',
         'tabs.title_generation_tab',
         'tabs.content_generation_tab',
         'tabs.blog_publish_tab',
+        'tabs.models',
         'utils.utils',
     ],
     hookspath=[],
@@ -236,6 +312,9 @@ def main():
     if not install_dependencies():
         return False
     
+    # 시작 시간 회귀는 경고만 표시 (--check-imports로 따로 확인 가능)
+    check_import_time()
+    
     # 3. Create spec file
     create_spec_file()
     
@@ -251,6 +330,8 @@ def main():
     return True
 
 if __name__ == "__main__":
+    if '--check-imports' in sys.argv[1:]:
+        sys.exit(0 if check_import_time() else 1)
     success = main()
     if not success:
         print("\nBuild failed")
@@ -0,0 +1,208 @@
+"""
+    글 파일/목록(manifest) 모듈
+
+    생성한 글은 앞머리(front matter)에 제목, 키워드, 모델, 토큰 수, 본문 해시를 적은 마크다운(.md)으로 저장하고,
+    폴더마다 manifest.jsonl에 한 줄씩 기록합니다. 발행 탭은 글 파일을 하나하나 열지 않고 manifest만 읽어
+    목록을 만들며, 예전 형식(.txt, "제목:" 머리말 + 구분선) 파일도 계속 읽을 수 있습니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+ARTICLE_EXTENSION = ".md"
+LEGACY_EXTENSION = ".txt"
+MANIFEST_FILE_NAME = "manifest.jsonl"
+FRONT_MATTER_DELIMITER = "---"
+LEGACY_RULE = "=" * 50
+
+# 앞머리에 적는 항목 순서
+FRONT_MATTER_KEYS = (
+    "title", "keyword", "model", "prompt_tokens", "output_tokens", "created", "content_sha256",
+)
+
+# 같은 파일의 이전 줄이 이만큼 쌓이면 manifest를 최신 항목만 남기고 다시 씀
+MANIFEST_COMPACT_MIN_STALE = 50
+
+_manifest_locks = {}
+_manifest_locks_lock = threading.Lock()
+
+
+def content_hash(content):
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def format_front_matter(meta):
+    """앞머리 문자열 (값은 JSON 표기라 YAML로도 읽을 수 있음)"""
+    lines = [FRONT_MATTER_DELIMITER]
+    for key in FRONT_MATTER_KEYS:
+        if key in meta:
+            lines.append(f"{key}: {json.dumps(meta[key], ensure_ascii=False)}")
+    lines.append(FRONT_MATTER_DELIMITER)
+    return "\n".join(lines) + "\n\n"
+
+
+def parse_front_matter(text):
+    """앞머리가 있으면 (메타데이터, 본문), 없으면 None"""
+    if not text.startswith(FRONT_MATTER_DELIMITER + "\n"):
+        return None
+    end = text.find(f"\n{FRONT_MATTER_DELIMITER}\n", len(FRONT_MATTER_DELIMITER))
+    if end == -1:
+        return None
+
+    meta = {}
+    for line in text[len(FRONT_MATTER_DELIMITER) + 1:end].splitlines():
+        key, separator, value = line.partition(":")
+        if not separator:
+            continue
+        value = value.strip()
+        try:
+            meta[key.strip()] = json.loads(value)
+        except ValueError:
+            # 직접 편집해 따옴표 없이 적은 값
+            meta[key.strip()] = value
+    return meta, text[end + len(FRONT_MATTER_DELIMITER) + 2:].lstrip("\n")
+
+
+def parse_legacy_header(text):
+    """예전 형식("제목:" 머리말 + 구분선)이면 (메타데이터, 본문), 아니면 None"""
+    if not text.startswith("제목:"):
+        return None
+    header, separator, body = text.partition(f"\n{LEGACY_RULE}\n")
+    if not separator:
+        return None
+    meta = {}
+    for line in header.splitlines():
+        if line.startswith("제목:"):
+            meta["title"] = line[len("제목:"):].strip()
+        elif line.startswith("생성일시:"):
+            meta["created"] = line[len("생성일시:"):].strip()
+    return meta, body.lstrip("\n")
+
+
+def parse_article(text):
+    """글 파일 내용에서 (메타데이터, 본문) 추출"""
+    return parse_front_matter(text) or parse_legacy_header(text) or ({}, text)
+
+
+def read_article(file_path):
+    """글 파일에서 (메타데이터, 본문) 읽기 (제목이 없으면 파일 이름을 제목으로 사용)"""
+    with open(file_path, "r", encoding="utf-8") as f:
+        meta, body = parse_article(f.read())
+    if not meta.get("title"):
+        meta["title"] = os.path.splitext(os.path.basename(file_path))[0]
+    return meta, body
+
+
+def format_article(meta, content):
+    return format_front_matter(meta) + content
+
+
+def fsync_directory(folder):
+    """이름 바꾸기(rename)가 디스크에 반영되도록 폴더 fsync (Windows처럼 지원하지 않으면 무시)"""
+    try:
+        fd = os.open(folder, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_file_atomic(file_path, text):
+    """임시 파일에 쓰고 fsync한 뒤 이름을 바꿔 저장 (중간에 실패해도 쓰다 만 파일이 남지 않음)"""
+    temp_path = f"{file_path}.tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    fsync_directory(os.path.dirname(os.path.abspath(file_path)))
+
+
+def get_manifest_lock(manifest_path):
+    with _manifest_locks_lock:
+        return _manifest_locks.setdefault(os.path.abspath(manifest_path), threading.Lock())
+
+
+def manifest_path_for(folder):
+    return os.path.join(folder, MANIFEST_FILE_NAME)
+
+
+def record_articles(articles):
+    """
+    (글 파일 경로, 앞머리 정보) 목록을 각 폴더의 manifest에 추가 (폴더마다 한 번에 기록)
+    같은 파일의 이전 항목은 읽을 때 무시됨
+    """
+    lines_by_folder = {}
+    for file_path, meta in articles:
+        folder = os.path.dirname(os.path.abspath(file_path))
+        entry = {"file": os.path.basename(file_path), **meta}
+        lines_by_folder.setdefault(folder, []).append(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    for folder, lines in lines_by_folder.items():
+        manifest_path = manifest_path_for(folder)
+        with get_manifest_lock(manifest_path):
+            with open(manifest_path, "a", encoding="utf-8") as f:
+                f.write("".join(lines))
+
+
+def record_article(file_path, meta):
+    """글 폴더의 manifest에 항목 하나 추가"""
+    record_articles([(file_path, meta)])
+
+
+def load_manifest(folder):
+    """manifest의 파일별 최신 항목 {파일 이름: 항목} (이전 항목이 많이 쌓였으면 정리)"""
+    manifest_path = manifest_path_for(folder)
+    entries = {}
+    line_count = 0
+    with get_manifest_lock(manifest_path):
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # 쓰다 만 줄
+                    line_count += 1
+                    if entry.get("file"):
+                        entries[entry["file"]] = entry
+        except FileNotFoundError:
+            return {}
+
+        if line_count - len(entries) >= max(MANIFEST_COMPACT_MIN_STALE, len(entries)):
+            temp_path = f"{manifest_path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                for entry in entries.values():
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            os.replace(temp_path, manifest_path)
+    return entries
+
+
+def list_articles(folder):
+    """
+    폴더의 글 목록 (각 항목에 "path" 포함, 파일 이름 순)
+    manifest에 있는 글은 기록된 메타데이터를, 없는 글(예전 .txt 등)은 파일 이름만 사용하며 글 파일은 열지 않음
+    """
+    manifest = load_manifest(folder)
+    articles = []
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            name = entry.name
+            if not entry.is_file() or not name.endswith((ARTICLE_EXTENSION, LEGACY_EXTENSION)):
+                continue
+            article = dict(manifest.get(name) or {"file": name, "title": os.path.splitext(name)[0]})
+            article["path"] = entry.path
+            articles.append(article)
+    articles.sort(key=lambda article: article["file"])
+    return articles
\ No newline at end of file
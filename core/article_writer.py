@@ -0,0 +1,155 @@
+"""
+    글 파일 백그라운드 저장 모듈
+
+    생성된 글을 쓰기 큐에 넣으면 별도 스레드가 모아서 저장합니다. 한 번에 모인 글은 모두 임시 파일에
+    쓴 뒤 fsync를 몰아서 하고 이름을 바꾸며(폴더 fsync도 폴더마다 한 번), manifest도 폴더마다 한 번에 기록합니다.
+    저장 결과는 글마다 콜백으로 알려 주며, 저장에 실패한 글은 데이터 폴더에 복구용 사본을 남깁니다.
+"""
+
+import os
+import queue
+import threading
+import time
+
+from core.article_store import fsync_directory, format_article, record_articles
+from core.content_generator import build_article_meta
+from utils.utils import get_data_dir
+
+# 한 번에 모아서 저장할 최대 글 수와 다음 글을 기다리는 시간 (초)
+MAX_BATCH_SIZE = 16
+BATCH_LINGER_SECONDS = 0.05
+
+RECOVERY_DIR_NAME = "unsaved"
+
+
+class ArticleWriteRequest:
+    """저장할 글 하나"""
+
+    def __init__(self, output_path, title, content, usage=None, on_done=None, discard_path=None):
+        self.output_path = output_path
+        self.title = title
+        self.content = content
+        self.usage = usage
+        self.on_done = on_done
+        self.discard_path = discard_path
+        self.meta = None
+        self.temp_path = None
+        self.file = None
+        self.error = ""
+
+
+class ArticleWriter:
+    """글 파일 쓰기 큐 (저장이 끝나면 on_done(앞머리 정보, 오류 메시지)를 쓰기 스레드에서 호출)"""
+
+    def __init__(self, max_batch_size=MAX_BATCH_SIZE, linger=BATCH_LINGER_SECONDS):
+        self.max_batch_size = max_batch_size
+        self.linger = linger
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name="article-writer", daemon=True)
+        self.thread.start()
+
+    def submit(self, output_path, title, content, usage=None, on_done=None, discard_path=None):
+        """저장 요청 추가 (바로 반환, discard_path는 저장에 성공하면 지울 임시 파일)"""
+        self.queue.put(ArticleWriteRequest(output_path, title, content, usage, on_done, discard_path))
+
+    def close(self, timeout=None):
+        """대기 중인 글을 모두 저장한 뒤 쓰기 스레드 종료"""
+        self.queue.put(None)
+        self.thread.join(timeout)
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            request = self.queue.get()
+            if request is None:
+                break
+            batch = [request]
+
+            # 잠시 더 기다려 함께 도착한 글을 한 번에 저장
+            deadline = time.monotonic() + self.linger
+            while len(batch) < self.max_batch_size:
+                try:
+                    request = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if request is None:
+                    stopping = True
+                    break
+                batch.append(request)
+
+            self._write_batch(batch)
+
+    def _write_batch(self, batch):
+        # 1. 임시 파일에 쓰기
+        for request in batch:
+            try:
+                request.meta = build_article_meta(request.title, request.content, request.usage)
+                request.temp_path = f"{request.output_path}.tmp"
+                request.file = open(request.temp_path, "w", encoding="utf-8")
+                request.file.write(format_article(request.meta, request.content))
+                request.file.flush()
+            except Exception as e:
+                self._fail(request, e)
+
+        # 2. fsync 후 이름 바꾸기
+        folders = set()
+        for request in batch:
+            if request.file is None:
+                continue
+            try:
+                os.fsync(request.file.fileno())
+                request.file.close()
+                request.file = None
+                os.replace(request.temp_path, request.output_path)
+                folders.add(os.path.dirname(os.path.abspath(request.output_path)))
+            except Exception as e:
+                self._fail(request, e)
+        for folder in folders:
+            fsync_directory(folder)
+
+        # 3. manifest 기록 후 결과 알림
+        saved = [request for request in batch if not request.error]
+        try:
+            record_articles([(request.output_path, request.meta) for request in saved])
+        except Exception as e:
+            # 글 파일은 저장되었으므로 manifest 오류는 로그만 남김 (목록에는 파일 이름으로 표시됨)
+            print(f"⚠️ manifest 기록 실패: {e}")
+
+        for request in saved:
+            if request.discard_path and os.path.exists(request.discard_path):
+                try:
+                    os.remove(request.discard_path)
+                except OSError:
+                    pass
+
+        for request in batch:
+            if request.on_done:
+                try:
+                    request.on_done(request.meta, request.error)
+                except Exception as e:
+                    print(f"⚠️ 저장 결과 처리 오류: {e}")
+
+    def _fail(self, request, error):
+        """저장 실패 처리 - 임시 파일을 지우고 데이터 폴더에 복구용 사본 저장"""
+        if request.file is not None:
+            try:
+                request.file.close()
+            except OSError:
+                pass
+            request.file = None
+        if request.temp_path and os.path.exists(request.temp_path):
+            try:
+                os.remove(request.temp_path)
+            except OSError:
+                pass
+
+        request.error = f"파일 저장 오류: {str(error)}"
+        try:
+            recovery_dir = os.path.join(get_data_dir(), RECOVERY_DIR_NAME)
+            os.makedirs(recovery_dir, exist_ok=True)
+            recovery_path = os.path.join(recovery_dir, os.path.basename(request.output_path))
+            with open(recovery_path, "w", encoding="utf-8") as f:
+                f.write(format_article(request.meta or {"title": request.title}, request.content))
+            request.error += f" (복구용 사본: {recovery_path})"
+        except Exception as e:
+            print(f"⚠️ 복구용 사본 저장 실패: {e}")
\ No newline at end of file
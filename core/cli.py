@@ -0,0 +1,316 @@
+"""
+    명령줄 실행 모듈
+
+    GUI 없이 검색, 제목 생성, 글 생성, 발행을 실행합니다. PyQt5를 불러오지 않으므로
+    화면이 없는 서버에서도 동작하며, 진행 상황과 결과는 한 줄에 JSON 하나씩(JSON Lines) 출력합니다.
+
+    python -m blog_generator search "키워드" --search-count 100
+    python -m blog_generator titles "키워드" --count 10
+    python -m blog_generator generate --titles-file titles.txt --prompt "..." --output-dir ./posts
+    python -m blog_generator publish --folder ./posts --start "2025-01-01 09:00"
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from utils.utils import get_env_int, load_env_file
+
+DEFAULT_CONCURRENCY = 3
+MAX_CONCURRENCY = 10
+
+_emit_lock = threading.Lock()
+# 다른 모듈의 print 로그는 stderr로 보내고 JSON 줄만 원래 stdout에 출력
+_output = sys.stdout
+
+
+def emit(event, **fields):
+    """진행 상황/결과 한 줄 출력"""
+    line = json.dumps({"event": event, "time": datetime.now().isoformat(timespec="seconds"), **fields},
+                      ensure_ascii=False)
+    with _emit_lock:
+        _output.write(line + "\n")
+        _output.flush()
+
+
+def progress(message):
+    emit("progress", message=message)
+
+
+def require_env(*keys):
+    """필수 환경변수 확인 (없으면 오류 출력 후 None)"""
+    values = [os.getenv(key, "").strip() for key in keys]
+    missing = [key for key, value in zip(keys, values) if not value]
+    if missing:
+        emit("error", message=f"환경변수가 설정되지 않았습니다: {', '.join(missing)}")
+        return None
+    return values
+
+
+def emit_metrics(since):
+    """since 이후 호출의 단계별 지표 요약 출력"""
+    from core.metrics import get_metrics
+
+    for (stage, operation), summary in sorted(get_metrics().summarize(since=since).items()):
+        emit("metrics", stage=stage, operation=operation, **summary)
+
+
+def read_lines(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def search_posts(args):
+    from core.dedup import collapse_near_duplicates
+    from core.naver_search import search_blog_posts
+
+    credentials = require_env("NAVER_CLIENT_ID", "NAVER_CLIENT_SECRET")
+    if credentials is None:
+        return None
+    blog_posts, cached_pages, total_pages = search_blog_posts(
+        args.keyword, *credentials, total_count=args.search_count, sort=args.sort,
+        force_refresh=args.refresh, on_progress=progress,
+    )
+    emit("searched", keyword=args.keyword, count=len(blog_posts), cached_pages=cached_pages, total_pages=total_pages)
+    if not args.no_dedup:
+        blog_posts = collapse_near_duplicates(blog_posts)
+    return blog_posts
+
+
+def run_search(args):
+    blog_posts = search_posts(args)
+    if blog_posts is None:
+        return 1
+    for post in blog_posts:
+        post.pop("duplicates", None)
+    emit("result", keyword=args.keyword, posts=blog_posts)
+    return 0
+
+
+def run_titles(args):
+    from core.title_generator import generate_titles
+    from core.title_history import SOURCE_GENERATED, get_title_history
+
+    credentials = require_env("GEMINI_API_KEY")
+    if credentials is None:
+        return 1
+    if args.posts:
+        with open(args.posts, "r", encoding="utf-8") as f:
+            blog_posts = json.load(f)
+    else:
+        blog_posts = search_posts(args)
+        if blog_posts is None:
+            return 1
+    if not blog_posts:
+        emit("error", message="제목 생성에 사용할 블로그 글이 없습니다.")
+        return 1
+
+    started_at = time.time()
+    titles, packed = generate_titles(
+        blog_posts, args.keyword, args.count, credentials[0], args.budget, on_wait=progress
+    )
+    emit_metrics(started_at)
+    emit("packed", used=packed["used"], truncated=packed["truncated"], dropped=packed["dropped"],
+         tokens=packed["tokens"])
+
+    history = get_title_history()
+    accepted = []
+    for title in titles:
+        similar = history.find_similar(title)
+        if similar and not args.allow_used:
+            emit("skipped", title=title, similar_to=similar["title"], similarity=round(similar["similarity"], 3))
+            continue
+        history.add(title, SOURCE_GENERATED, args.keyword)
+        accepted.append(title)
+    emit("result", keyword=args.keyword, titles=accepted)
+    return 0
+
+
+def run_generate(args):
+    from core.content_generator import build_output_path, generate_content, save_article, stream_content_to_file
+    from core.job_store import GenerationJobStore
+
+    credentials = require_env("GEMINI_API_KEY")
+    if credentials is None:
+        return 1
+    api_key = credentials[0]
+
+    store = GenerationJobStore()
+    store.recover_interrupted()
+    if args.resume:
+        jobs = store.get_unfinished_jobs()
+    else:
+        titles = list(args.title or [])
+        if args.titles_file:
+            titles.extend(read_lines(args.titles_file))
+        prompt = args.prompt or ""
+        if args.prompt_file:
+            with open(args.prompt_file, "r", encoding="utf-8") as f:
+                prompt = f.read().strip()
+        save_path = args.output_dir or os.getenv("DEFAULT_SAVE_PATH", "").strip()
+        if not titles or not prompt or not save_path:
+            emit("error", message="제목, 프롬프트, 저장 폴더(--output-dir 또는 DEFAULT_SAVE_PATH)가 필요합니다.")
+            store.close()
+            return 1
+        os.makedirs(save_path, exist_ok=True)
+        jobs = store.create_batch(titles, prompt, save_path)
+    if not jobs:
+        emit("result", generated=0, failed=0)
+        store.close()
+        return 0
+
+    used_paths = set()
+    lock = threading.Lock()
+    results = {"generated": 0, "failed": 0}
+
+    def run_job(job):
+        with lock:
+            output_path = build_output_path(job["title"], job["save_path"], used_paths)
+        store.mark_running(job["id"])
+        emit("started", job_id=job["id"], title=job["title"])
+        try:
+            if args.no_stream:
+                usage = {}
+                content = generate_content(job["title"], job["prompt"], api_key, on_wait=progress, usage=usage)
+                save_article(output_path, job["title"], content, usage)
+            else:
+                stream_content_to_file(
+                    job["title"], job["prompt"], api_key, output_path, lambda text: None, on_wait=progress
+                )
+            store.mark_done(job["id"], output_path)
+            with lock:
+                results["generated"] += 1
+            emit("completed", job_id=job["id"], title=job["title"], path=output_path)
+        except Exception as e:
+            store.mark_failed(job["id"], str(e))
+            with lock:
+                results["failed"] += 1
+            emit("failed", job_id=job["id"], title=job["title"], error=str(e))
+
+    concurrency = max(1, min(args.concurrency, MAX_CONCURRENCY))
+    started_at = time.time()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(run_job, jobs))
+    store.close()
+    emit_metrics(started_at)
+    emit("result", **results)
+    return 0 if results["failed"] == 0 else 2
+
+
+def run_publish(args):
+    from core.article_store import list_articles
+    from core.publish_pool import iter_publish_pooled
+    from core.tistory_manager import TistoryManager
+
+    files = list(args.files or [])
+    if args.folder:
+        files.extend(article["path"] for article in list_articles(args.folder))
+    if not files:
+        emit("error", message="발행할 파일이 없습니다.")
+        return 1
+
+    start = datetime.strptime(args.start, "%Y-%m-%d %H:%M") if args.start else datetime.now() + timedelta(minutes=5)
+    files_to_publish = [(path, start + timedelta(minutes=args.interval * i)) for i, path in enumerate(files)]
+
+    manager = TistoryManager()
+    if not manager.open_tistory_login():
+        emit("error", message="브라우저를 열 수 없습니다.")
+        return 1
+    emit("login", message="브라우저에서 티스토리 로그인을 완료한 뒤 Enter를 누르세요.")
+    sys.stdin.readline()
+
+    failed = 0
+    started_at = time.time()
+    try:
+        for file_path, success, message in iter_publish_pooled(
+            manager, files_to_publish, args.category, progress, sessions=args.sessions
+        ):
+            failed += 0 if success else 1
+            emit("completed" if success else "failed", path=file_path, message=message)
+    finally:
+        manager.close_driver()
+    emit_metrics(started_at)
+    emit("result", published=len(files) - failed, failed=failed)
+    return 0 if failed == 0 else 2
+
+
+def build_parser():
+    from core.context_packer import DEFAULT_TOKEN_BUDGET
+
+    parser = argparse.ArgumentParser(prog="blog_generator", description="블로그 글 자동 생성기 명령줄 실행")
+    parser.add_argument("--env", default=".env", help=".env 파일 경로 (기본값: .env)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_search_options(command):
+        command.add_argument("keyword", help="검색 키워드")
+        command.add_argument("--search-count", type=int, default=20, help="검색할 블로그 글 수 (최대 1000)")
+        command.add_argument("--sort", choices=["sim", "date"], default="sim", help="정렬 (정확도순/날짜순)")
+        command.add_argument("--refresh", action="store_true", help="검색 결과 캐시를 사용하지 않음")
+        command.add_argument("--no-dedup", action="store_true", help="유사 글을 묶지 않음")
+
+    search = commands.add_parser("search", help="네이버 블로그 검색")
+    add_search_options(search)
+    search.set_defaults(handler=run_search)
+
+    titles = commands.add_parser("titles", help="검색 결과로 제목 생성")
+    add_search_options(titles)
+    titles.add_argument("--count", type=int, default=5, help="생성할 제목 수")
+    titles.add_argument("--posts", help="검색 대신 사용할 블로그 글 JSON 파일 (search 결과의 posts)")
+    titles.add_argument("--budget", type=int,
+                        default=get_env_int("TITLE_CONTEXT_TOKENS", DEFAULT_TOKEN_BUDGET, minimum=500),
+                        help="프롬프트에 넣을 블로그 글 요약의 토큰 예산")
+    titles.add_argument("--allow-used", action="store_true", help="예전에 사용한 제목과 비슷해도 제외하지 않음")
+    titles.set_defaults(handler=run_titles)
+
+    generate = commands.add_parser("generate", help="제목으로 글 생성")
+    generate.add_argument("--title", action="append", help="생성할 제목 (여러 번 지정 가능)")
+    generate.add_argument("--titles-file", help="한 줄에 제목 하나씩 적은 파일")
+    generate.add_argument("--prompt", help="글 생성 프롬프트")
+    generate.add_argument("--prompt-file", help="글 생성 프롬프트 파일")
+    generate.add_argument("--output-dir", help="저장 폴더 (기본값: DEFAULT_SAVE_PATH)")
+    generate.add_argument("--concurrency", type=int,
+                          default=get_env_int("CONTENT_CONCURRENCY", DEFAULT_CONCURRENCY, minimum=1,
+                                              maximum=MAX_CONCURRENCY),
+                          help="동시에 생성할 글 수")
+    generate.add_argument("--no-stream", action="store_true", help="스트리밍 없이 한 번에 생성")
+    generate.add_argument("--resume", action="store_true", help="완료되지 않은 이전 작업 다시 생성")
+    generate.set_defaults(handler=run_generate)
+
+    publish = commands.add_parser("publish", help="티스토리 예약 발행")
+    publish.add_argument("files", nargs="*", help="발행할 글 파일")
+    publish.add_argument("--folder", help="발행할 글 폴더 (*.md, 예전 *.txt)")
+    publish.add_argument("--start", help='첫 글 예약 시간 "YYYY-MM-DD HH:MM" (기본값: 5분 후)')
+    publish.add_argument("--interval", type=int, default=5, help="글 사이 예약 간격 (분)")
+    publish.add_argument("--category", default="", help="카테고리")
+    publish.add_argument("--sessions", type=int, help="동시에 사용할 브라우저 수 (기본값: PUBLISH_SESSIONS 또는 1)")
+    publish.set_defaults(handler=run_publish)
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    # 기본값 일부가 환경변수를 읽으므로 인자 해석 전에 .env 로드
+    env_path = ".env"
+    for i, arg in enumerate(argv):
+        if arg == "--env" and i + 1 < len(argv):
+            env_path = argv[i + 1]
+        elif arg.startswith("--env="):
+            env_path = arg.split("=", 1)[1]
+    load_env_file(env_path)
+
+    args = build_parser().parse_args(argv)
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            return args.handler(args)
+    except KeyboardInterrupt:
+        emit("error", message="중단됨")
+        return 130
+    except Exception as e:
+        emit("error", message=str(e))
+        return 1
\ No newline at end of file
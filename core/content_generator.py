@@ -0,0 +1,116 @@
+"""
+    블로그 글 생성 모듈
+
+    제목과 프롬프트로 Gemini 글 본문을 생성하고 앞머리(front matter)가 있는 마크다운 파일로 저장합니다.
+    스트리밍 생성은 받은 조각을 임시 파일(.part)에 바로 이어 쓰고, 완료되면 최종 파일로 저장합니다.
+"""
+
+import os
+from datetime import datetime
+
+from core.article_store import (
+    ARTICLE_EXTENSION,
+    content_hash,
+    format_article,
+    format_front_matter,
+    record_article,
+    write_file_atomic,
+)
+from core.gemini_client import generate_text, generate_text_stream
+from core.title_history import get_title_history
+from utils.utils import sanitize_filename
+
+
+def build_content_prompt(title, prompt):
+    """글 생성용 전체 프롬프트 구성"""
+    return f"""
+                제목: {title}
+
+                {prompt}
+
+                위 제목으로 블로그 글을 작성해주세요.
+                
+                **응답 형식:**
+                - 본문만 마크다운 형식으로 작성해주세요 (##, ###, **강조**, - 목록 등 사용)
+                - 응답에 제목을 다시 포함하지 마세요
+                - 본문 내용만 바로 시작해주세요
+                
+                예시:
+                ## 블로그 운영의 기본 원칙
+                
+                블로그를 **성공적으로** 운영하기 위해서는 다음과 같은 요소들이 중요합니다:
+                
+                - 꾸준한 포스팅
+                - 독자와의 소통
+                - SEO 최적화
+            """
+
+
+def generate_content(title, prompt, api_key, on_wait=None, usage=None):
+    """Gemini로 블로그 글 본문 생성 (요청 한도 초과 시 여유가 생길 때까지 대기)"""
+    return generate_text(
+        api_key, build_content_prompt(title, prompt), on_wait=on_wait, operation="content", usage=usage
+    )
+
+
+def build_article_meta(title, content, usage=None):
+    """글 파일 앞머리 정보 (키워드는 제목 기록에서 찾음)"""
+    usage = usage or {}
+    return {
+        "title": title,
+        "keyword": get_title_history().find_keyword(title),
+        "model": usage.get("model", ""),
+        "prompt_tokens": usage.get("prompt_tokens"),
+        "output_tokens": usage.get("output_tokens"),
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "content_sha256": content_hash(content),
+    }
+
+
+def stream_content_to_file(title, prompt, api_key, output_path, on_chunk, on_wait=None, usage=None, finalize=True):
+    """
+    글을 스트리밍으로 생성하며 임시 파일(.part)에 바로 이어 쓰고, 완료되면 앞머리를 채운 최종 파일로 저장
+    중간에 실패해도 그때까지 받은 내용은 .part 파일에 남음
+    finalize=False면 최종 저장은 호출한 쪽에 맡기고 .part 파일을 그대로 둠 (백그라운드 저장용)
+    """
+    temp_path = f"{output_path}.part"
+    usage = {} if usage is None else usage
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(format_front_matter({"title": title}))
+
+        def write_chunk(text):
+            f.write(text)
+            f.flush()
+            on_chunk(text)
+
+        content = generate_text_stream(
+            api_key, build_content_prompt(title, prompt), write_chunk, on_wait=on_wait,
+            operation="content_stream", usage=usage,
+        )
+    # 토큰 수와 본문 해시는 생성이 끝나야 알 수 있으므로 앞머리를 채워 다시 저장
+    if finalize:
+        save_article(output_path, title, content, usage)
+        os.remove(temp_path)
+    return content
+
+
+def save_article(output_path, title, content, usage=None):
+    """앞머리와 본문을 마크다운 파일로 저장(임시 파일 + 이름 바꾸기)하고 폴더 manifest에 기록, 앞머리 정보 반환"""
+    meta = build_article_meta(title, content, usage)
+    write_file_atomic(output_path, format_article(meta, content))
+    record_article(output_path, meta)
+    return meta
+
+
+def build_output_path(title, save_path, used_paths):
+    """저장 파일 경로 생성 (같은 배치 안에서 겹치지 않도록)"""
+    safe_title = sanitize_filename(title)
+    base_name = f"{safe_title}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    full_path = os.path.join(save_path, f"{base_name}{ARTICLE_EXTENSION}")
+
+    suffix = 1
+    while full_path in used_paths or os.path.exists(full_path):
+        suffix += 1
+        full_path = os.path.join(save_path, f"{base_name}_{suffix}{ARTICLE_EXTENSION}")
+    used_paths.add(full_path)
+    return full_path
\ No newline at end of file
@@ -0,0 +1,129 @@
+"""
+    제목 생성용 컨텍스트 구성 모듈
+
+    선택한 블로그 글을 키워드와의 관련도 순으로 정렬한 뒤, 토큰 예산 안에 들어가도록
+    프롬프트에 넣을 내용을 구성합니다. 예산을 넘으면 글을 통째로 빼는 대신 긴 요약부터
+    문장/단어 경계에서 줄이고, 제목만으로도 넘칠 때만 관련도가 낮은 글을 제외합니다.
+"""
+
+import os
+
+from utils.utils import estimate_tokens
+
+DEFAULT_TOKEN_BUDGET = 4000
+MIN_DESCRIPTION_TOKENS = 15
+
+# 100만 토큰당 비용(USD, 환경변수 GEMINI_INPUT_PRICE_PER_M, GEMINI_OUTPUT_PRICE_PER_M으로 변경 가능)
+DEFAULT_INPUT_PRICE_PER_M = 0.10
+DEFAULT_OUTPUT_PRICE_PER_M = 0.40
+
+
+def keyword_bigrams(text):
+    """관련도 계산용 글자 2-gram 집합"""
+    text = "".join(text.lower().split())
+    return {text[i:i + 2] for i in range(len(text) - 1)} or ({text} if text else set())
+
+
+def relevance_score(post, keyword_grams, rank):
+    """키워드와 제목/요약의 글자 2-gram 겹침 정도 + 검색 순위 가중치"""
+    if not keyword_grams:
+        return 1.0 / (1 + rank)
+    title_overlap = len(keyword_grams & keyword_bigrams(post["title"])) / len(keyword_grams)
+    description_overlap = len(keyword_grams & keyword_bigrams(post["description"])) / len(keyword_grams)
+    return 2 * title_overlap + description_overlap + 0.5 / (1 + rank)
+
+
+def truncate_text(text, token_budget):
+    """토큰 예산에 맞춰 문장 또는 단어 경계에서 자르기"""
+    if estimate_tokens(text) <= token_budget:
+        return text
+    if token_budget <= 0:
+        return ""
+
+    # 이진 탐색으로 예산에 맞는 최대 길이 찾기
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if estimate_tokens(text[:middle]) + 1 <= token_budget:
+            low = middle
+        else:
+            high = middle - 1
+    cut = text[:low]
+
+    # 문장 경계가 충분히 뒤쪽에 있으면 문장 단위, 아니면 단어 단위로 자름
+    sentence_end = max(cut.rfind(mark) for mark in (". ", "? ", "! ", "다. ", "요. "))
+    if sentence_end >= len(cut) * 0.6:
+        return cut[:sentence_end + 1].rstrip()
+    word_end = cut.rfind(" ")
+    if word_end >= len(cut) * 0.6:
+        cut = cut[:word_end]
+    return cut.rstrip() + "…"
+
+
+def format_post(number, title, description):
+    return f"{number}. {title}\n{description}\n\n"
+
+
+def pack_posts(blog_posts, keyword="", token_budget=DEFAULT_TOKEN_BUDGET):
+    """
+    토큰 예산 안에서 프롬프트에 넣을 블로그 글 요약 구성
+    반환: {"text", "tokens", "used", "truncated", "dropped"}
+    """
+    keyword_grams = keyword_bigrams(keyword)
+    ranked = sorted(
+        enumerate(blog_posts),
+        key=lambda item: relevance_score(item[1], keyword_grams, item[0]),
+        reverse=True,
+    )
+    posts = [post for _, post in ranked]
+
+    # 제목(번호, 줄바꿈 포함)만으로도 예산을 넘으면 관련도가 낮은 글부터 제외
+    title_costs = [estimate_tokens(format_post(len(posts), post["title"], "")) for post in posts]
+    title_total = sum(title_costs)
+    while posts and title_total + len(posts) * MIN_DESCRIPTION_TOKENS > token_budget:
+        posts.pop()
+        title_total -= title_costs.pop()
+    dropped = len(blog_posts) - len(posts)
+
+    # 남은 예산을 요약에 배분 (짧은 요약이 남긴 몫은 긴 요약에 재분배)
+    description_costs = [estimate_tokens(post["description"]) for post in posts]
+    remaining = token_budget - title_total
+    allowances = [0] * len(posts)
+    pending = sorted(range(len(posts)), key=lambda i: description_costs[i])
+    while pending:
+        share = remaining // len(pending)
+        index = pending.pop(0)
+        allowances[index] = min(description_costs[index], share)
+        remaining -= allowances[index]
+
+    lines = []
+    truncated = 0
+    for number, (post, allowance) in enumerate(zip(posts, allowances), 1):
+        description = post["description"]
+        if allowance < estimate_tokens(description):
+            description = truncate_text(description, allowance)
+            truncated += 1
+        lines.append(format_post(number, post["title"], description))
+
+    text = "".join(lines)
+    return {
+        "text": text,
+        "tokens": estimate_tokens(text),
+        "used": len(posts),
+        "truncated": truncated,
+        "dropped": dropped,
+    }
+
+
+def get_price(key, default):
+    try:
+        return max(0.0, float(os.getenv(key, default)))
+    except ValueError:
+        return default
+
+
+def estimate_cost(input_tokens, output_tokens=0):
+    """예상 비용(USD)"""
+    input_price = get_price("GEMINI_INPUT_PRICE_PER_M", DEFAULT_INPUT_PRICE_PER_M)
+    output_price = get_price("GEMINI_OUTPUT_PRICE_PER_M", DEFAULT_OUTPUT_PRICE_PER_M)
+    return (input_tokens * input_price + output_tokens * output_price) / 1000000
\ No newline at end of file
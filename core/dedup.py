@@ -0,0 +1,120 @@
+"""
+    유사 글 검출 모듈
+
+    검색 결과의 제목 + 요약으로 SimHash를 계산하고, 해밍 거리가 가까운 글을 하나의 묶음으로 합칩니다.
+    64비트 해시를 4개 구간으로 나눠 구간이 하나라도 같은 글끼리만 비교하므로(밴딩)
+    결과가 많아도 모든 쌍을 비교하지 않습니다.
+"""
+
+import hashlib
+import re
+from functools import lru_cache
+
+SIMHASH_BITS = 64
+BAND_COUNT = 4
+BAND_BITS = SIMHASH_BITS // BAND_COUNT
+# 해밍 거리 3 이하면 유사 글로 판단 (구간 4개 중 최소 하나는 반드시 일치)
+DEFAULT_MAX_DISTANCE = 3
+
+_whitespace_re = re.compile(r"\s+")
+_symbol_re = re.compile(r"[^\w\s]")
+
+
+def normalize_text(text):
+    """비교용 텍스트 정규화 (기호 제거, 공백 정리, 소문자)"""
+    text = _symbol_re.sub(" ", text.lower())
+    return _whitespace_re.sub(" ", text).strip()
+
+
+def char_shingles(text, size=3):
+    """문자 n-gram 집합 (한글은 띄어쓰기가 일정하지 않아 단어 대신 글자 단위 사용)"""
+    text = normalize_text(text).replace(" ", "")[:4096]
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def stable_hash(value, digest_size=8):
+    """실행마다 바뀌지 않는 정수 해시"""
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=digest_size).digest(), "big")
+
+
+# 비트별 개수를 한 번의 정수 덧셈으로 세기 위해 각 비트를 16비트 칸으로 펼친 값
+# (바이트 값 -> 8개 비트를 각각 16비트 칸에 배치한 정수)
+LANE_BITS = 16
+_spread_byte = [
+    sum(((value >> bit) & 1) << (bit * LANE_BITS) for bit in range(8)) for value in range(256)
+]
+
+
+@lru_cache(maxsize=65536)
+def _spread_shingle(shingle):
+    """shingle 해시의 각 비트를 16비트 칸으로 펼친 정수"""
+    value = stable_hash(shingle)
+    spread = 0
+    for byte_index in range(SIMHASH_BITS // 8):
+        spread |= _spread_byte[(value >> (byte_index * 8)) & 0xFF] << (byte_index * 8 * LANE_BITS)
+    return spread
+
+
+def simhash(text):
+    """64비트 SimHash"""
+    shingles = char_shingles(text)
+    if not shingles:
+        return 0
+
+    # 칸마다 해당 비트가 1인 shingle 수가 누적됨
+    counts = sum(_spread_shingle(shingle) for shingle in shingles)
+    half = len(shingles) / 2
+    lane_mask = (1 << LANE_BITS) - 1
+
+    fingerprint = 0
+    for bit in range(SIMHASH_BITS):
+        if (counts >> (bit * LANE_BITS)) & lane_mask > half:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a, b):
+    return bin(a ^ b).count("1")
+
+
+def collapse_near_duplicates(blog_posts, max_distance=DEFAULT_MAX_DISTANCE):
+    """
+    유사 글을 묶어 묶음마다 가장 순위가 높은 글 하나만 남김
+    남은 글에는 묶음 크기(cluster_size)와 묶인 글 목록(duplicates)을 추가한 사본을 반환
+    """
+    fingerprints = [simhash(f"{post['title']} {post['description']}") for post in blog_posts]
+
+    parent = list(range(len(blog_posts)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    buckets = {}
+    mask = (1 << BAND_BITS) - 1
+    for i, fingerprint in enumerate(fingerprints):
+        for band in range(BAND_COUNT):
+            key = (band, fingerprint >> (band * BAND_BITS) & mask)
+            for j in buckets.get(key, ()):
+                root_i, root_j = find(i), find(j)
+                if root_i != root_j and hamming_distance(fingerprint, fingerprints[j]) <= max_distance:
+                    # 순위가 높은(앞쪽) 글이 대표가 되도록 작은 번호를 루트로 사용
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
+            buckets.setdefault(key, []).append(i)
+
+    clusters = {}
+    for i in range(len(blog_posts)):
+        clusters.setdefault(find(i), []).append(i)
+
+    collapsed = []
+    for root in sorted(clusters):
+        members = clusters[root]
+        representative = dict(blog_posts[root])
+        representative["cluster_size"] = len(members)
+        representative["duplicates"] = [blog_posts[i] for i in members if i != root]
+        collapsed.append(representative)
+    return collapsed
@@ -0,0 +1,180 @@
+"""
+    Gemini API 호출 모듈
+
+    모든 Gemini 요청은 이 모듈을 거치며, (API 키, 모델)별 공유 제한기로
+    RPM/TPM 한도를 지키고 429/503 응답을 재시도합니다.
+    응답 캐시가 켜져 있으면 같은 요청은 API 호출 없이 캐시에서 반환합니다.
+    요청마다 토큰 수, 예상 비용, 소요 시간, 재시도 횟수를 지표 저장소(core.metrics)에 기록합니다.
+"""
+
+import threading
+
+from core.context_packer import estimate_cost
+from core.metrics import OUTCOME_CACHED, STAGE_GEMINI, timed
+from core.rate_limiter import get_rate_limiter, call_with_rate_limit
+from core.response_cache import (
+    MODE_OFF,
+    MODE_ON,
+    MODE_REPLAY,
+    CacheMissError,
+    get_cache_mode,
+    get_response_cache,
+    make_cache_key,
+)
+from utils.utils import estimate_tokens
+
+GEMINI_MODEL = "gemini-2.0-flash-exp"
+
+def get_genai():
+    """google.generativeai 모듈 (불러오는 데 오래 걸리므로 첫 요청 때 import)"""
+    import google.generativeai as genai
+    return genai
+
+
+# genai.configure는 전역 설정이므로 여러 스레드에서 동시에 바꾸지 않도록 보호
+_configure_lock = threading.Lock()
+_configured_api_key = None
+
+
+def configure(api_key):
+    """API 키 설정 (키가 바뀐 경우에만 재설정)"""
+    global _configured_api_key
+    with _configure_lock:
+        if _configured_api_key != api_key:
+            get_genai().configure(api_key=api_key)
+            _configured_api_key = api_key
+
+
+def get_usage_tokens(response):
+    """응답의 실제 사용 토큰 수 (메타데이터가 없으면 None)"""
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return None
+    return getattr(usage, "total_token_count", None)
+
+
+def record_usage(call, response, prompt, text, usage=None):
+    """응답의 입력/출력 토큰 수와 예상 비용을 지표에, 토큰 수를 usage(dict)에 기록 (메타데이터가 없으면 추정값)"""
+    metadata = getattr(response, "usage_metadata", None)
+    prompt_tokens = getattr(metadata, "prompt_token_count", None)
+    output_tokens = getattr(metadata, "candidates_token_count", None)
+    if prompt_tokens is None or output_tokens is None:
+        prompt_tokens, output_tokens = estimate_tokens(prompt), estimate_tokens(text)
+        call.tokens_estimated = True
+    call.prompt_tokens = prompt_tokens
+    call.output_tokens = output_tokens
+    call.cost = estimate_cost(prompt_tokens, output_tokens)
+    if usage is not None:
+        usage.update(model=call.model, prompt_tokens=prompt_tokens, output_tokens=output_tokens)
+
+
+def store_cached_response(cache_key, text, model_name):
+    """응답 캐시에 저장 (캐시는 선택 기능이므로 저장에 실패해도 이미 받은 응답은 그대로 사용)"""
+    try:
+        get_response_cache().put(cache_key, text, model_name)
+    except OSError as e:
+        print(f"⚠️ 응답 캐시 저장 실패: {e}")
+
+
+def generate_text(
+    api_key, prompt, model_name=GEMINI_MODEL, generation_config=None, on_wait=None, operation="generate",
+    usage=None,
+):
+    """
+    한도 제한을 지키며 Gemini로 텍스트 생성 (캐시 모드에 따라 캐시 사용)
+    usage에 dict를 넘기면 모델 이름과 입력/출력 토큰 수를 채움
+    """
+    with timed(STAGE_GEMINI, operation, model_name) as call:
+        cache_mode = get_cache_mode()
+        cache_key = None
+        if cache_mode != MODE_OFF:
+            cache_key = make_cache_key(model_name, prompt, generation_config)
+            if cache_mode in (MODE_ON, MODE_REPLAY):
+                cached = get_response_cache().get(cache_key)
+                if cached is not None:
+                    call.outcome = OUTCOME_CACHED
+                    if usage is not None:
+                        usage["model"] = model_name
+                    return cached
+            if cache_mode == MODE_REPLAY:
+                raise CacheMissError("재생 모드: 캐시에 저장되지 않은 요청입니다.")
+
+        configure(api_key)
+        model = get_genai().GenerativeModel(model_name, generation_config=generation_config)
+        limiter = get_rate_limiter(api_key, model_name)
+
+        # 응답 토큰은 알 수 없으므로 입력 토큰의 두 배로 추정
+        estimated_tokens = estimate_tokens(prompt) * 2
+        response = call_with_rate_limit(
+            limiter,
+            lambda: model.generate_content(prompt),
+            estimated_tokens=estimated_tokens,
+            on_wait=on_wait,
+            call=call,
+        )
+        limiter.record_usage(estimated_tokens, get_usage_tokens(response))
+        text = response.text
+        record_usage(call, response, prompt, text, usage)
+
+        if cache_key is not None:
+            store_cached_response(cache_key, text, model_name)
+        return text
+
+
+def generate_text_stream(
+    api_key, prompt, on_chunk, model_name=GEMINI_MODEL, generation_config=None, on_wait=None, operation="stream",
+    usage=None,
+):
+    """
+    스트리밍으로 텍스트 생성, 조각이 도착할 때마다 on_chunk(텍스트) 호출 후 전체 텍스트 반환
+    첫 조각을 받기 전의 429/503 오류만 재시도 (이미 전달된 조각이 중복되지 않도록)
+    usage에 dict를 넘기면 모델 이름과 입력/출력 토큰 수를 채움
+    """
+    with timed(STAGE_GEMINI, operation, model_name) as call:
+        cache_mode = get_cache_mode()
+        cache_key = None
+        if cache_mode != MODE_OFF:
+            cache_key = make_cache_key(model_name, prompt, generation_config)
+            if cache_mode in (MODE_ON, MODE_REPLAY):
+                cached = get_response_cache().get(cache_key)
+                if cached is not None:
+                    call.outcome = OUTCOME_CACHED
+                    if usage is not None:
+                        usage["model"] = model_name
+                    on_chunk(cached)
+                    return cached
+            if cache_mode == MODE_REPLAY:
+                raise CacheMissError("재생 모드: 캐시에 저장되지 않은 요청입니다.")
+
+        configure(api_key)
+        model = get_genai().GenerativeModel(model_name, generation_config=generation_config)
+        limiter = get_rate_limiter(api_key, model_name)
+
+        estimated_tokens = estimate_tokens(prompt) * 2
+        chunks = []
+
+        def start_stream():
+            response = model.generate_content(prompt, stream=True)
+            iterator = iter(response)
+            # 첫 조각까지 받아야 요청 성공 여부를 알 수 있음
+            first_chunk = next(iterator, None)
+            return response, iterator, first_chunk
+
+        response, iterator, first_chunk = call_with_rate_limit(
+            limiter, start_stream, estimated_tokens=estimated_tokens, on_wait=on_wait, call=call
+        )
+
+        if first_chunk is not None:
+            chunks.append(first_chunk.text)
+            on_chunk(first_chunk.text)
+            for chunk in iterator:
+                chunks.append(chunk.text)
+                on_chunk(chunk.text)
+
+        limiter.record_usage(estimated_tokens, get_usage_tokens(response))
+        text = "".join(chunks)
+        record_usage(call, response, prompt, text, usage)
+
+        if cache_key is not None:
+            store_cached_response(cache_key, text, model_name)
+        return text
\ No newline at end of file
@@ -0,0 +1,147 @@
+"""
+    글 생성 작업 큐 저장소
+
+    일괄 글 생성 작업을 SQLite에 기록하여 프로그램이 비정상 종료되어도
+    완료되지 않은 제목만 이어서 생성할 수 있도록 합니다.
+    작업 상태: pending(대기) / running(생성 중) / done(완료) / failed(실패) / save_failed(생성 후 저장 실패)
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+from utils.utils import get_data_dir
+
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+STATUS_SAVE_FAILED = "save_failed"
+
+UNFINISHED_STATUSES = (STATUS_PENDING, STATUS_RUNNING, STATUS_FAILED, STATUS_SAVE_FAILED)
+
+
+def _now():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+class GenerationJobStore:
+    """SQLite 기반 글 생성 작업 저장소"""
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or os.path.join(get_data_dir(), "jobs.sqlite3")
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._create_tables()
+
+    def _create_tables(self):
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS batches (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    prompt TEXT NOT NULL,
+                    save_path TEXT NOT NULL,
+                    created_at TEXT NOT NULL
+                )
+                """
+            )
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    batch_id INTEGER NOT NULL REFERENCES batches(id),
+                    position INTEGER NOT NULL,
+                    title TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    output_path TEXT,
+                    error TEXT,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    updated_at TEXT NOT NULL
+                )
+                """
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)")
+
+    def create_batch(self, titles, prompt, save_path):
+        """새 일괄 작업 등록 후 작업 목록 반환"""
+        with self.lock, self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO batches (prompt, save_path, created_at) VALUES (?, ?, ?)",
+                (prompt, save_path, _now()),
+            )
+            batch_id = cursor.lastrowid
+            self.conn.executemany(
+                "INSERT INTO jobs (batch_id, position, title, status, updated_at) VALUES (?, ?, ?, ?, ?)",
+                [(batch_id, i, title, STATUS_PENDING, _now()) for i, title in enumerate(titles)],
+            )
+        return self.get_jobs(batch_id=batch_id)
+
+    def get_jobs(self, batch_id=None, statuses=None):
+        """작업 목록 조회 (일괄 작업 생성 순서, 제목 순서대로)"""
+        query = """
+            SELECT jobs.id, jobs.batch_id, jobs.title, jobs.status, jobs.output_path,
+                   jobs.error, jobs.attempts, batches.prompt, batches.save_path
+            FROM jobs JOIN batches ON jobs.batch_id = batches.id
+        """
+        conditions = []
+        params = []
+        if batch_id is not None:
+            conditions.append("jobs.batch_id = ?")
+            params.append(batch_id)
+        if statuses:
+            conditions.append(f"jobs.status IN ({', '.join('?' for _ in statuses)})")
+            params.extend(statuses)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY jobs.batch_id, jobs.position"
+
+        with self.lock:
+            return [dict(row) for row in self.conn.execute(query, params)]
+
+    def get_unfinished_jobs(self):
+        """완료되지 않은(대기/생성 중/실패) 작업 목록"""
+        return self.get_jobs(statuses=UNFINISHED_STATUSES)
+
+    def recover_interrupted(self):
+        """비정상 종료로 생성 중 상태에 남은 작업을 대기 상태로 되돌림"""
+        with self.lock, self.conn:
+            cursor = self.conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE status = ?",
+                (STATUS_PENDING, _now(), STATUS_RUNNING),
+            )
+            return cursor.rowcount
+
+    def mark_running(self, job_id):
+        self._update(job_id, "status = ?, attempts = attempts + 1", (STATUS_RUNNING,))
+
+    def mark_done(self, job_id, output_path):
+        self._update(job_id, "status = ?, output_path = ?, error = NULL", (STATUS_DONE, output_path))
+
+    def mark_failed(self, job_id, error):
+        self._update(job_id, "status = ?, error = ?", (STATUS_FAILED, error))
+
+    def mark_save_failed(self, job_id, error):
+        self._update(job_id, "status = ?, error = ?", (STATUS_SAVE_FAILED, error))
+
+    def discard_unfinished(self):
+        """완료되지 않은 작업을 모두 삭제"""
+        with self.lock, self.conn:
+            self.conn.execute(
+                f"DELETE FROM jobs WHERE status IN ({', '.join('?' for _ in UNFINISHED_STATUSES)})",
+                UNFINISHED_STATUSES,
+            )
+
+    def _update(self, job_id, assignments, params):
+        with self.lock, self.conn:
+            self.conn.execute(
+                f"UPDATE jobs SET {assignments}, updated_at = ? WHERE id = ?",
+                (*params, _now(), job_id),
+            )
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
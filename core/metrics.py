@@ -0,0 +1,354 @@
+"""
+    호출 지표 수집 모듈
+
+    네이버 검색, Gemini 생성, 티스토리 발행 단계의 호출마다 모델, 입력/출력 토큰 수, 예상 비용, 소요 시간,
+    재시도 횟수, 결과를 기록합니다. 최근 기록은 메모리에 두고 JSONL 파일에 한 줄씩 추가하며,
+    node exporter의 textfile collector가 읽을 수 있도록 Prometheus 텍스트 형식 파일을 주기적으로 갱신합니다.
+"""
+
+import atexit
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from utils.utils import get_data_dir
+
+STAGE_NAVER = "naver"
+STAGE_GEMINI = "gemini"
+STAGE_TISTORY = "tistory"
+
+OUTCOME_OK = "ok"
+OUTCOME_FAILED = "failed"
+OUTCOME_ERROR = "error"
+OUTCOME_CACHED = "cached"
+
+# 요약(p50/p95)에 사용할 최근 호출 기록 수
+MAX_RECENT_CALLS = 10000
+# Prometheus 분위수 계산에 사용할 (단계, 작업)별 최근 소요 시간 수
+MAX_LATENCY_SAMPLES = 1000
+# Prometheus 파일 갱신 최소 간격 (초)
+PROMETHEUS_WRITE_INTERVAL = 5.0
+QUANTILES = (0.5, 0.95)
+
+METRICS_FILE_NAME = "metrics.jsonl"
+PROMETHEUS_FILE_NAME = "blog_generator.prom"
+
+
+class CallRecord:
+    """호출 한 번의 지표 (timed() 안에서 토큰 수 등을 채움)"""
+
+    def __init__(self, stage, operation, model=""):
+        self.stage = stage
+        self.operation = operation
+        self.model = model
+        self.prompt_tokens = None
+        self.output_tokens = None
+        self.tokens_estimated = False
+        # 토큰 수로 계산한 예상 비용 (USD, 유료 호출만)
+        self.cost = None
+        self.retries = 0
+        self.wait = 0.0
+        self.outcome = OUTCOME_OK
+        self.error = ""
+        self.started_at = time.time()
+        self.latency = 0.0
+
+    def fail(self, error=""):
+        """예외 없이 실패한 호출로 표시"""
+        self.outcome = OUTCOME_FAILED
+        self.error = error
+
+    def to_dict(self):
+        return {
+            "time": round(self.started_at, 3),
+            "stage": self.stage,
+            "operation": self.operation,
+            "model": self.model,
+            "prompt_tokens": self.prompt_tokens,
+            "output_tokens": self.output_tokens,
+            "tokens_estimated": self.tokens_estimated,
+            "cost_usd": None if self.cost is None else round(self.cost, 6),
+            "latency": round(self.latency, 4),
+            "wait": round(self.wait, 4),
+            "retries": self.retries,
+            "outcome": self.outcome,
+            "error": self.error,
+        }
+
+
+def percentile(values, fraction):
+    """정렬된 값 목록의 분위수 (nearest-rank)"""
+    if not values:
+        return 0.0
+    index = max(0, min(len(values) - 1, math.ceil(fraction * len(values)) - 1))
+    return values[index]
+
+
+def escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(**labels):
+    return "{" + ",".join(f'{key}="{escape_label(value)}"' for key, value in labels.items()) + "}"
+
+
+def resolve_metrics_dir(metrics_dir):
+    """
+    지표 파일 폴더 생성 후 반환
+    만들 수 없으면 데이터 폴더를, 그것도 안 되면 None(파일 기록 안 함)을 반환
+    """
+    for candidate in (metrics_dir, None):
+        try:
+            folder = candidate or get_data_dir()
+            os.makedirs(folder, exist_ok=True)
+            return folder
+        except Exception as e:
+            print(f"⚠️ 지표 폴더를 만들 수 없습니다 ({candidate or '데이터 폴더'}): {e}")
+    return None
+
+
+class MetricsRegistry:
+    """프로세스 전역 호출 지표 저장소"""
+
+    def __init__(self, metrics_dir=None):
+        self.metrics_dir = resolve_metrics_dir(metrics_dir or os.getenv("METRICS_DIR", "").strip())
+        # 저장할 폴더가 없으면 파일 기록 없이 메모리 요약만 사용 (지표 오류로 API 호출이 실패하지 않도록)
+        self.jsonl_path = os.path.join(self.metrics_dir, METRICS_FILE_NAME) if self.metrics_dir else None
+        self.prometheus_path = os.path.join(self.metrics_dir, PROMETHEUS_FILE_NAME) if self.metrics_dir else None
+        self.lock = threading.Lock()
+        self.recent = deque(maxlen=MAX_RECENT_CALLS)
+        # (단계, 작업, 결과) -> [호출 수, 소요 시간 합, 재시도 수]
+        self.counters = {}
+        # (단계, 작업, 모델) -> [입력 토큰, 출력 토큰]
+        self.tokens = {}
+        # (단계, 작업, 모델) -> 예상 비용 합계 (USD)
+        self.costs = {}
+        # 단계 -> 예상 비용 합계 (USD)
+        self.stage_costs = {}
+        # (단계, 작업) -> 최근 소요 시간
+        self.latencies = {}
+        self.last_prometheus_write = 0.0
+        self.dirty = False
+
+    @contextmanager
+    def timed(self, stage, operation, model=""):
+        """with 블록의 소요 시간과 결과를 기록 (예외는 오류로 기록 후 다시 발생)"""
+        call = CallRecord(stage, operation, model)
+        started = time.monotonic()
+        try:
+            yield call
+        except BaseException as e:
+            call.outcome = OUTCOME_ERROR
+            call.error = f"{type(e).__name__}: {str(e)}"[:300]
+            raise
+        finally:
+            call.latency = time.monotonic() - started
+            try:
+                self.record(call)
+            except Exception as e:
+                print(f"⚠️ 지표 기록 오류: {e}")
+
+    def record(self, call):
+        """호출 기록 추가 (JSONL 줄에는 그 시점까지의 단계별 비용 합계도 기록)"""
+        with self.lock:
+            self.recent.append(call)
+            counter = self.counters.setdefault((call.stage, call.operation, call.outcome), [0, 0.0, 0])
+            counter[0] += 1
+            counter[1] += call.latency
+            counter[2] += call.retries
+            if call.prompt_tokens is not None or call.output_tokens is not None:
+                tokens = self.tokens.setdefault((call.stage, call.operation, call.model), [0, 0])
+                tokens[0] += call.prompt_tokens or 0
+                tokens[1] += call.output_tokens or 0
+            if call.cost is not None:
+                cost_key = (call.stage, call.operation, call.model)
+                self.costs[cost_key] = self.costs.get(cost_key, 0.0) + call.cost
+                self.stage_costs[call.stage] = self.stage_costs.get(call.stage, 0.0) + call.cost
+            if call.outcome != OUTCOME_CACHED:
+                self.latencies.setdefault(
+                    (call.stage, call.operation), deque(maxlen=MAX_LATENCY_SAMPLES)
+                ).append(call.latency)
+            self.dirty = True
+
+            if self.jsonl_path is None:
+                return
+            entry = call.to_dict()
+            entry["stage_cost_usd_total"] = round(self.stage_costs.get(call.stage, 0.0), 6)
+            line = json.dumps(entry, ensure_ascii=False)
+            try:
+                with open(self.jsonl_path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+            except OSError as e:
+                print(f"⚠️ 지표 기록 실패: {e}")
+
+            if time.monotonic() - self.last_prometheus_write >= PROMETHEUS_WRITE_INTERVAL:
+                self._write_prometheus()
+
+    def summarize(self, since=None, stage=None):
+        """
+        (단계, 작업)별 요약 {"count", "failed", "cached", "p50", "p95", "prompt_tokens", "output_tokens", "cost", "retries"}
+        since(time.time() 기준)를 지정하면 그 이후 호출만 집계하며, 캐시 응답은 소요 시간 분위수에서 제외
+        """
+        with self.lock:
+            calls = [
+                call for call in self.recent
+                if (since is None or call.started_at >= since) and (stage is None or call.stage == stage)
+            ]
+
+        groups = {}
+        for call in calls:
+            group = groups.setdefault((call.stage, call.operation), {
+                "count": 0, "failed": 0, "cached": 0, "latencies": [],
+                "prompt_tokens": 0, "output_tokens": 0, "cost": 0.0, "retries": 0,
+            })
+            group["count"] += 1
+            group["retries"] += call.retries
+            group["prompt_tokens"] += call.prompt_tokens or 0
+            group["output_tokens"] += call.output_tokens or 0
+            group["cost"] += call.cost or 0.0
+            if call.outcome == OUTCOME_CACHED:
+                group["cached"] += 1
+                continue
+            if call.outcome != OUTCOME_OK:
+                group["failed"] += 1
+            group["latencies"].append(call.latency)
+
+        for group in groups.values():
+            latencies = sorted(group.pop("latencies"))
+            group["p50"] = percentile(latencies, 0.5)
+            group["p95"] = percentile(latencies, 0.95)
+        return groups
+
+    def prometheus_text(self):
+        """Prometheus 텍스트 형식 스냅숏"""
+        with self.lock:
+            return self._prometheus_text()
+
+    def _prometheus_text(self):
+        lines = [
+            "# HELP blog_generator_calls_total Calls per stage, operation and outcome.",
+            "# TYPE blog_generator_calls_total counter",
+        ]
+        for (stage, operation, outcome), (count, _, _) in sorted(self.counters.items()):
+            lines.append(
+                f"blog_generator_calls_total{format_labels(stage=stage, operation=operation, outcome=outcome)} {count}"
+            )
+
+        lines += [
+            "# HELP blog_generator_call_retries_total Retries after rate-limit or unavailable responses.",
+            "# TYPE blog_generator_call_retries_total counter",
+        ]
+        retries = {}
+        for (stage, operation, _), (_, _, retry_count) in self.counters.items():
+            retries[(stage, operation)] = retries.get((stage, operation), 0) + retry_count
+        for (stage, operation), retry_count in sorted(retries.items()):
+            lines.append(
+                f"blog_generator_call_retries_total{format_labels(stage=stage, operation=operation)} {retry_count}"
+            )
+
+        lines += [
+            "# HELP blog_generator_tokens_total Prompt and output tokens reported by the model.",
+            "# TYPE blog_generator_tokens_total counter",
+        ]
+        for (stage, operation, model), (prompt_tokens, output_tokens) in sorted(self.tokens.items()):
+            for kind, value in (("prompt", prompt_tokens), ("output", output_tokens)):
+                labels = format_labels(stage=stage, operation=operation, model=model, kind=kind)
+                lines.append(f"blog_generator_tokens_total{labels} {value}")
+
+        lines += [
+            "# HELP blog_generator_cost_usd_total Estimated cost from prompt and output tokens.",
+            "# TYPE blog_generator_cost_usd_total counter",
+        ]
+        for (stage, operation, model), cost in sorted(self.costs.items()):
+            labels = format_labels(stage=stage, operation=operation, model=model)
+            lines.append(f"blog_generator_cost_usd_total{labels} {cost:.6f}")
+
+        lines += [
+            "# HELP blog_generator_call_latency_seconds Call latency including rate-limit waits and retries.",
+            "# TYPE blog_generator_call_latency_seconds summary",
+        ]
+        totals = {}
+        for (stage, operation, outcome), (count, latency_sum, _) in self.counters.items():
+            if outcome == OUTCOME_CACHED:
+                continue
+            total = totals.setdefault((stage, operation), [0, 0.0])
+            total[0] += count
+            total[1] += latency_sum
+        for (stage, operation), (count, latency_sum) in sorted(totals.items()):
+            samples = sorted(self.latencies.get((stage, operation), ()))
+            for quantile in QUANTILES:
+                labels = format_labels(stage=stage, operation=operation, quantile=quantile)
+                lines.append(f"blog_generator_call_latency_seconds{labels} {percentile(samples, quantile):.6f}")
+            labels = format_labels(stage=stage, operation=operation)
+            lines.append(f"blog_generator_call_latency_seconds_sum{labels} {latency_sum:.6f}")
+            lines.append(f"blog_generator_call_latency_seconds_count{labels} {count}")
+        return "\n".join(lines) + "\n"
+
+    def _write_prometheus(self):
+        """textfile collector가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체"""
+        temp_path = f"{self.prometheus_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(self._prometheus_text())
+            os.replace(temp_path, self.prometheus_path)
+            self.dirty = False
+        except OSError as e:
+            print(f"⚠️ Prometheus 지표 파일 저장 실패: {e}")
+        self.last_prometheus_write = time.monotonic()
+
+    def flush(self):
+        """기록이 남아 있으면 Prometheus 파일 바로 갱신"""
+        with self.lock:
+            if self.dirty and self.prometheus_path:
+                self._write_prometheus()
+
+
+def format_summary(summary):
+    """요약을 완료 메시지용 여러 줄 텍스트로 변환 (비용이 있으면 단계별 합계 줄 추가)"""
+    lines = []
+    stage_costs = {}
+    for (stage, operation), group in sorted(summary.items()):
+        line = f"{stage}/{operation}: {group['count']}회"
+        details = []
+        if group["failed"]:
+            details.append(f"실패 {group['failed']}")
+        if group["cached"]:
+            details.append(f"캐시 {group['cached']}")
+        if group["retries"]:
+            details.append(f"재시도 {group['retries']}")
+        if details:
+            line += f" ({', '.join(details)})"
+        if group["count"] > group["cached"]:
+            line += f" · p50 {group['p50']:.1f}초 · p95 {group['p95']:.1f}초"
+        if group["prompt_tokens"] or group["output_tokens"]:
+            line += f" · 토큰 입력 {group['prompt_tokens']:,} / 출력 {group['output_tokens']:,}"
+        if group["cost"]:
+            line += f" · 비용 약 ${group['cost']:.4f}"
+            stage_costs[stage] = stage_costs.get(stage, 0.0) + group["cost"]
+        lines.append(line)
+    for stage, cost in sorted(stage_costs.items()):
+        lines.append(f"{stage} 예상 비용 합계: 약 ${cost:.4f}")
+    return "\n".join(lines)
+
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics():
+    """프로세스 전역 지표 저장소 반환"""
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = MetricsRegistry()
+            atexit.register(_metrics.flush)
+        return _metrics
+
+
+def timed(stage, operation, model=""):
+    """get_metrics().timed 단축 함수"""
+    return get_metrics().timed(stage, operation, model)
\ No newline at end of file
@@ -0,0 +1,303 @@
+"""
+    네이버 블로그 검색 모듈
+
+    네이버 검색 API는 한 번에 최대 100개(display), 시작 위치(start) 최대 1000까지 지원합니다.
+    요청한 개수만큼 페이지를 나누어 keep-alive 세션으로 동시에 가져온 뒤 순위 순서대로 합칩니다.
+    가져온 페이지는 검색 결과 캐시에 저장하여 같은 검색을 반복할 때 API 호출 없이 반환합니다.
+    실제 API 호출은 초당/일일 호출 한도 제한기를 거치며, 일일 사용량은 재시작 후에도 유지됩니다.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
+from datetime import date
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from core.metrics import STAGE_NAVER, timed
+from core.search_cache import get_search_cache
+from utils.utils import get_data_dir, get_env_int
+
+NAVER_BLOG_SEARCH_URL = "https://openapi.naver.com/v1/search/blog"
+
+MAX_DISPLAY = 100
+MAX_START = 1000
+MAX_RESULTS = 1000
+MAX_PAGE_WORKERS = 4
+REQUEST_TIMEOUT = 10
+MAX_KEYWORD_WORKERS = 4
+
+# 네이버 검색 API 호출 한도 (환경변수 NAVER_RPS, NAVER_DAILY_LIMIT으로 변경 가능)
+DEFAULT_RPS = 10
+DEFAULT_DAILY_LIMIT = 25000
+# 일일 사용량 파일 저장 간격 (초, 호출 수) - 비정상 종료 시 이만큼의 사용량이 누락될 수 있음
+QUOTA_SAVE_INTERVAL = 5.0
+QUOTA_SAVE_EVERY_CALLS = 20
+
+
+class NaverSearchError(Exception):
+    """네이버 API 오류 응답"""
+
+    def __init__(self, status_code, message=""):
+        super().__init__(message or f"네이버 API 오류: {status_code}")
+        self.status_code = status_code
+
+
+class NaverQuotaExceeded(NaverSearchError):
+    """일일 호출 한도 초과"""
+
+    def __init__(self, limit):
+        super().__init__(429, f"네이버 API 일일 호출 한도({limit}회)를 모두 사용했습니다.")
+
+
+class NaverQuotaLimiter:
+    """초당 호출 수와 일일 호출 수 제한기 (일일 사용량은 파일에 저장)"""
+
+    def __init__(self, state_path=None, rps=None, daily_limit=None):
+        self.state_path = state_path or os.path.join(get_data_dir(), "naver_quota.json")
+        self.rps = rps or get_env_int("NAVER_RPS", DEFAULT_RPS, minimum=1)
+        self.daily_limit = daily_limit or get_env_int("NAVER_DAILY_LIMIT", DEFAULT_DAILY_LIMIT, minimum=1)
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()
+        self.next_slot = 0.0
+        self.day, self.used = self._load()
+        self.saved_state = (self.day, self.used)
+        self.last_save = 0.0
+
+    def _load(self):
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("date") == date.today().isoformat():
+                return state["date"], int(state.get("used", 0))
+        except (OSError, ValueError, KeyError):
+            pass
+        return date.today().isoformat(), 0
+
+    def _save(self):
+        """현재 사용량 저장 (파일 쓰기는 제한기 잠금 밖에서 하며, 늦게 끝난 저장이 최신 값을 덮지 않도록 다시 읽어 씀)"""
+        with self.save_lock:
+            with self.lock:
+                state = (self.day, self.used)
+                if state == self.saved_state:
+                    return
+                self.last_save = time.monotonic()
+            temp_path = f"{self.state_path}.tmp"
+            try:
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump({"date": state[0], "used": state[1]}, f)
+                os.replace(temp_path, self.state_path)
+            except OSError as e:
+                print(f"⚠️ 네이버 API 사용량 저장 실패: {e}")
+                return
+            with self.lock:
+                self.saved_state = state
+
+    def flush(self):
+        """저장하지 않은 사용량이 있으면 바로 저장"""
+        self._save()
+
+    def acquire(self):
+        """호출 한 번을 예약하고 초당 한도에 맞춰 대기 (일일 한도를 넘으면 NaverQuotaExceeded)"""
+        with self.lock:
+            today = date.today().isoformat()
+            if today != self.day:
+                self.day, self.used = today, 0
+            if self.used >= self.daily_limit:
+                raise NaverQuotaExceeded(self.daily_limit)
+            self.used += 1
+
+            # 호출 간격을 1/rps 초로 유지하도록 다음 호출 시각 예약
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + 1.0 / self.rps
+
+            # 사용량은 호출마다 쓰지 않고 일정 간격/호출 수마다 저장 (종료할 때도 저장)
+            should_save = (
+                self.saved_state[0] != self.day
+                or self.used - self.saved_state[1] >= QUOTA_SAVE_EVERY_CALLS
+                or now - self.last_save >= QUOTA_SAVE_INTERVAL
+                or self.used >= self.daily_limit
+            )
+        if should_save:
+            self._save()
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def remaining(self):
+        """오늘 남은 호출 수"""
+        with self.lock:
+            if date.today().isoformat() != self.day:
+                return self.daily_limit
+            return max(0, self.daily_limit - self.used)
+
+
+_session = None
+_session_lock = threading.Lock()
+_quota_limiter = None
+
+
+def get_session():
+    """연결을 재사용하는 공유 세션 반환"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            # 일괄 검색은 키워드 작업마다 페이지 작업을 동시에 실행하므로 최대 동시 요청 수만큼 연결 유지
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_KEYWORD_WORKERS * MAX_PAGE_WORKERS)
+            _session.mount("https://", adapter)
+        return _session
+
+
+def get_quota_limiter():
+    """프로세스 전역 호출 한도 제한기 반환"""
+    global _quota_limiter
+    with _session_lock:
+        if _quota_limiter is None:
+            _quota_limiter = NaverQuotaLimiter()
+            atexit.register(_quota_limiter.flush)
+        return _quota_limiter
+
+
+def clean_text(text):
+    """검색 결과의 강조 태그 제거"""
+    return text.replace("<b>", "").replace("</b>", "")
+
+
+def parse_items(data):
+    """API 응답을 블로그 글 목록으로 변환"""
+    blog_posts = []
+    for item in data.get("items", []):
+        blog_posts.append(
+            {
+                "title": clean_text(item.get("title", "")),
+                "description": clean_text(item.get("description", "")),
+                "link": item.get("link", ""),
+                "bloggername": item.get("bloggername", ""),
+                "postdate": item.get("postdate", ""),
+            }
+        )
+    return blog_posts
+
+
+def fetch_page(keyword, client_id, client_secret, start=1, display=20, sort="sim"):
+    """검색 결과 한 페이지 요청, (전체 결과 수, 블로그 글 목록) 반환"""
+    headers = {
+        "X-Naver-Client-Id": client_id,
+        "X-Naver-Client-Secret": client_secret,
+    }
+    params = {"query": keyword, "display": display, "start": start, "sort": sort}
+
+    get_quota_limiter().acquire()
+    with timed(STAGE_NAVER, "blog_search"):
+        response = get_session().get(
+            NAVER_BLOG_SEARCH_URL, headers=headers, params=params, timeout=REQUEST_TIMEOUT
+        )
+        if response.status_code != 200:
+            raise NaverSearchError(response.status_code)
+
+        data = response.json()
+    return data.get("total", 0), parse_items(data)
+
+
+def fetch_page_cached(keyword, client_id, client_secret, start, display, sort, force_refresh=False):
+    """캐시를 거쳐 한 페이지 요청, (전체 결과 수, 블로그 글 목록, 캐시 사용 여부) 반환"""
+    cache = get_search_cache()
+    if not force_refresh:
+        cached = cache.get(keyword, sort, display, start)
+        if cached is not None:
+            return cached[0], cached[1], True
+
+    total, blog_posts = fetch_page(keyword, client_id, client_secret, start, display, sort)
+    cache.put(keyword, sort, display, start, total, blog_posts)
+    return total, blog_posts, False
+
+
+def plan_pages(total_count):
+    """가져올 개수를 (start, display) 페이지 목록으로 분할"""
+    total_count = max(1, min(total_count, MAX_RESULTS))
+    pages = []
+    start = 1
+    while start <= total_count and start <= MAX_START:
+        display = min(MAX_DISPLAY, total_count - start + 1)
+        pages.append((start, display))
+        start += display
+    return pages
+
+
+def search_blog_posts(
+    keyword, client_id, client_secret, total_count=20, sort="sim", force_refresh=False, on_progress=None
+):
+    """
+    최대 total_count개의 블로그 글 검색, (블로그 글 목록, 캐시에서 가져온 페이지 수, 전체 페이지 수) 반환
+    첫 페이지로 실제 결과 수를 확인한 뒤 나머지 페이지는 동시에 요청하고 순위 순서대로 합침
+    """
+    pages = plan_pages(total_count)
+
+    first_start, first_display = pages[0]
+    available, blog_posts, from_cache = fetch_page_cached(
+        keyword, client_id, client_secret, first_start, first_display, sort, force_refresh
+    )
+    cached_pages = 1 if from_cache else 0
+
+    # 실제 검색 결과 수를 넘는 페이지는 요청하지 않음
+    remaining_pages = [(start, display) for start, display in pages[1:] if start <= available]
+    if remaining_pages:
+        if on_progress:
+            on_progress(f"네이버 블로그 검색 중... ({len(remaining_pages) + 1}페이지)")
+        with ThreadPoolExecutor(max_workers=min(MAX_PAGE_WORKERS, len(remaining_pages))) as executor:
+            futures = [
+                executor.submit(
+                    fetch_page_cached, keyword, client_id, client_secret, start, display, sort, force_refresh
+                )
+                for start, display in remaining_pages
+            ]
+            # 제출 순서(=순위 순서)대로 결과 합치기
+            for future in futures:
+                _, page_posts, from_cache = future.result()
+                blog_posts.extend(page_posts)
+                cached_pages += 1 if from_cache else 0
+
+    # 페이지 경계에서 순위가 바뀌어 중복된 글 제거
+    seen_links = set()
+    unique_posts = []
+    for post in blog_posts:
+        if post["link"] in seen_links:
+            continue
+        seen_links.add(post["link"])
+        unique_posts.append(post)
+    return unique_posts, cached_pages, len(remaining_pages) + 1
+
+
+def iter_keyword_searches(keywords, client_id, client_secret, total_count=20, sort="sim", force_refresh=False):
+    """
+    여러 키워드를 동시에 검색하며 끝나는 순서대로 (키워드, 블로그 글 목록, 오류 메시지) 반환
+    호출 한도는 공유 제한기가 지키므로 키워드 수와 관계없이 초당/일일 한도를 넘지 않음
+    """
+    with ThreadPoolExecutor(max_workers=min(MAX_KEYWORD_WORKERS, max(1, len(keywords)))) as executor:
+        futures = {
+            executor.submit(
+                search_blog_posts, keyword, client_id, client_secret,
+                total_count=total_count, sort=sort, force_refresh=force_refresh,
+            ): keyword
+            for keyword in keywords
+        }
+        for future in as_completed(futures):
+            keyword = futures[future]
+            try:
+                blog_posts, _, _ = future.result()
+                yield keyword, blog_posts, ""
+            except NaverQuotaExceeded as e:
+                # 남은 키워드도 모두 실패하므로 대기 중인 작업 취소
+                for pending in futures:
+                    pending.cancel()
+                yield keyword, [], str(e)
+            except CancelledError:
+                yield keyword, [], "일일 호출 한도 초과로 검색하지 않음"
+            except Exception as e:
+                yield keyword, [], f"검색 오류: {str(e)}"
@@ -0,0 +1,189 @@
+"""
+    여러 브라우저 동시 발행 모듈
+
+    로그인된 브라우저의 쿠키를 복사한 Chrome 세션을 더 열고, 발행할 파일을 비어 있는 세션에 하나씩 나눠 줍니다.
+    세션마다 전용 스레드에서 자기 브라우저만 사용하며, 세션이 죽으면(브라우저 종료, 세션 만료 등) 그 세션만 빠지고
+    처리 중이던 파일은 최종 발행 버튼을 누르기 전이었을 때만 다른 세션에서 한 번 더 시도합니다.
+    결과는 끝나는 순서대로 (파일 경로, 성공 여부, 메시지)로 반환합니다.
+"""
+
+import queue
+import threading
+
+from selenium.webdriver.common.by import By
+
+from core.publisher import iter_publish, publish_file
+from core.tistory_manager import TistoryManager
+from utils.utils import get_env_int
+
+DEFAULT_PUBLISH_SESSIONS = 1
+MAX_PUBLISH_SESSIONS = 4
+TISTORY_HOME_URL = "https://www.tistory.com/"
+
+# 세션이 죽어 다른 세션에서 다시 시도하는 최대 횟수 (최종 발행 버튼을 누르기 전에 끊어진 경우만)
+MAX_FILE_RETRIES = 1
+
+_setup_lock = threading.Lock()
+
+
+def get_publish_sessions():
+    """동시에 사용할 브라우저 세션 수 (환경변수 PUBLISH_SESSIONS)"""
+    return get_env_int("PUBLISH_SESSIONS", DEFAULT_PUBLISH_SESSIONS, minimum=1, maximum=MAX_PUBLISH_SESSIONS)
+
+
+def session_alive(tistory_manager):
+    """브라우저 세션이 아직 명령을 받는지 확인"""
+    try:
+        return bool(tistory_manager.driver and tistory_manager.driver.window_handles)
+    except Exception:
+        return False
+
+
+def clone_session(cookies, start_url):
+    """로그인 쿠키를 넣은 새 브라우저 세션 (로그인이 확인되지 않으면 닫고 None)"""
+    manager = TistoryManager()
+    # webdriver-manager가 같은 캐시 폴더에 드라이버를 내려받으므로 추가 브라우저는 하나씩 준비
+    with _setup_lock:
+        if not manager.setup_driver():
+            return None
+    try:
+        # 쿠키는 같은 도메인 페이지를 연 상태에서만 넣을 수 있음
+        manager.driver.get(TISTORY_HOME_URL)
+        for cookie in cookies:
+            if "tistory.com" not in cookie.get("domain", ""):
+                continue
+            cookie = {key: value for key, value in cookie.items() if key != "sameSite"}
+            try:
+                manager.driver.add_cookie(cookie)
+            except Exception:
+                pass
+        manager.driver.get(start_url)
+        # 글쓰기 버튼이 보이면 로그인된 상태
+        if not manager.driver.find_elements(By.CSS_SELECTOR, ".wrap_link .link_tab"):
+            print("⚠️ 추가 브라우저에서 로그인이 확인되지 않아 닫습니다.")
+            manager.close_driver()
+            return None
+        return manager
+    except Exception as e:
+        print(f"⚠️ 추가 브라우저 준비 실패: {e}")
+        manager.close_driver()
+        return None
+
+
+class PublishSessionPool:
+    """로그인된 브라우저와 쿠키를 복사한 추가 브라우저로 파일을 나눠 발행"""
+
+    def __init__(self, tistory_manager, sessions, category="", on_progress=None):
+        self.tistory_manager = tistory_manager
+        self.sessions = max(1, min(sessions, MAX_PUBLISH_SESSIONS))
+        self.category = category
+        self.on_progress = on_progress
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+        self.lock = threading.Lock()
+        self.live_sessions = 0
+        self.pending = 0
+
+    def iter_publish(self, files_to_publish):
+        """파일마다 (파일 경로, 성공 여부, 메시지)를 끝나는 순서대로 반환"""
+        if not files_to_publish:
+            return
+        # 추가 세션은 첫 번째 브라우저의 쿠키와 주소로 만들므로 스레드를 시작하기 전에 읽어 둠
+        driver = self.tistory_manager.driver
+        cookies = driver.get_cookies()
+        start_url = driver.current_url or TISTORY_HOME_URL
+
+        for file_path, schedule_time in files_to_publish:
+            self.jobs.put((file_path, schedule_time, 0))
+        self.pending = len(files_to_publish)
+
+        sessions = min(self.sessions, len(files_to_publish))
+        self.live_sessions = sessions
+        threads = [threading.Thread(target=self._run_session, args=(0, None, None), daemon=True)]
+        for number in range(1, sessions):
+            threads.append(
+                threading.Thread(target=self._run_session, args=(number, cookies, start_url), daemon=True)
+            )
+        for thread in threads:
+            thread.start()
+
+        for _ in range(len(files_to_publish)):
+            yield self.results.get()
+        for thread in threads:
+            thread.join()
+
+    def _run_session(self, number, cookies, start_url):
+        """세션 하나의 발행 반복 (number 0은 로그인된 원래 브라우저)"""
+        manager = self.tistory_manager
+        if number:
+            manager = clone_session(cookies, start_url)
+            if manager is None:
+                self._session_ended()
+                return
+            print(f"✅ 추가 브라우저 {number} 준비 완료")
+
+        try:
+            while True:
+                try:
+                    file_path, schedule_time, attempts = self.jobs.get(timeout=0.2)
+                except queue.Empty:
+                    # 다른 세션이 끊어지면 처리 중이던 파일이 다시 들어올 수 있으므로 모두 끝날 때까지 대기
+                    if self.pending <= 0:
+                        return
+                    continue
+
+                result = publish_file(manager, file_path, schedule_time, self.category, self.on_progress)
+                if session_alive(manager):
+                    self._finish(result)
+                    continue
+
+                # 세션이 죽었으면 이 세션만 빠지고, 최종 발행 버튼을 누르기 전이었으면 다른 세션에 다시 맡김
+                # (누른 뒤였다면 이미 예약되었을 수 있어 다시 발행하면 글이 중복되므로 재시도하지 않음)
+                print(f"⚠️ 브라우저 {number} 세션이 끊어져 발행에서 제외합니다.")
+                if result[1]:
+                    self._finish(result)
+                elif manager.publish_submitted:
+                    self._finish((file_path, False, "발행 여부 확인 불가 (발행 버튼을 누른 뒤 끊어짐, 티스토리에서 확인하세요)"))
+                elif attempts < MAX_FILE_RETRIES:
+                    self.jobs.put((file_path, schedule_time, attempts + 1))
+                else:
+                    self._finish(result)
+                return
+        finally:
+            if number:
+                try:
+                    manager.close_driver()
+                except Exception:
+                    pass
+            self._session_ended()
+
+    def _finish(self, result):
+        with self.lock:
+            self.pending -= 1
+        self.results.put(result)
+
+    def _session_ended(self):
+        """마지막 세션이 끝났는데 남은 파일이 있으면 실패로 처리"""
+        with self.lock:
+            self.live_sessions -= 1
+            if self.live_sessions > 0:
+                return
+        while True:
+            try:
+                file_path, _, _ = self.jobs.get_nowait()
+            except queue.Empty:
+                return
+            self._finish((file_path, False, "사용할 수 있는 브라우저 세션이 없습니다."))
+
+
+def iter_publish_pooled(tistory_manager, files_to_publish, category="", on_progress=None, sessions=None):
+    """
+    세션 수가 1이면 기존 순차 발행(iter_publish), 2 이상이면 여러 브라우저로 나눠 발행
+    sessions를 지정하지 않으면 환경변수 PUBLISH_SESSIONS 사용
+    """
+    sessions = get_publish_sessions() if sessions is None else sessions
+    if sessions <= 1 or len(files_to_publish) <= 1:
+        return iter_publish(tistory_manager, files_to_publish, category, on_progress)
+    if on_progress:
+        on_progress(f"🌐 브라우저 {min(sessions, len(files_to_publish))}개로 나눠 발행합니다.")
+    return PublishSessionPool(tistory_manager, sessions, category, on_progress).iter_publish(files_to_publish)
\ No newline at end of file
@@ -0,0 +1,137 @@
+"""
+    티스토리 발행 모듈
+
+    저장된 글 파일에서 제목과 본문을 읽고, 로그인된 브라우저(TistoryManager)로
+    글쓰기 페이지를 열어 작성 및 예약 발행을 진행합니다. 단계별 소요 시간과 결과는 지표로 기록하며,
+    고정된 시간만큼 쉬지 않고 다음 단계에 필요한 요소나 알림창이 나타날 때까지만 기다립니다.
+"""
+
+import os
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from core.article_store import read_article
+from core.metrics import STAGE_TISTORY, timed
+from core.tistory_manager import alert_or_element, wait_step
+from core.title_history import SOURCE_PUBLISHED, get_title_history
+
+
+def parse_article_file(file_path):
+    """글 파일에서 (제목, 본문) 추출 (앞머리나 예전 머리말이 없으면 파일 이름을 제목으로 사용)"""
+    meta, body = read_article(file_path)
+    return meta["title"], body
+
+
+def write_article(tistory_manager, title, content, schedule_time=None, category=""):
+    """글쓰기 버튼 클릭하고 자동 작성 및 예약 발행 시도 (발행 완료가 확인되면 True)"""
+    tistory_manager.publish_submitted = False
+    try:
+        # 글쓰기 버튼 클릭
+        with timed(STAGE_TISTORY, "open_write_page") as call:
+            if not tistory_manager.go_to_write_page():
+                call.fail("글쓰기 페이지 열기 실패")
+                return False
+
+        with timed(STAGE_TISTORY, "editor_mode"):
+            switch_to_markdown_mode(tistory_manager)
+
+        # 클립보드에 내용 복사
+        try:
+            import pyperclip
+            pyperclip.copy(content)
+            print("📋 내용이 클립보드에 복사됨")
+        except Exception:
+            # pyperclip이 없거나 클립보드를 사용할 수 없는 환경 (복사는 편의 기능이라 계속 진행)
+            print("📋 클립보드 복사 기능 없음")
+
+        # 자동 글 작성 시도
+        with timed(STAGE_TISTORY, "write_post") as call:
+            if not tistory_manager.write_post(title, content, category):
+                call.fail("자동 작성 실패")
+                print("자동 작성 실패")
+                return False
+
+        print("🚀 자동 발행 시도 중...")
+        publish_date = schedule_time.strftime("%Y-%m-%d")
+        publish_hour = schedule_time.hour
+        publish_minute = schedule_time.minute
+        print(f"📅 예약 발행: {publish_date} {publish_hour:02d}:{publish_minute:02d}")
+        
+        with timed(STAGE_TISTORY, "publish_post") as call:
+            published = bool(tistory_manager.publish_post(publish_date, publish_hour, publish_minute))
+            if published:
+                print("🎉 자동 발행 완료!")
+            else:
+                call.fail("예약 발행 실패")
+        return published
+        
+    except Exception as e:
+        print(f"글쓰기 페이지 열기 오류: {e}")
+        return False
+
+
+def switch_to_markdown_mode(tistory_manager):
+    """에디터를 마크다운 모드로 전환하고 확인 알림창 처리"""
+    driver = tistory_manager.driver
+    dropdown_btn = wait_step(
+        driver, "editor_menu", EC.element_to_be_clickable((By.CSS_SELECTOR, "#editor-mode-layer-btn-open"))
+    )
+    dropdown_btn.click()
+
+    layout_btn = wait_step(
+        driver, "editor_menu_item", EC.element_to_be_clickable((By.CSS_SELECTOR, "#editor-mode-markdown-text"))
+    )
+    print("🖱️ 마크다운 모드 버튼 클릭")
+    layout_btn.click()
+
+    # 전환 확인 알림창이 뜨거나 마크다운 에디터가 나타날 때까지만 대기
+    print("🔍 알림창 확인 및 처리 중...")
+    result = wait_step(driver, "markdown_editor", alert_or_element((By.CSS_SELECTOR, ".CodeMirror")))
+    if hasattr(result, "accept"):
+        print(f"⚠️ 알림창 발견: '{result.text}'")
+        result.accept()
+        print("✅ 알림창 닫기 완료")
+        wait_step(driver, "markdown_editor", EC.presence_of_element_located((By.CSS_SELECTOR, ".CodeMirror")))
+
+
+def publish_file(tistory_manager, file_path, schedule_time, category="", on_progress=None):
+    """파일 하나 발행 후 (파일 경로, 성공 여부, 메시지) 반환 (오류는 실패 결과로 반환)"""
+    try:
+        if on_progress:
+            on_progress(f"'{os.path.basename(file_path)}' 준비 중...")
+
+        title, content = parse_article_file(file_path)
+
+        # 글 작성
+        success = write_article(tistory_manager, title, content, schedule_time, category)
+        if success:
+            get_title_history().add(title, SOURCE_PUBLISHED)
+            result = (file_path, True, "예약 발행 완료")
+        else:
+            result = (file_path, False, "자동 발행 실패 (열린 글쓰기 창에서 직접 확인하세요)")
+
+        # 발행된 글의 창만 닫고, 실패한 글쓰기 창은 남겨 두어 브라우저에서 직접 마무리할 수 있게 함
+        # (창 정리에 실패해도 이미 정해진 발행 결과는 바꾸지 않음)
+        try:
+            driver = tistory_manager.driver
+            if success:
+                with timed(STAGE_TISTORY, "close_window"):
+                    if driver.current_window_handle != driver.window_handles[0]:
+                        driver.close()
+            driver.switch_to.window(driver.window_handles[0])
+        except Exception as e:
+            print(f"⚠️ 브라우저 창 정리 실패: {e}")
+
+    except Exception as e:
+        result = (file_path, False, f"오류: {str(e)}")
+    return result
+
+
+def iter_publish(tistory_manager, files_to_publish, category="", on_progress=None):
+    """
+    (파일 경로, 예약 시간) 목록을 차례로 발행하며 파일마다 (파일 경로, 성공 여부, 메시지) 반환
+    한 파일에서 오류가 나도 나머지 파일은 계속 진행
+    """
+    for file_path, schedule_time in files_to_publish:
+        yield publish_file(tistory_manager, file_path, schedule_time, category, on_progress)
\ No newline at end of file
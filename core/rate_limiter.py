@@ -0,0 +1,207 @@
+"""
+    Gemini API 요청 한도 관리 모듈
+
+    API 키와 모델 이름별로 분당 요청 수(RPM)와 분당 토큰 수(TPM)를
+    토큰 버킷으로 관리합니다. 한도를 넘는 요청은 실패시키지 않고 여유가 생길 때까지
+    대기시키며, 429/503 응답은 지터가 포함된 지수 백오프로 재시도합니다.
+"""
+
+import random
+import re
+import threading
+import time
+
+from utils.utils import get_env_int
+
+# 기본 한도 (환경변수 GEMINI_RPM, GEMINI_TPM으로 변경 가능)
+DEFAULT_RPM = 10
+DEFAULT_TPM = 1000000
+
+# 재시도 설정
+MAX_RETRIES = 5
+BASE_BACKOFF_SECONDS = 2.0
+MAX_BACKOFF_SECONDS = 60.0
+
+RETRYABLE_STATUS_CODES = (429, 503)
+RETRYABLE_MESSAGE_PATTERN = re.compile(r"^\s*(?:429|503)\b|\b(?:RESOURCE_EXHAUSTED|UNAVAILABLE)\b")
+
+
+class TokenBucket:
+    """토큰 버킷 - capacity 만큼 쌓이고 초당 refill_rate 만큼 채워짐"""
+
+    def __init__(self, capacity, refill_rate):
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def refill(self, now):
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+            self.updated_at = now
+
+    def time_until(self, amount):
+        """amount 만큼 사용 가능해질 때까지 남은 시간(초)"""
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.refill_rate
+
+    def consume(self, amount):
+        self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, amount):
+        """실제 사용량 보정 (음수가 되면 이후 요청이 그만큼 더 대기)"""
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+
+class GeminiRateLimiter:
+    """API 키 + 모델 단위의 RPM/TPM 제한기"""
+
+    def __init__(self, rpm=DEFAULT_RPM, tpm=DEFAULT_TPM):
+        self.request_bucket = TokenBucket(rpm, rpm / 60.0)
+        self.token_bucket = TokenBucket(tpm, tpm / 60.0)
+        self.condition = threading.Condition()
+        self.blocked_until = 0.0
+        self.waiting = 0
+        self.last_wait = 0.0
+        self.total_wait = 0.0
+        self.acquired_count = 0
+
+    def acquire(self, estimated_tokens=0):
+        """요청 한도에 여유가 생길 때까지 대기 후 사용량 차감, 대기한 시간(초) 반환"""
+        started_at = time.monotonic()
+        with self.condition:
+            self.waiting += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    self.request_bucket.refill(now)
+                    self.token_bucket.refill(now)
+                    wait = max(
+                        self.blocked_until - now,
+                        self.request_bucket.time_until(1),
+                        self.token_bucket.time_until(estimated_tokens),
+                    )
+                    if wait <= 0:
+                        break
+                    self.condition.wait(wait)
+
+                self.request_bucket.consume(1)
+                self.token_bucket.consume(estimated_tokens)
+            finally:
+                self.waiting -= 1
+
+            waited = time.monotonic() - started_at
+            self.last_wait = waited
+            self.total_wait += waited
+            self.acquired_count += 1
+            return waited
+
+    def record_usage(self, estimated_tokens, actual_tokens):
+        """응답의 실제 토큰 사용량으로 TPM 버킷 보정"""
+        if actual_tokens is None:
+            return
+        with self.condition:
+            self.token_bucket.adjust(actual_tokens - estimated_tokens)
+            self.condition.notify_all()
+
+    def backoff(self, delay):
+        """429/503 응답 시 같은 키/모델의 모든 요청을 delay 초 동안 멈춤"""
+        with self.condition:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+
+    def queue_depth(self):
+        """현재 한도 대기 중인 요청 수"""
+        with self.condition:
+            return self.waiting
+
+    def stats(self):
+        """대기열/대기 시간 통계"""
+        with self.condition:
+            return {
+                "queue_depth": self.waiting,
+                "last_wait": self.last_wait,
+                "average_wait": self.total_wait / self.acquired_count if self.acquired_count else 0.0,
+                "blocked_for": max(0.0, self.blocked_until - time.monotonic()),
+            }
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(api_key, model_name):
+    """프로세스 전역에서 공유되는 (API 키, 모델)별 제한기 반환"""
+    key = (api_key, model_name)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = GeminiRateLimiter(
+                rpm=get_env_int("GEMINI_RPM", DEFAULT_RPM, minimum=1),
+                tpm=get_env_int("GEMINI_TPM", DEFAULT_TPM, minimum=1),
+            )
+            _limiters[key] = limiter
+        return limiter
+
+
+def is_retryable_error(error):
+    """재시도 대상(429 Too Many Requests / 503 Service Unavailable) 오류인지 확인"""
+    try:
+        from google.api_core import exceptions as google_exceptions
+        if isinstance(error, (google_exceptions.TooManyRequests, google_exceptions.ResourceExhausted,
+                              google_exceptions.ServiceUnavailable)):
+            return True
+    except ImportError:
+        pass
+
+    code = getattr(error, "code", None)
+    code = getattr(code, "value", code)
+    if code in RETRYABLE_STATUS_CODES:
+        return True
+    # 예외 종류로 알 수 없으면 메시지 맨 앞의 상태 코드나 gRPC 상태 이름만 확인
+    # (본문 중간의 ID, 토큰 수, 프롬프트 인용에 들어간 숫자는 무시)
+    return bool(RETRYABLE_MESSAGE_PATTERN.search(str(error)))
+
+
+def backoff_delay(attempt):
+    """지터가 포함된 지수 백오프 대기 시간"""
+    delay = min(MAX_BACKOFF_SECONDS, BASE_BACKOFF_SECONDS * (2 ** attempt))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def call_with_rate_limit(limiter, func, estimated_tokens=0, on_wait=None, max_retries=MAX_RETRIES, call=None):
+    """
+    제한기를 거쳐 func 호출
+    한도 대기와 429/503 재시도를 처리하며, 대기가 발생하면 on_wait(메시지)로 알림
+    call(metrics.CallRecord)을 넘기면 한도 대기 시간과 재시도 횟수를 기록
+    """
+    attempt = 0
+    while True:
+        if on_wait:
+            stats = limiter.stats()
+            if stats["queue_depth"] > 0 or stats["blocked_for"] > 0:
+                on_wait(
+                    f"요청 한도 대기 중... (대기열 {stats['queue_depth']}개, "
+                    f"평균 대기 {stats['average_wait']:.1f}초)"
+                )
+
+        waited = limiter.acquire(estimated_tokens)
+        if call is not None:
+            call.wait += waited
+        if on_wait and waited >= 1:
+            on_wait(f"요청 한도로 {waited:.1f}초 대기 후 요청")
+
+        try:
+            return func()
+        except Exception as e:
+            if attempt >= max_retries or not is_retryable_error(e):
+                raise
+            delay = backoff_delay(attempt)
+            attempt += 1
+            if call is not None:
+                call.retries += 1
+            limiter.backoff(delay)
+            if on_wait:
+                on_wait(f"API 한도 초과, {delay:.1f}초 후 재시도 ({attempt}/{max_retries})")
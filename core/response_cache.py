@@ -0,0 +1,163 @@
+"""
+    Gemini 응답 디스크 캐시
+
+    (모델, 전체 프롬프트, 생성 설정)의 해시를 키로 응답을 파일에 저장합니다.
+    용량 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제(LRU)합니다.
+
+    캐시 모드
+    - off: 캐시 사용 안 함 (기본값)
+    - on: 캐시에 있으면 재사용, 없으면 요청 후 저장
+    - refresh: 캐시를 읽지 않고 새로 요청한 뒤 저장 (기존 항목 갱신)
+    - replay: 캐시에 있는 응답만 사용 (API 호출 없이 오프라인 실행)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from utils.utils import get_data_dir, get_env_int
+
+MODE_OFF = "off"
+MODE_ON = "on"
+MODE_REFRESH = "refresh"
+MODE_REPLAY = "replay"
+CACHE_MODES = (MODE_OFF, MODE_ON, MODE_REFRESH, MODE_REPLAY)
+
+# 기본 용량 상한 (환경변수 GEMINI_CACHE_MAX_MB로 변경 가능)
+DEFAULT_MAX_MB = 200
+
+
+class CacheMissError(Exception):
+    """재생 모드에서 캐시에 없는 요청"""
+
+
+def make_cache_key(model_name, prompt, generation_config=None):
+    """모델, 프롬프트, 생성 설정으로 캐시 키(sha256) 생성"""
+    payload = json.dumps(
+        {"model": model_name, "prompt": prompt, "config": generation_config or {}},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """용량 제한 LRU 디스크 캐시"""
+
+    def __init__(self, cache_dir=None, max_bytes=None):
+        self.cache_dir = cache_dir or os.path.join(get_data_dir(), "gemini_cache")
+        if max_bytes is None:
+            max_bytes = get_env_int("GEMINI_CACHE_MAX_MB", DEFAULT_MAX_MB, minimum=1) * 1024 * 1024
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.index = None  # key -> 파일 크기 (오래 사용하지 않은 순서)
+        self.total_bytes = 0
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _load_index(self):
+        """처음 사용할 때 디스크의 항목을 마지막 사용 시각 순으로 읽어 인덱스 구성"""
+        if self.index is not None:
+            return
+        entries = []
+        if os.path.isdir(self.cache_dir):
+            for root, _, files in os.walk(self.cache_dir):
+                for name in files:
+                    if name.endswith(".json"):
+                        stat = os.stat(os.path.join(root, name))
+                        entries.append((stat.st_mtime, name[:-5], stat.st_size))
+        entries.sort()
+        self.index = OrderedDict((key, size) for _, key, size in entries)
+        self.total_bytes = sum(size for _, _, size in entries)
+
+    def get(self, key):
+        """캐시된 응답 텍스트 반환 (없으면 None)"""
+        with self.lock:
+            self._load_index()
+            if key not in self.index:
+                return None
+            path = self._path(key)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+                os.utime(path)  # 마지막 사용 시각 갱신 (재시작 후에도 LRU 순서 유지)
+            except (OSError, ValueError):
+                self._remove(key)
+                return None
+            self.index.move_to_end(key)
+            return entry.get("text")
+
+    def put(self, key, text, model_name=""):
+        """응답 저장 후 용량 상한을 넘으면 오래된 항목부터 삭제"""
+        data = json.dumps(
+            {"model": model_name, "text": text, "created_at": time.time()},
+            ensure_ascii=False,
+        ).encode("utf-8")
+        with self.lock:
+            self._load_index()
+            path = self._path(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+
+            self.total_bytes -= self.index.pop(key, 0)
+            self.index[key] = len(data)
+            self.total_bytes += len(data)
+
+            while self.total_bytes > self.max_bytes and len(self.index) > 1:
+                oldest_key = next(iter(self.index))
+                self._remove(oldest_key)
+
+    def _remove(self, key):
+        self.total_bytes -= self.index.pop(key, 0)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def clear(self):
+        """모든 캐시 항목 삭제"""
+        with self.lock:
+            self._load_index()
+            for key in list(self.index):
+                self._remove(key)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+_mode = None
+
+
+def get_response_cache():
+    """프로세스 전역 응답 캐시 반환"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache()
+        return _cache
+
+
+def get_cache_mode():
+    """현재 캐시 모드 (설정 전이면 환경변수 GEMINI_CACHE 값, 기본 off)"""
+    global _mode
+    if _mode is None:
+        mode = os.getenv("GEMINI_CACHE", "").strip().lower() or MODE_OFF
+        if mode not in CACHE_MODES:
+            print(f"⚠️ 환경변수 GEMINI_CACHE 값 '{mode}'을(를) 알 수 없어 캐시를 사용하지 않습니다. ({' / '.join(CACHE_MODES)})")
+            mode = MODE_OFF
+        _mode = mode
+    return _mode
+
+
+def set_cache_mode(mode):
+    """캐시 모드 변경 (off / on / refresh / replay)"""
+    global _mode
+    if mode not in CACHE_MODES:
+        raise ValueError(f"알 수 없는 캐시 모드: {mode}")
+    _mode = mode
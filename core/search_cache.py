@@ -0,0 +1,130 @@
+"""
+    네이버 검색 결과 캐시
+
+    (검색어, 정렬, display, start) 단위로 검색 결과 페이지를 SQLite에 저장합니다.
+    유효 시간(TTL)이 지난 항목은 사용하지 않으며, 항목 수나 용량 상한을 넘으면
+    가장 오래 사용하지 않은 항목부터 삭제(LRU)합니다.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from utils.utils import get_data_dir, get_env_int
+
+# 기본값 (환경변수 NAVER_CACHE_TTL_MINUTES, NAVER_CACHE_MAX_ENTRIES, NAVER_CACHE_MAX_MB로 변경 가능)
+DEFAULT_TTL_MINUTES = 24 * 60
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_MAX_MB = 50
+
+
+class SearchCache:
+    """TTL + LRU 검색 결과 캐시"""
+
+    def __init__(self, db_path=None, ttl_seconds=None, max_entries=None, max_bytes=None):
+        self.db_path = db_path or os.path.join(get_data_dir(), "naver_cache.sqlite3")
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else (
+            get_env_int("NAVER_CACHE_TTL_MINUTES", DEFAULT_TTL_MINUTES, minimum=0) * 60
+        )
+        self.max_entries = max_entries or get_env_int("NAVER_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES, minimum=1)
+        self.max_bytes = max_bytes or get_env_int("NAVER_CACHE_MAX_MB", DEFAULT_MAX_MB, minimum=1) * 1024 * 1024
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS search_pages (
+                    query TEXT NOT NULL,
+                    sort TEXT NOT NULL,
+                    display INTEGER NOT NULL,
+                    start INTEGER NOT NULL,
+                    total INTEGER NOT NULL,
+                    items TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL,
+                    PRIMARY KEY (query, sort, display, start)
+                )
+                """
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_search_pages_last_used ON search_pages(last_used)")
+
+    def get(self, query, sort, display, start):
+        """유효한 캐시 항목이면 (전체 결과 수, 블로그 글 목록), 없으면 None"""
+        now = time.time()
+        key = (query, sort, display, start)
+        with self.lock, self.conn:
+            row = self.conn.execute(
+                "SELECT total, items, created_at FROM search_pages "
+                "WHERE query = ? AND sort = ? AND display = ? AND start = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                return None
+            total, items, created_at = row
+            if now - created_at > self.ttl_seconds:
+                self.conn.execute(
+                    "DELETE FROM search_pages WHERE query = ? AND sort = ? AND display = ? AND start = ?",
+                    key,
+                )
+                return None
+            self.conn.execute(
+                "UPDATE search_pages SET last_used = ? "
+                "WHERE query = ? AND sort = ? AND display = ? AND start = ?",
+                (now, *key),
+            )
+        return total, json.loads(items)
+
+    def put(self, query, sort, display, start, total, blog_posts):
+        """검색 결과 페이지 저장 후 상한을 넘으면 오래 사용하지 않은 항목부터 삭제"""
+        now = time.time()
+        items = json.dumps(blog_posts, ensure_ascii=False)
+        size = len(items.encode("utf-8"))
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO search_pages "
+                "(query, sort, display, start, total, items, size, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (query, sort, display, start, total, items, size, now, now),
+            )
+            self._evict()
+
+    def _evict(self):
+        # 만료된 항목 먼저 삭제
+        self.conn.execute("DELETE FROM search_pages WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+
+        count, total_size = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM search_pages"
+        ).fetchone()
+        if count <= self.max_entries and total_size <= self.max_bytes:
+            return
+
+        # 상한 안으로 들어올 때까지 오래 사용하지 않은 순서로 삭제
+        victims = []
+        for rowid, size in self.conn.execute("SELECT rowid, size FROM search_pages ORDER BY last_used"):
+            if count <= self.max_entries and total_size <= self.max_bytes:
+                break
+            victims.append((rowid,))
+            count -= 1
+            total_size -= size
+        self.conn.executemany("DELETE FROM search_pages WHERE rowid = ?", victims)
+
+    def clear(self):
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM search_pages")
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_search_cache():
+    """프로세스 전역 검색 결과 캐시 반환"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = SearchCache()
+        return _cache
@@ -1,4 +1,5 @@
-import time
+import re
+
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -7,6 +8,97 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import NoAlertPresentException, TimeoutException
+
+from core.metrics import STAGE_TISTORY, timed
+
+# 단계별 최대 대기 시간 (초) - 고정 sleep 대신 필요한 요소/알림창/상태가 나타날 때까지만 대기
+STEP_TIMEOUTS = {
+    "write_window": 10,
+    "write_page": 10,
+    "title_input": 10,
+    "editor": 5,
+    "editor_menu": 5,
+    "editor_menu_item": 5,
+    "markdown_editor": 10,
+    "publish_button": 5,
+    "publish_layer": 5,
+    "open_setting": 3,
+    "calendar": 3,
+    "calendar_month": 3,
+    "calendar_day": 3,
+    "publish_done": 15,
+}
+DEFAULT_STEP_TIMEOUT = 5
+# 예약 달력에서 넘길 수 있는 최대 개월 수
+MAX_CALENDAR_MOVES = 24
+WAIT_POLL_SECONDS = 0.1
+
+# CodeMirror 인스턴스에 본문을 한 번에 넣고 (길이, FNV-1a 해시)를 돌려주는 스크립트
+# (키 입력은 글자마다 이벤트가 발생해 느리고 가끔 글자가 빠지므로 먼저 시도)
+SET_EDITOR_SCRIPT = """
+var element = document.querySelector('.CodeMirror');
+if (!element || !element.CodeMirror) { return null; }
+var cm = element.CodeMirror;
+cm.setValue(arguments[0]);
+cm.focus();
+cm.setCursor(cm.lineCount(), 0);
+var text = cm.getValue();
+var hash = 0x811c9dc5;
+for (var i = 0; i < text.length; i++) {
+    hash ^= text.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193) >>> 0;
+}
+return [text.length, hash];
+"""
+
+# 예약 달력에서 선택 표시된 날짜 버튼의 숫자 (선택된 버튼이 없으면 null)
+SELECTED_DAY_SCRIPT = """
+var buttons = document.querySelectorAll('button.btn_day');
+for (var i = 0; i < buttons.length; i++) {
+    var button = buttons[i];
+    var selected = ['selected', 'on', 'active'].some(function (name) { return button.classList.contains(name); })
+        || button.getAttribute('aria-selected') === 'true' || button.getAttribute('aria-pressed') === 'true';
+    if (selected) { return button.textContent.trim(); }
+}
+return null;
+"""
+
+
+def editor_text_digest(text):
+    """SET_EDITOR_SCRIPT와 같은 방식의 (UTF-16 길이, FNV-1a 해시)"""
+    data = text.encode("utf-16-le")
+    value = 0x811C9DC5
+    for i in range(0, len(data), 2):
+        value ^= data[i] | (data[i + 1] << 8)
+        value = (value * 0x01000193) & 0xFFFFFFFF
+    return len(data) // 2, value
+
+
+def wait_step(driver, step, condition, timeout=None):
+    """
+    condition이 참이 될 때까지 대기하고 그 값을 반환 (시간 초과면 TimeoutException)
+    실제로 기다린 시간은 지표에 wait_<단계> 작업으로 기록
+    """
+    with timed(STAGE_TISTORY, f"wait_{step}"):
+        return WebDriverWait(
+            driver, timeout or STEP_TIMEOUTS.get(step, DEFAULT_STEP_TIMEOUT), poll_frequency=WAIT_POLL_SECONDS
+        ).until(condition)
+
+
+def alert_present(driver):
+    """열린 알림창 (없으면 False)"""
+    try:
+        return driver.switch_to.alert
+    except NoAlertPresentException:
+        return False
+
+
+def alert_or_element(locator):
+    """알림창이 뜨거나 locator 요소가 나타나면 참이 되는 대기 조건 (알림창이면 알림창 반환)"""
+    def condition(driver):
+        return alert_present(driver) or driver.find_elements(*locator)
+    return condition
 
 
 class TistoryManager:
@@ -16,6 +108,8 @@ class TistoryManager:
         self.driver = None
         self.is_logged_in = False
         self.use_profile = use_profile
+        # 현재 글에서 최종 발행 버튼을 눌렀는지 (이후 오류가 나도 이미 발행되었을 수 있음)
+        self.publish_submitted = False
 
     def setup_driver(self, use_profile=False):  # 배포시 기본값을 False로 변경
         """Chrome 드라이버 설정 - 배포용 최적화"""
@@ -91,9 +185,7 @@ class TistoryManager:
                 print("📝 글쓰기 버튼 발견, 클릭 중...")
                 write_button.click()
                 
-                WebDriverWait(self.driver, 10).until(
-                    lambda driver: len(driver.window_handles) > initial_window_count
-                )
+                wait_step(self.driver, "write_window", lambda driver: len(driver.window_handles) > initial_window_count)
                 
                 new_window = self.driver.window_handles[-1]
                 self.driver.switch_to.window(new_window)
@@ -107,15 +199,14 @@ class TistoryManager:
             return False
         
         try:
-            # 알림창이 있는지 확인
-            alert = WebDriverWait(self.driver, 3).until(EC.alert_is_present())
-            print("⚠️ 알림창 발견, 닫는 중...")
-            # 알림창 닫기
-            alert.dismiss()
-            print("✅ 알림창 닫기 완료")
-        except Exception as e:
-            print("ℹ️ 알림창 없음, 계속 진행합니다.")
-            pass
+            # 임시 저장 글 알림창이나 제목 입력란 중 먼저 나타나는 것까지만 대기
+            result = wait_step(self.driver, "write_page", alert_or_element((By.CSS_SELECTOR, "#post-title-inp")))
+            if hasattr(result, "dismiss"):
+                print("⚠️ 알림창 발견, 닫는 중...")
+                result.dismiss()
+                print("✅ 알림창 닫기 완료")
+        except TimeoutException:
+            print("⚠️ 글쓰기 페이지 로딩 대기 시간 초과, 계속 진행합니다.")
 
         return True
 
@@ -126,8 +217,8 @@ class TistoryManager:
         # 제목 입력 시도
         title_input = None
         try:
-            title_input = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "#post-title-inp"))
+            title_input = wait_step(
+                self.driver, "title_input", EC.presence_of_element_located((By.CSS_SELECTOR, "#post-title-inp"))
             )
             print("✅ 제목 필드 발견: #post-title-inp")
         except Exception as e:
@@ -144,10 +235,18 @@ class TistoryManager:
         
         # 내용 입력 시도
         try:
-            codemirror_container = WebDriverWait(self.driver, 3).until(
-                EC.element_to_be_clickable((By.CLASS_NAME, "CodeMirror-line"))
+            codemirror_container = wait_step(
+                self.driver, "editor", EC.element_to_be_clickable((By.CLASS_NAME, "CodeMirror-line"))
             )
-            
+        except Exception as editor_error:
+            print(f"⚠️ 마크다운 에디터 처리 중 오류: {str(editor_error)}")
+            return False
+
+        if self.set_editor_content(content):
+            print("✅ CodeMirror 에디터 내용 입력 성공 (스크립트)")
+            return True
+
+        try:
             # ActionChains를 생성
             actions = ActionChains(self.driver)
             
@@ -165,18 +264,39 @@ class TistoryManager:
 
         return True
 
+    def set_editor_content(self, content):
+        """CodeMirror API로 본문을 한 번에 입력하고 길이/해시로 확인 (실패하면 False, 키 입력으로 다시 시도)"""
+        # CodeMirror는 줄바꿈을 \n으로 바꿔 저장하므로 같은 기준으로 비교
+        text = content.replace("\r\n", "\n").replace("\r", "\n")
+        try:
+            result = self.driver.execute_script(SET_EDITOR_SCRIPT, text)
+        except Exception as e:
+            print(f"⚠️ 스크립트 입력 실패, 키 입력으로 진행: {e}")
+            return False
+
+        if not result:
+            print("⚠️ CodeMirror 인스턴스를 찾을 수 없어 키 입력으로 진행합니다.")
+            return False
+        if tuple(result) != editor_text_digest(text):
+            print(f"⚠️ 입력 내용 확인 실패 (길이 {result[0]}/{len(text)}), 키 입력으로 다시 입력합니다.")
+            try:
+                self.driver.execute_script(SET_EDITOR_SCRIPT, "")
+            except Exception:
+                pass
+            return False
+        return True
+
 
     def publish_post(self, date: str = None, hour: int = None, minute: int = None):
         # 완료 버튼 클릭
         print("🚀 발행 시도 중...")
         try:
             # 완료 버튼
-            complete_button = WebDriverWait(self.driver, 5).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "#publish-layer-btn"))
+            complete_button = wait_step(
+                self.driver, "publish_button", EC.element_to_be_clickable((By.CSS_SELECTOR, "#publish-layer-btn"))
             )
             complete_button.click()
             print("✅ 완료 버튼 클릭 완료!")
-            time.sleep(2)
             
         except Exception as e:
             print(f"⚠️ 자동 발행 실패: {e}")
@@ -186,23 +306,24 @@ class TistoryManager:
         # 공개 설정
         try:
             # 팝업 내 공개 설정 영역 찾기
-            popup_items = WebDriverWait(self.driver, 5).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".info_editor.info_editor_type2 .inp_item"))
-            )
+            popup_items_locator = (By.CSS_SELECTOR, ".info_editor.info_editor_type2 .inp_item")
+            popup_items = wait_step(self.driver, "publish_layer", EC.presence_of_all_elements_located(popup_items_locator))
 
             if len(popup_items) >= 1:
                 # 첫 번째 항목이 공개 설정
-                open_radio = WebDriverWait(popup_items[0], 3).until(
+                open_radio = WebDriverWait(popup_items[0], STEP_TIMEOUTS["open_setting"]).until(
                     EC.element_to_be_clickable((By.CSS_SELECTOR, "#open20"))
                 )
                 open_radio.click()
-                print("✅ 공개 설정 완료!")
+                # 선택이 반영될 때까지만 대기 (팝업이 다시 그려지므로 항목은 다시 찾음)
+                try:
+                    wait_step(self.driver, "open_setting",
+                              EC.element_located_to_be_selected((By.CSS_SELECTOR, "#open20")))
+                    print("✅ 공개 설정 완료!")
+                except TimeoutException:
+                    print("⚠️ 공개 설정 확인 실패, 계속 진행합니다.")
 
-            time.sleep(1)
-
-            popup_items = WebDriverWait(self.driver, 5).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".info_editor.info_editor_type2 .inp_item"))
-            )
+            popup_items = wait_step(self.driver, "publish_layer", EC.presence_of_all_elements_located(popup_items_locator))
 
             # 발행일 설정
             if len(popup_items) >= 3:
@@ -214,7 +335,6 @@ class TistoryManager:
         
         try:
             # 날짜 파싱 (YYYY-MM-DD 형식)
-            import re
             if not re.match(r'^\d{4}-\d{2}-\d{2}$', date):
                 raise ValueError("날짜 형식 오류: YYYY-MM-DD 형식으로 입력해주세요")
             
@@ -227,51 +347,104 @@ class TistoryManager:
             reserve_btn.click()
             
             # 2. 캘린더 로딩 대기
-            WebDriverWait(self.driver, 3).until(EC.presence_of_element_located((By.CSS_SELECTOR, ".tbl_calendar")))
-            
-            # 3. 원하는 년월까지 이동
-            while True:
-                current_text = self.driver.find_element(By.CSS_SELECTOR, ".txt_calendar").text.strip()
-                cur_year, cur_month = current_text.replace("년", "").replace("월", "").split()
-                cur_year, cur_month = int(cur_year), int(cur_month)
-                print(f"현재 캘린더: {cur_year}년 {cur_month}월")
-                
-                if cur_year == year and cur_month == month:
-                    break
-                
-                time.sleep(1)
-                self.driver.find_element(By.CSS_SELECTOR, ".btn_next").click()
-            
-            # 4. 원하는 일자 클릭
-            day_btn = self.driver.find_element(By.XPATH, f"//button[@class='btn_day' and text()='{day}']")
-            day_btn.click()
-            
-            # 5. 시간 설정
-            hour_input = self.driver.find_element(By.ID, "dateHour")
-            hour_input.clear()
-            hour_input.send_keys(str(max(0, min(23, hour))))
-            
-            minute_input = self.driver.find_element(By.ID, "dateMinute")
-            minute_input.clear()
-            minute_input.send_keys(str(max(0, min(59, minute))))
+            wait_step(self.driver, "calendar", EC.presence_of_element_located((By.CSS_SELECTOR, ".tbl_calendar")))
             
+            # 3. 날짜/시간 설정 후 확인
+            self.set_schedule_date(year, month, day, hour, minute)
             print(f"✅ 발행일 설정 완료: {date} {hour}:{minute}")
-            time.sleep(1)
 
         except Exception as e:
+            # 예약 시간이 맞지 않은 채로 발행되지 않도록 여기서 중단
             print(f"⚠️ 발행일 설정 실패: {e}")
+            return False
 
         # 공개 발행 버튼 클릭
         try:
-            publish_button = WebDriverWait(self.driver, 5).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "#publish-btn"))
+            publish_button = wait_step(
+                self.driver, "publish_button", EC.element_to_be_clickable((By.CSS_SELECTOR, "#publish-btn"))
             )
+            # 클릭 도중 오류가 나도 발행되었을 수 있으므로 클릭 전에 표시
+            self.publish_submitted = True
             publish_button.click()
             print("✅ 발행 버튼 클릭 완료!")
-            time.sleep(2)
-            return True
         except Exception as e:
             print(f"⚠️ 최종 발행 버튼 클릭 실패: {e}")
+            return False
+
+        # 발행 창이 닫힐 때까지 대기 (닫히지 않으면 발행되지 않은 것으로 처리)
+        try:
+            wait_step(self.driver, "publish_done", EC.invisibility_of_element_located((By.CSS_SELECTOR, "#publish-btn")))
+            return True
+        except TimeoutException:
+            print("⚠️ 발행 완료 확인 시간 초과")
+            return False
+
+    def read_calendar_month(self):
+        """달력 제목("2025년 3월")에서 (년, 월) 읽기 (읽을 수 없으면 None)"""
+        text = self.driver.find_element(By.CSS_SELECTOR, ".txt_calendar").text.strip()
+        match = re.search(r"(\d{4})\D+(\d{1,2})", text)
+        if not match:
+            return None
+        return int(match.group(1)), int(match.group(2))
+
+    def read_selected_day(self):
+        """달력에서 선택된 날짜 (읽을 수 없으면 None)"""
+        text = self.driver.execute_script(SELECTED_DAY_SCRIPT)
+        return int(text) if text and text.isdigit() else None
+
+    def set_schedule_date(self, year, month, day, hour, minute):
+        """
+        열린 예약 달력에서 날짜와 시간을 설정하고 다시 읽어 확인 (실패하면 ValueError)
+        달력은 현재 달과 목표 달의 차이만큼만 넘기며, 이동 횟수는 MAX_CALENDAR_MOVES로 제한
+        """
+        current = self.read_calendar_month()
+        if current is None:
+            raise ValueError("달력의 년월을 읽을 수 없습니다.")
+        months_ahead = (year * 12 + month) - (current[0] * 12 + current[1])
+        if months_ahead < 0:
+            raise ValueError(f"예약 날짜가 달력의 현재 달({current[0]}년 {current[1]}월)보다 이전입니다.")
+        if months_ahead > MAX_CALENDAR_MOVES:
+            raise ValueError(f"예약 날짜가 너무 멉니다 (최대 {MAX_CALENDAR_MOVES}개월 후까지).")
+
+        # 넘길 때마다 제목이 바뀌는 것만 확인하고, 목표 달 도착 여부는 실제 제목으로 판단
+        for _ in range(months_ahead):
+            if current == (year, month):
+                break
+            previous = current
+
+            def month_changed(driver):
+                shown = self.read_calendar_month()
+                return shown if shown and shown != previous else False
+
+            self.driver.find_element(By.CSS_SELECTOR, ".btn_next").click()
+            current = wait_step(self.driver, "calendar_month", month_changed)
+        print(f"현재 캘린더: {current[0]}년 {current[1]}월")
+        if current != (year, month):
+            raise ValueError(f"달력을 {year}년 {month}월로 이동하지 못했습니다 (현재 {current[0]}년 {current[1]}월).")
+
+        # 이전/다음 달 날짜는 class가 달라 제외되며, 같은 숫자가 여러 개면 어느 달인지 알 수 없으므로 중단
+        day_buttons = self.driver.find_elements(By.XPATH, f"//button[@class='btn_day' and text()='{day}']")
+        if len(day_buttons) != 1:
+            raise ValueError(f"달력에서 {day}일 버튼을 하나로 찾지 못했습니다 ({len(day_buttons)}개).")
+        day_buttons[0].click()
+        try:
+            wait_step(self.driver, "calendar_day", lambda driver: self.read_selected_day() == day)
+        except TimeoutException:
+            raise ValueError(f"날짜 선택 확인 실패 (선택된 날짜: {self.read_selected_day()}, 기대값 {day})")
+
+        hour, minute = max(0, min(23, hour)), max(0, min(59, minute))
+        for element_id, value in (("dateHour", hour), ("dateMinute", minute)):
+            time_input = self.driver.find_element(By.ID, element_id)
+            time_input.clear()
+            time_input.send_keys(str(value))
+
+        # 입력한 시간과 달력 위치 다시 확인
+        for element_id, value in (("dateHour", hour), ("dateMinute", minute)):
+            entered = (self.driver.find_element(By.ID, element_id).get_attribute("value") or "").strip()
+            if not entered.isdigit() or int(entered) != value:
+                raise ValueError(f"시간 입력 확인 실패 ({element_id}: '{entered}', 기대값 {value})")
+        if self.read_calendar_month() != (year, month):
+            raise ValueError("날짜를 선택한 뒤 달력의 년월이 바뀌었습니다.")
 
     def close_driver(self):
         """드라이버 종료"""
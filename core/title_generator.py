@@ -0,0 +1,443 @@
+"""
+    블로그 제목 생성 모듈
+
+    검색한 블로그 글로 프롬프트를 구성해 Gemini로 제목을 생성합니다.
+    응답은 JSON 스키마(response_schema)로 형식을 강제하고, 받은 제목이 요청한 개수보다 적으면
+    모자란 개수만 추가로 요청합니다. 여러 키워드는 한 요청에 묶어 키워드별로 응답을 나누며,
+    응답 형식이 맞지 않거나 빠진 키워드는 키워드별 요청으로 다시 생성합니다.
+    스트리밍 모드에서는 응답 조각을 이어 붙이며 완성된 제목부터 하나씩 전달합니다.
+"""
+
+import json
+import re
+
+from core.context_packer import DEFAULT_TOKEN_BUDGET, pack_posts
+from core.gemini_client import generate_text, generate_text_stream
+
+# 한 요청에 묶을 키워드 수 (환경변수 TITLE_BATCH_KEYWORDS로 변경 가능)
+DEFAULT_BATCH_KEYWORDS = 5
+# 여러 키워드를 묶을 때 키워드 하나에 배정할 최소 토큰 예산
+MIN_KEYWORD_TOKEN_BUDGET = 300
+# 제목이 모자랄 때 추가 요청 최대 횟수
+MAX_TOP_UP_ATTEMPTS = 2
+
+TITLES_SCHEMA = {
+    "type": "object",
+    "properties": {"titles": {"type": "array", "items": {"type": "string"}}},
+    "required": ["titles"],
+}
+BATCH_TITLES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "results": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "keyword": {"type": "string"},
+                    "titles": {"type": "array", "items": {"type": "string"}},
+                },
+                "required": ["keyword", "titles"],
+            },
+        }
+    },
+    "required": ["results"],
+}
+
+# 구버전 SDK(google-generativeai 0.5 미만)는 response_mime_type을 지원하지 않으므로
+# 한 번 거부되면 이후에는 프롬프트의 형식 지시만으로 JSON을 요청
+_structured_output_supported = True
+
+_list_marker_re = re.compile(r"^\s*(?:\d+\s*[.)]|[-*•])\s+")
+
+
+class TitleGenerationCancelled(Exception):
+    """사용자가 제목 생성을 중지함"""
+
+
+def build_title_prompt(content_summary, count):
+    """제목 생성 프롬프트 구성"""
+    return f"""
+                다음은 특정 키워드로 검색한 상위 블로그 글들의 제목과 내용입니다:
+
+                {content_summary}
+
+                위 내용들을 분석하여 SEO에 최적화되고 클릭률이 높은 블로그 제목을 {count}개 생성해주세요.
+                1. 제목의 구조적 특징(길이, 문장 구조, 문체 등)
+                2. 자주 사용되는 핵심 키워드와 표현
+                3. 제목 구성의 패턴(예: 질문형, 리스트형, 비교형 등)
+                4. 독자의 관심을 끌기 위한 기법(감정적 표현, 호기심 유발 등)
+                5. 제목의 SEO 최적화 특징
+
+                **중요 사항:**
+                - 제목에는 마크다운 문법(#, *, _, `, [, ] 등)을 절대 사용하지 마세요
+                - 일반 텍스트로만 제목을 작성해주세요
+                - 특수문자나 기호는 최소한으로 사용하세요
+
+                **응답 형식:**
+                - 다른 설명 없이 {{"titles": [제목 문자열 배열]}} 형식의 JSON 객체 하나만 응답해주세요
+                - 제목 앞에 번호를 붙이지 마세요
+
+                예시:
+                {{"titles": ["효과적인 블로그 운영 방법 5가지", "초보자를 위한 SEO 최적화 가이드", "블로그 수익화 전략과 실제 사례"]}}
+                """
+
+
+def build_top_up_prompt(content_summary, existing_titles, missing):
+    """모자란 개수만큼 제목을 추가로 요청하는 프롬프트 구성"""
+    existing = "\n".join(f"- {title}" for title in existing_titles)
+    return f"""
+                다음은 특정 키워드로 검색한 상위 블로그 글들의 제목과 내용입니다:
+
+                {content_summary}
+
+                이미 생성한 제목:
+                {existing}
+
+                위 제목과 겹치지 않는 SEO에 최적화된 블로그 제목을 정확히 {missing}개만 더 생성해주세요.
+                제목에는 마크다운 문법을 사용하지 말고 일반 텍스트로만 작성해주세요.
+
+                **응답 형식:**
+                - 다른 설명 없이 {{"titles": [제목 문자열 배열]}} 형식의 JSON 객체 하나만 응답해주세요
+                """
+
+
+def call_structured(generate, schema):
+    """generate(generation_config)를 JSON 스키마 설정으로 호출 (SDK가 지원하지 않으면 설정 없이 호출)"""
+    global _structured_output_supported
+    if _structured_output_supported:
+        generation_config = {"response_mime_type": "application/json", "response_schema": schema}
+        try:
+            return generate(generation_config)
+        except (TypeError, ValueError) as e:
+            # 요청을 보내기 전에 SDK가 설정 항목을 거부한 경우
+            if "response_" not in str(e):
+                raise
+            _structured_output_supported = False
+    return generate(None)
+
+
+def generate_json(api_key, prompt, schema, on_wait=None, operation="titles"):
+    """JSON 스키마를 지정해 생성 (operation은 지표에 기록할 작업 이름)"""
+    return call_structured(
+        lambda config: generate_text(
+            api_key, prompt, generation_config=config, on_wait=on_wait, operation=operation
+        ),
+        schema,
+    )
+
+
+def load_json_object(content):
+    """응답 텍스트에서 JSON 객체 추출 (코드 블록 등으로 감싼 경우 포함, 없으면 ValueError)"""
+    text = content.strip()
+    start, end = text.find("{"), text.rfind("}")
+    if start < 0 or end < start:
+        raise ValueError("응답에서 JSON 객체를 찾을 수 없습니다.")
+    data = json.loads(text[start:end + 1])
+    if not isinstance(data, dict):
+        raise ValueError("응답이 JSON 객체가 아닙니다.")
+    return data
+
+
+def clean_titles(titles):
+    """제목 문자열 정리 (빈 값, 중복 제거)"""
+    cleaned = []
+    seen = set()
+    for title in titles:
+        title = str(title).strip()
+        if len(title) >= 2 and title[0] == title[-1] == '"':
+            title = title[1:-1].strip()
+        if title and title not in seen:
+            seen.add(title)
+            cleaned.append(title)
+    return cleaned
+
+
+def parse_titles(content):
+    """응답에서 제목 목록 추출 (JSON이 아니면 번호/기호 목록 형식으로 해석)"""
+    try:
+        titles = load_json_object(content).get("titles")
+        if isinstance(titles, list):
+            return clean_titles(titles)
+    except ValueError:
+        pass
+
+    # 번호나 목록 기호만 떼어내고 제목 안의 점, 하이픈(예: 2.0, A-Z)은 그대로 유지
+    titles = []
+    for line in content.strip().split("\n"):
+        match = _list_marker_re.match(line)
+        if match:
+            titles.append(line[match.end():])
+    return clean_titles(titles)
+
+
+def top_up_titles(titles, content_summary, count, api_key, on_wait=None, on_title=None):
+    """제목이 count개보다 적으면 모자란 개수만 추가로 요청해 채움 (추가된 제목마다 on_title 호출)"""
+    titles = list(titles)
+    for _ in range(MAX_TOP_UP_ATTEMPTS):
+        missing = count - len(titles)
+        if missing <= 0:
+            break
+        content = generate_json(
+            api_key, build_top_up_prompt(content_summary, titles, missing), TITLES_SCHEMA, on_wait,
+            operation="titles_top_up",
+        )
+        added = [title for title in parse_titles(content) if title not in titles][:missing]
+        if not added:
+            break
+        titles.extend(added)
+        if on_title:
+            for title in added:
+                on_title(title)
+    return titles[:count]
+
+
+def generate_titles(blog_posts, keyword, count, api_key, token_budget=DEFAULT_TOKEN_BUDGET, on_wait=None):
+    """키워드 하나의 검색 결과로 제목 생성, (제목 목록, 컨텍스트 구성 결과) 반환"""
+    packed = pack_posts(blog_posts, keyword, token_budget)
+    prompt = build_title_prompt(packed["text"], count)
+    content = generate_json(api_key, prompt, TITLES_SCHEMA, on_wait)
+    titles = top_up_titles(parse_titles(content), packed["text"], count, api_key, on_wait)
+    return titles, packed
+
+
+class TitleStreamParser:
+    """스트리밍 응답 조각에서 완성된 제목을 순서대로 추출"""
+
+    def __init__(self):
+        self.buffer = ""
+        self.position = 0
+        self.mode = None  # "json" 또는 "lines"
+        self.array_started = False
+        self.array_closed = False
+        self.titles = []
+
+    def feed(self, text):
+        """조각을 추가하고 새로 완성된 제목 목록 반환"""
+        self.buffer += text
+        if self.mode is None:
+            stripped = self.buffer.lstrip()
+            if not stripped:
+                return []
+            self.mode = "json" if stripped[0] in "{`" else "lines"
+        found = self._scan_json() if self.mode == "json" else self._scan_lines()
+        return self._accept(found)
+
+    def finish(self):
+        """응답이 끝난 뒤 남은 제목 반환 (스트림 중 추출하지 못한 형식이면 전체를 다시 해석)"""
+        if self.mode == "lines":
+            found = self._scan_lines(final=True)
+        else:
+            found = parse_titles(self.buffer)
+        return self._accept(found)
+
+    def _accept(self, found):
+        new_titles = [title for title in clean_titles(found) if title not in self.titles]
+        self.titles.extend(new_titles)
+        return new_titles
+
+    def _scan_json(self):
+        found = []
+        if not self.array_started:
+            start = self.buffer.find("[", self.position)
+            if start < 0:
+                return found
+            self.array_started = True
+            self.position = start + 1
+
+        while not self.array_closed:
+            # 다음 문자열 시작 또는 배열 끝 찾기
+            index = self.position
+            while index < len(self.buffer) and self.buffer[index] not in '"]':
+                index += 1
+            if index >= len(self.buffer):
+                self.position = index
+                break
+            if self.buffer[index] == "]":
+                self.array_closed = True
+                break
+
+            # 이스케이프되지 않은 닫는 따옴표까지 와야 제목 하나가 완성됨
+            end = index + 1
+            while end < len(self.buffer):
+                if self.buffer[end] == "\\":
+                    end += 2
+                    continue
+                if self.buffer[end] == '"':
+                    break
+                end += 1
+            if end >= len(self.buffer):
+                self.position = index
+                break
+            try:
+                found.append(json.loads(self.buffer[index:end + 1]))
+            except ValueError:
+                pass
+            self.position = end + 1
+        return found
+
+    def _scan_lines(self, final=False):
+        found = []
+        while True:
+            newline = self.buffer.find("\n", self.position)
+            if newline < 0:
+                if not final:
+                    break
+                newline = len(self.buffer)
+            line = self.buffer[self.position:newline]
+            self.position = min(newline + 1, len(self.buffer))
+            match = _list_marker_re.match(line)
+            if match:
+                found.append(line[match.end():])
+            if newline >= len(self.buffer):
+                break
+        return found
+
+
+def generate_titles_stream(
+    blog_posts, keyword, count, api_key, on_title, token_budget=DEFAULT_TOKEN_BUDGET,
+    on_wait=None, should_stop=None,
+):
+    """
+    스트리밍으로 제목 생성, 제목이 완성될 때마다 on_title(제목) 호출
+    should_stop()이 True를 반환하면 TitleGenerationCancelled 발생 (그때까지 전달된 제목은 유지)
+    (제목 목록, 컨텍스트 구성 결과) 반환
+    """
+    packed = pack_posts(blog_posts, keyword, token_budget)
+    prompt = build_title_prompt(packed["text"], count)
+
+    titles = []
+
+    def emit(title):
+        if len(titles) < count:
+            titles.append(title)
+            on_title(title)
+
+    def generate(config):
+        parser = TitleStreamParser()
+
+        def on_chunk(text):
+            if should_stop and should_stop():
+                raise TitleGenerationCancelled()
+            for title in parser.feed(text):
+                emit(title)
+
+        generate_text_stream(
+            api_key, prompt, on_chunk, generation_config=config, on_wait=on_wait, operation="titles_stream"
+        )
+        return parser
+
+    parser = call_structured(generate, TITLES_SCHEMA)
+    for title in parser.finish():
+        emit(title)
+
+    if should_stop and should_stop():
+        raise TitleGenerationCancelled()
+    titles = top_up_titles(titles, packed["text"], count, api_key, on_wait, on_title=on_title)
+    return titles, packed
+
+
+def build_batch_title_prompt(keyword_summaries, count):
+    """여러 키워드의 제목을 한 번에 요청하는 프롬프트 구성 (keyword_summaries: [(키워드, 요약)])"""
+    sections = "\n".join(
+        f"[키워드: {keyword}]\n{summary}" for keyword, summary in keyword_summaries
+    )
+    keys = json.dumps([keyword for keyword, _ in keyword_summaries], ensure_ascii=False)
+    return f"""
+                다음은 여러 키워드로 각각 검색한 상위 블로그 글들의 제목과 내용입니다:
+
+                {sections}
+
+                키워드마다 위 내용들을 분석하여 SEO에 최적화되고 클릭률이 높은 블로그 제목을 {count}개씩 생성해주세요.
+                제목의 구조적 특징, 자주 사용되는 핵심 키워드와 표현, 제목 구성의 패턴,
+                독자의 관심을 끌기 위한 기법, SEO 최적화 특징을 참고하세요.
+
+                **중요 사항:**
+                - 제목에는 마크다운 문법(#, *, _, `, [, ] 등)을 절대 사용하지 마세요
+                - 일반 텍스트로만 제목을 작성해주세요
+                - 특수문자나 기호는 최소한으로 사용하세요
+
+                **응답 형식:**
+                - 다른 설명 없이 JSON 객체 하나만 응답해주세요
+                - results 배열에 키워드마다 keyword와 titles(제목 문자열 배열)를 담아주세요
+                - keyword는 다음 키워드와 정확히 같아야 합니다: {keys}
+
+                예시:
+                {{"results": [{{"keyword": "블로그 운영", "titles": ["효과적인 블로그 운영 방법 5가지", "초보자를 위한 블로그 운영 가이드"]}}]}}
+                """
+
+
+def parse_batch_titles(content, keywords):
+    """키워드별 JSON 응답을 {키워드: 제목 목록}으로 분리 (JSON이 아니면 ValueError)"""
+    data = load_json_object(content)
+
+    # 스키마 형식({"results": [...]})과 키워드를 키로 쓴 형식 모두 허용
+    keyed = {}
+    if isinstance(data.get("results"), list):
+        for entry in data["results"]:
+            if isinstance(entry, dict) and isinstance(entry.get("titles"), list):
+                keyed[str(entry.get("keyword", "")).strip()] = entry["titles"]
+    else:
+        keyed = data
+
+    results = {}
+    for keyword in keywords:
+        titles = keyed.get(keyword)
+        if isinstance(titles, list):
+            titles = clean_titles(titles)
+            if titles:
+                results[keyword] = titles
+    return results
+
+
+def iter_batch_titles(
+    keyword_posts, count, api_key, token_budget=DEFAULT_TOKEN_BUDGET,
+    batch_size=DEFAULT_BATCH_KEYWORDS, on_progress=None, on_wait=None,
+):
+    """
+    여러 키워드의 제목을 batch_size개씩 묶어 생성하며 키워드마다 (키워드, 제목 목록, 오류 메시지) 반환
+    토큰 예산은 요청 하나 기준이며 묶인 키워드끼리 나눠 사용
+    """
+    keywords = list(keyword_posts)
+    batch_size = max(1, batch_size)
+    for offset in range(0, len(keywords), batch_size):
+        group = keywords[offset:offset + batch_size]
+        if on_progress:
+            on_progress(f"제목 일괄 생성 중... ({offset + len(group)}/{len(keywords)}개 키워드)")
+
+        results = {}
+        summaries = []
+        if len(group) > 1:
+            keyword_budget = max(MIN_KEYWORD_TOKEN_BUDGET, token_budget // len(group))
+            summaries = [
+                (keyword, pack_posts(keyword_posts[keyword], keyword, keyword_budget)["text"])
+                for keyword in group
+            ]
+            try:
+                content = generate_json(
+                    api_key, build_batch_title_prompt(summaries, count), BATCH_TITLES_SCHEMA, on_wait,
+                    operation="batch_titles",
+                )
+                results = parse_batch_titles(content, group)
+            except Exception as e:
+                if on_progress:
+                    on_progress(f"일괄 응답을 처리하지 못해 키워드별로 생성합니다: {str(e)}")
+
+        summary_by_keyword = dict(summaries)
+        for keyword in group:
+            if keyword in results:
+                titles = results[keyword][:count]
+                try:
+                    titles = top_up_titles(titles, summary_by_keyword[keyword], count, api_key, on_wait)
+                except Exception as e:
+                    # 추가 요청이 실패해도 이미 받은 제목은 사용
+                    if on_progress:
+                        on_progress(f"'{keyword}' 제목 추가 생성 실패: {str(e)}")
+                yield keyword, titles, ""
+                continue
+            # 일괄 응답에 없는 키워드는 키워드별 요청으로 다시 생성
+            try:
+                titles, _ = generate_titles(keyword_posts[keyword], keyword, count, api_key, token_budget, on_wait)
+                yield keyword, titles, ""
+            except Exception as e:
+                yield keyword, [], f"제목 생성 오류: {str(e)}"
\ No newline at end of file
@@ -0,0 +1,174 @@
+"""
+    제목 사용 기록 모듈
+
+    생성하거나 발행한 제목을 SQLite에 저장하고, 새 제목이 예전 제목과 거의 같은지 검사합니다.
+    한글 제목은 띄어쓰기가 일정하지 않아 글자 2-gram 집합으로 비교하며, MinHash 서명을 여러 구간으로
+    나눈 LSH 키로 후보만 골라 실제 유사도(Jaccard)를 계산하므로 기록이 수만 개여도 빠르게 검사합니다.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+
+from core.dedup import char_shingles, normalize_text, stable_hash
+from utils.utils import get_data_dir, get_env_int
+
+SOURCE_GENERATED = "generated"
+SOURCE_PUBLISHED = "published"
+
+SHINGLE_SIZE = 2
+# MinHash 서명 길이 = 구간 수 x 구간당 행 수
+# (16구간 x 4행이면 유사도 0.7인 제목은 약 99%, 0.3인 제목은 약 12%만 후보가 됨)
+LSH_BANDS = 16
+LSH_ROWS = 4
+NUM_PERMUTATIONS = LSH_BANDS * LSH_ROWS
+
+# 유사 제목 판단 기준 (%, 환경변수 TITLE_DUPLICATE_THRESHOLD로 변경 가능)
+DEFAULT_THRESHOLD = 70
+
+# 실행마다 같은 값이 나오도록 고정된 해시 함수별 마스크
+# (shingle 해시에 XOR한 값의 최솟값을 해시 함수 하나의 결과로 사용)
+_masks = [stable_hash(f"minhash-{i}") for i in range(NUM_PERMUTATIONS)]
+
+
+def title_shingles(title):
+    return char_shingles(title, size=SHINGLE_SIZE)
+
+
+@lru_cache(maxsize=65536)
+def _shingle_hash(shingle):
+    return stable_hash(shingle)
+
+
+def minhash_signature(shingles):
+    """shingle 집합의 MinHash 서명"""
+    hashes = [_shingle_hash(shingle) for shingle in shingles]
+    if not hashes:
+        return [0] * NUM_PERMUTATIONS
+    return [min([value ^ mask for value in hashes]) for mask in _masks]
+
+
+def lsh_keys(signature):
+    """서명을 구간별로 나눈 검색 키 (구간 번호를 상위 비트에 포함)"""
+    keys = []
+    for band in range(LSH_BANDS):
+        rows = signature[band * LSH_ROWS:(band + 1) * LSH_ROWS]
+        # SQLite INTEGER(부호 있는 64비트)에 들어가도록 56비트로 제한
+        keys.append((band << 56) | (stable_hash("-".join(map(str, rows)), digest_size=7) & ((1 << 56) - 1)))
+    return keys
+
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class TitleHistory:
+    """생성/발행한 제목 기록과 유사 제목 검색"""
+
+    def __init__(self, db_path=None, threshold=None):
+        self.db_path = db_path or os.path.join(get_data_dir(), "title_history.sqlite3")
+        self.threshold = (
+            threshold if threshold is not None
+            else get_env_int("TITLE_DUPLICATE_THRESHOLD", DEFAULT_THRESHOLD, minimum=1, maximum=100) / 100
+        )
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS titles (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title TEXT NOT NULL,
+                    normalized TEXT NOT NULL UNIQUE,
+                    source TEXT NOT NULL,
+                    keyword TEXT NOT NULL DEFAULT '',
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS title_lsh (lsh_key INTEGER NOT NULL, title_id INTEGER NOT NULL)"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_title_lsh_key ON title_lsh(lsh_key)")
+
+    def find_similar(self, title):
+        """가장 비슷한 예전 제목 {"title", "similarity", "source"} 반환 (기준 미만이면 None)"""
+        normalized = normalize_text(title)
+        with self.lock:
+            exact = self.conn.execute(
+                "SELECT title, source FROM titles WHERE normalized = ?", (normalized,)
+            ).fetchone()
+        if exact:
+            return {"title": exact[0], "similarity": 1.0, "source": exact[1]}
+
+        shingles = title_shingles(title)
+        keys = lsh_keys(minhash_signature(shingles))
+        with self.lock:
+            candidates = self.conn.execute(
+                "SELECT title, source FROM titles WHERE id IN "
+                f"(SELECT title_id FROM title_lsh WHERE lsh_key IN ({','.join('?' * len(keys))}))",
+                keys,
+            ).fetchall()
+
+        best = None
+        for candidate, source in candidates:
+            similarity = jaccard(shingles, title_shingles(candidate))
+            if similarity >= self.threshold and (best is None or similarity > best["similarity"]):
+                best = {"title": candidate, "similarity": similarity, "source": source}
+        return best
+
+    def find_keyword(self, title):
+        """제목을 생성할 때 사용한 키워드 (기록이 없으면 빈 문자열)"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT keyword FROM titles WHERE normalized = ?", (normalize_text(title),)
+            ).fetchone()
+        return row[0] if row else ""
+
+    def add(self, title, source=SOURCE_GENERATED, keyword=""):
+        """제목 기록 (이미 있는 제목이 발행되면 출처만 발행으로 갱신)"""
+        normalized = normalize_text(title)
+        if not normalized:
+            return
+        keys = lsh_keys(minhash_signature(title_shingles(title)))
+
+        with self.lock, self.conn:
+            row = self.conn.execute("SELECT id FROM titles WHERE normalized = ?", (normalized,)).fetchone()
+            if row:
+                if source == SOURCE_PUBLISHED:
+                    self.conn.execute("UPDATE titles SET source = ? WHERE id = ?", (source, row[0]))
+                return
+            cursor = self.conn.execute(
+                "INSERT INTO titles (title, normalized, source, keyword, created_at) VALUES (?, ?, ?, ?, ?)",
+                (title, normalized, source, keyword, time.time()),
+            )
+            self.conn.executemany(
+                "INSERT INTO title_lsh (lsh_key, title_id) VALUES (?, ?)",
+                [(key, cursor.lastrowid) for key in keys],
+            )
+
+    def count(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM titles").fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+_history = None
+_history_lock = threading.Lock()
+
+
+def get_title_history():
+    """프로세스 전역 제목 기록 반환"""
+    global _history
+    with _history_lock:
+        if _history is None:
+            _history = TitleHistory()
+        return _history
\ No newline at end of file
@@ -1,5 +1,5 @@
 import os
-import glob
+import time
 from PyQt5.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -7,9 +7,8 @@ from PyQt5.QtWidgets import (
     QLineEdit,
     QPushButton,
     QTextEdit,
-    QTableWidget,
-    QTableWidgetItem,
-    QDateTimeEdit,
+    QTableView,
+    QAbstractItemView,
     QGroupBox,
     QMessageBox,
     QFileDialog,
@@ -17,9 +16,11 @@ from PyQt5.QtWidgets import (
     QSizePolicy,
 )
 
-from PyQt5.QtCore import Qt, QDateTime
-from core.tistory_manager import TistoryManager
+from PyQt5.QtCore import QDateTime
+from core.article_store import list_articles
+from core.metrics import STAGE_TISTORY, format_summary, get_metrics
 from core.workers import TistoryPublishWorker
+from tabs.models import DeleteButtonDelegate, PublishFileTableModel, ScheduleDelegate
 
 class BlogPublishTab(QWidget):
     """블로그 발행 탭"""
@@ -27,10 +28,18 @@ class BlogPublishTab(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent = parent
-        self.tistory_manager = TistoryManager()
+        self._tistory_manager = None
         self.files_to_publish = []
         self.init_ui()
 
+    @property
+    def tistory_manager(self):
+        """티스토리 관리자 (selenium을 불러오는 데 오래 걸리므로 처음 사용할 때 생성)"""
+        if self._tistory_manager is None:
+            from core.tistory_manager import TistoryManager
+            self._tistory_manager = TistoryManager()
+        return self._tistory_manager
+
     def init_ui(self):
         """UI 초기화"""
         layout = QVBoxLayout(self)
@@ -126,10 +135,27 @@ class BlogPublishTab(QWidget):
         files_group.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)  # 수평, 수직 확장
         files_layout = QVBoxLayout(files_group)
 
-        # 테이블 위젯 - 파일명, 예약시간, 상태, 삭제 버튼
-        self.files_table = QTableWidget(0, 4)
-        self.files_table.setHorizontalHeaderLabels(["파일명", "예약 시간", "상태", "삭제"])
-        
+        # 테이블 - 파일명, 예약시간, 상태, 삭제 버튼
+        # (행마다 위젯을 만들지 않고 모델과 델리게이트로 표시, 예약 시간 편집기는 편집할 때만 생성)
+        self.files_model = PublishFileTableModel(self)
+        self.files_table = QTableView()
+        self.files_table.setModel(self.files_model)
+        self.files_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.files_table.setEditTriggers(
+            QAbstractItemView.DoubleClicked | QAbstractItemView.SelectedClicked | QAbstractItemView.EditKeyPressed
+        )
+
+        self.schedule_delegate = ScheduleDelegate(self.files_table)
+        self.files_table.setItemDelegateForColumn(PublishFileTableModel.COLUMN_SCHEDULE, self.schedule_delegate)
+        self.delete_delegate = DeleteButtonDelegate(self.files_table)
+        self.delete_delegate.delete_requested.connect(self.delete_file_row)
+        self.files_table.setItemDelegateForColumn(PublishFileTableModel.COLUMN_DELETE, self.delete_delegate)
+
+        # 행 높이를 고정해 행 수와 관계없이 크기 계산 생략
+        vertical_header = self.files_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(34)
+
         # 컬럼 너비 설정
         header = self.files_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)  # 파일명 (남은 공간 모두 차지)
@@ -142,11 +168,12 @@ class BlogPublishTab(QWidget):
         self.files_table.setColumnWidth(3, 60)   # 삭제 버튼 컬럼
         
         self.files_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background: white;
                 selection-background-color: #e3f2fd;
+                selection-color: black;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 6px;
             }
         """)
@@ -187,116 +214,38 @@ class BlogPublishTab(QWidget):
         """파일 목록 새로고침"""
         folder_path = self.folder_path_input.text().strip()
         if not folder_path or not os.path.exists(folder_path):
-            self.files_table.setRowCount(0)
+            self.files_model.clear()
             return
 
-        txt_files = glob.glob(os.path.join(folder_path, "*.txt"))
-        self.files_table.setRowCount(len(txt_files))
+        # 글 파일을 열지 않고 폴더 manifest에서 목록 구성
+        articles = list_articles(folder_path)
 
-        # 현재 시간 기준 5분 후부터 시작
-        current_time = QDateTime.currentDateTime()
-        start_time = current_time.addSecs(5 * 60)  # 5분 후
-
-        for row, file_path in enumerate(txt_files):
-            filename = os.path.basename(file_path)
-
-            # 파일명
-            item = QTableWidgetItem(filename)
-            item.setData(Qt.UserRole, file_path)
-            item.setFlags(item.flags() & ~Qt.ItemIsEditable)  # 읽기 전용
-
-            self.files_table.setItem(row, 0, item)
-
-            # 예약 시간 (기본값: 현재 시각 + 5분 + row*5분)
-            dt_edit = QDateTimeEdit()
-            dt_edit.setCalendarPopup(True)
-            dt_edit.setDisplayFormat("yyyy-MM-dd hh:mm")
-            dt_edit.setMinimumWidth(160)  # 최소 너비 설정
-
-            dt_edit.setStyleSheet("""
-                QDateTimeEdit {
-                    padding: 5px;
-                    font-size: 12px;
-                    border: 1px solid #ddd;
-                    border-radius: 4px;
-                }
-                QDateTimeEdit:focus {
-                    border: 2px solid #2196f3;
-                }
-            """)
-            
-            # 각 파일마다 5분씩 간격을 두어 기본 시간 설정 (시작은 현재 시간 + 5분부터)
-            scheduled_time = start_time.addSecs(row * 5 * 60)
-            dt_edit.setDateTime(scheduled_time)
-            
-            self.files_table.setCellWidget(row, 1, dt_edit)
-
-            # 상태
-            status_item = QTableWidgetItem("대기")
-            status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
-            self.files_table.setItem(row, 2, status_item)
-            
-            # 삭제 버튼
-            delete_btn = QPushButton("🗑️")
-            delete_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #f44336;
-                    color: white;
-                    border: none;
-                    padding: 5px;
-                    font-weight: bold;
-                    border-radius: 4px;
-                    min-width: 30px;
-                }
-                QPushButton:hover {
-                    background-color: #d32f2f;
-                }
-            """)
-            delete_btn.clicked.connect(lambda checked, btn=delete_btn: self.delete_file_row_by_button(btn))
-            self.files_table.setCellWidget(row, 3, delete_btn)
+        # 현재 시간 기준 5분 후부터 5분 간격으로 예약
+        start_time = QDateTime.currentDateTime().addSecs(5 * 60)
+        self.files_model.set_articles(articles, start_time, 5 * 60)
 
         if hasattr(self.parent, 'update_status'):
-            self.parent.update_status(f"📁 {len(txt_files)}개의 텍스트 파일을 발견했습니다.")
-
-    def delete_file_row_by_button(self, button):
-        """버튼을 통한 행 삭제"""
-        # 버튼이 속한 행 찾기
-        row = -1
-        for r in range(self.files_table.rowCount()):
-            if self.files_table.cellWidget(r, 3) == button:
-                row = r
-                break
-        
-        if row == -1:
-            return
-            
-        self.delete_file_row(row)
-    
+            self.parent.update_status(f"📁 {len(articles)}개의 글 파일을 발견했습니다.")
+
     def delete_file_row(self, row):
         """특정 행 삭제"""
-        if row >= self.files_table.rowCount():
+        if row >= self.files_model.rowCount():
             return
-            
-        file_item = self.files_table.item(row, 0)
-        if file_item:
-            filename = file_item.text()
-            reply = QMessageBox.question(
-                self,
-                "파일 삭제 확인",
-                f"'{filename}' 파일을 목록에서 제거하시겠습니까?\n(실제 파일은 삭제되지 않습니다)",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
-            )
-            
-            if reply == QMessageBox.Yes:
-                self.files_table.removeRow(row)
-                
-                if hasattr(self.parent, 'update_status'):
-                    self.parent.update_status(f"🗑️ {filename} 파일이 목록에서 제거되었습니다.")
-
 
+        filename = self.files_model.file_at(row)
+        reply = QMessageBox.question(
+            self,
+            "파일 삭제 확인",
+            f"'{filename}' 파일을 목록에서 제거하시겠습니까?\n(실제 파일은 삭제되지 않습니다)",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
 
+        if reply == QMessageBox.Yes:
+            self.files_model.remove_file_row(row)
 
+            if hasattr(self.parent, 'update_status'):
+                self.parent.update_status(f"🗑️ {filename} 파일이 목록에서 제거되었습니다.")
 
     def publish_all_files(self):
         """모든 파일 일괄 발행"""
@@ -305,20 +254,12 @@ class BlogPublishTab(QWidget):
         current_time = QDateTime.currentDateTime()
         
         # 모든 파일의 경로와 예약 시간 수집
-        for row in range(self.files_table.rowCount()):
-            file_item = self.files_table.item(row, 0)
-            dt_edit = self.files_table.cellWidget(row, 1)
-            
-            if file_item and dt_edit:
-                file_path = file_item.data(Qt.UserRole)
-                filename = file_item.text()
-                schedule_time = dt_edit.dateTime()
-                
-                # 현재 시간보다 이전인지 확인
-                if schedule_time < current_time:
-                    past_time_files.append(filename)
-                else:
-                    files_to_publish.append((file_path, schedule_time.toPyDateTime()))
+        for file_path, filename, schedule_time in self.files_model.schedules():
+            # 현재 시간보다 이전인지 확인
+            if schedule_time < current_time:
+                past_time_files.append(filename)
+            else:
+                files_to_publish.append((file_path, schedule_time.toPyDateTime()))
         
         # 과거 시간이 설정된 파일이 있으면 경고
         if past_time_files:
@@ -336,10 +277,7 @@ class BlogPublishTab(QWidget):
             return
         
         # 파일 상태를 '준비중'으로 변경
-        for row in range(self.files_table.rowCount()):
-            status_item = self.files_table.item(row, 2)
-            if status_item:
-                status_item.setText("준비중")
+        self.files_model.set_all_status("준비중")
 
         if hasattr(self.parent, 'update_status'):
             self.parent.update_status(f"🚀 {len(files_to_publish)}개 파일 발행 시작...")
@@ -349,6 +287,7 @@ class BlogPublishTab(QWidget):
 
     def start_publish_worker(self, files_to_publish):
         """티스토리 발행 워커 시작"""
+        self.publish_started_at = time.time()
         # 프로그레스바 설정
         if hasattr(self.parent, 'progress_bar'):
             self.parent.progress_bar.setVisible(True)
@@ -366,13 +305,7 @@ class BlogPublishTab(QWidget):
         
     def update_file_status(self, filename, status):
         """파일 상태 업데이트"""
-        for row in range(self.files_table.rowCount()):
-            file_item = self.files_table.item(row, 0)
-            if file_item and file_item.text() == filename:
-                status_item = self.files_table.item(row, 2)
-                if status_item:
-                    status_item.setText(status)
-                break
+        self.files_model.set_status(filename, status)
 
     def on_publish_completed(self, filename, message):
         """파일 발행 완료 처리"""
@@ -400,8 +333,9 @@ class BlogPublishTab(QWidget):
         if hasattr(self.parent, 'update_status'):
             self.parent.update_status("모든 파일 발행이 완료되었습니다.")
             
-        QMessageBox.information(
-            self,
-            "발행 완료",
-            "모든 파일이 발행되었습니다.\n티스토리 관리자 페이지에서 확인하세요."
-        )
\ No newline at end of file
+        message = "모든 파일이 발행되었습니다.\n티스토리 관리자 페이지에서 확인하세요."
+        # 이번 발행의 단계별 소요 시간 요약
+        summary = format_summary(get_metrics().summarize(since=self.publish_started_at, stage=STAGE_TISTORY))
+        if summary:
+            message += f"\n\n[단계별 소요 시간]\n{summary}"
+        QMessageBox.information(self, "발행 완료", message)
\ No newline at end of file
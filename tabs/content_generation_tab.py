@@ -1,13 +1,21 @@
 import os
-from datetime import datetime
+import time
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QTextEdit, QListWidget, QGroupBox, QMessageBox, QFileDialog,
-    QSplitter
+    QSplitter, QSpinBox, QCheckBox, QApplication
 )
-from PyQt5.QtCore import Qt
-from core.workers import ContentGenerateWorker
-from utils.utils import sanitize_filename
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QTextCursor
+from core.job_store import GenerationJobStore
+from core.content_generator import build_output_path
+from core.metrics import STAGE_GEMINI, format_summary, get_metrics
+from core.workers import ArticleWriterBridge, ContentGeneratePool
+from utils.utils import get_env_int
+
+# 동시 글 생성 수 (환경변수 CONTENT_CONCURRENCY로 기본값 지정)
+DEFAULT_CONCURRENCY = 3
+MAX_CONCURRENCY = 10
 
 
 class ContentGenerationTab(QWidget):
@@ -16,11 +24,23 @@ class ContentGenerationTab(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent = parent
-        self.selected_titles = []
-        self.current_title_index = 0
+        self.batch_jobs = []
         self.total_titles = 0
+        self.finished_count = 0
         self.generated_count = 0
-        self.batch_prompt = ""
+        self.save_failed_count = 0
+        self.content_pool = None
+        self.article_writer = None
+        self.job_store = GenerationJobStore()
+        # 비정상 종료로 생성 중 상태에 남은 작업은 대기 상태로 복구
+        self.job_store.recover_interrupted()
+        # 완료 순서와 무관하게 제목 순서대로 로그를 남기기 위한 버퍼
+        self.pending_logs = {}
+        self.next_log_index = 0
+        # 스트리밍 미리보기 상태
+        self.stream_buffers = {}
+        self.preview_index = None
+        self.batch_streaming = False
         self.init_ui()
     
     def init_ui(self):
@@ -193,8 +213,33 @@ class ContentGenerationTab(QWidget):
         """)
         save_layout.addWidget(self.browse_btn)
         
+        save_layout.addWidget(QLabel("동시 생성 수:"))
+        self.concurrency_spin = QSpinBox()
+        self.concurrency_spin.setRange(1, MAX_CONCURRENCY)
+        self.concurrency_spin.setValue(
+            get_env_int("CONTENT_CONCURRENCY", DEFAULT_CONCURRENCY, 1, MAX_CONCURRENCY)
+        )
+        self.concurrency_spin.setToolTip("동시에 요청할 글 개수 (환경변수 CONTENT_CONCURRENCY)")
+        save_layout.addWidget(self.concurrency_spin)
+        
+        self.stream_checkbox = QCheckBox("스트리밍 생성")
+        self.stream_checkbox.setChecked(True)
+        self.stream_checkbox.setToolTip("생성되는 내용을 바로 파일에 저장하고 미리보기에 표시")
+        save_layout.addWidget(self.stream_checkbox)
+        
         right_layout.addWidget(save_group)
         
+        # 실시간 미리보기
+        self.preview_group = QGroupBox("실시간 미리보기")
+        preview_layout = QVBoxLayout(self.preview_group)
+        
+        self.preview_text = QTextEdit()
+        self.preview_text.setReadOnly(True)
+        self.preview_text.setPlaceholderText("스트리밍 생성 시 작성 중인 글이 여기에 표시됩니다")
+        preview_layout.addWidget(self.preview_text)
+        
+        right_layout.addWidget(self.preview_group)
+        
         # 글 생성 버튼
         self.generate_content_btn = QPushButton("📝 선택된 제목들로 일괄 글 생성")
         self.generate_content_btn.clicked.connect(self.generate_multiple_contents)
@@ -221,8 +266,32 @@ class ContentGenerationTab(QWidget):
         """)
         right_layout.addWidget(self.generate_content_btn)
         
+        # 미완료 작업 재시도 버튼
+        self.retry_jobs_btn = QPushButton("🔁 미완료/실패 작업 다시 생성")
+        self.retry_jobs_btn.clicked.connect(self.retry_unfinished_jobs)
+        self.retry_jobs_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #ff9800;
+                color: white;
+                border: none;
+                padding: 8px 16px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #f57c00;
+            }
+            QPushButton:disabled {
+                background-color: #cccccc;
+                color: #666666;
+            }
+        """)
+        right_layout.addWidget(self.retry_jobs_btn)
+        
         splitter.addWidget(right_widget)
         layout.addWidget(splitter)
+        
+        # 이전 실행에서 끝나지 않은 작업이 있으면 창이 뜬 뒤 이어서 생성할지 확인
+        QTimer.singleShot(0, self.offer_resume)
     
     def sync_titles(self):
         """제목 목록 동기화"""
@@ -273,118 +342,262 @@ class ContentGenerationTab(QWidget):
             QMessageBox.warning(self, "경로 오류", "저장 경로를 선택하세요.")
             return
         
+        concurrency = self.concurrency_spin.value()
+        
         # 확인 메시지
+        estimated_seconds = -(-len(selected_items) // concurrency) * 30
         reply = QMessageBox.question(
             self, "일괄 생성 확인",
             f"{len(selected_items)}개의 제목으로 글을 생성하시겠습니까?\n\n"
-            f"예상 소요 시간: 약 {len(selected_items) * 30}초",
+            f"동시 생성 수: {concurrency}개\n"
+            f"예상 소요 시간: 약 {estimated_seconds}초",
             QMessageBox.Yes | QMessageBox.No
         )
         
         if reply != QMessageBox.Yes:
             return
         
-        # 선택된 제목들 저장
-        self.selected_titles = [item.text() for item in selected_items]
-        self.current_title_index = 0
-        self.total_titles = len(self.selected_titles)
-        self.generated_count = 0
-        
         prompt = self.prompt_input.toPlainText().strip()
 
         if not prompt:
             # 기본 프롬프트가 이미 설정되어 있으므로 다시 가져오기
             prompt = self.prompt_input.toPlainText().strip()
         
-        self.batch_prompt = prompt
+        # 작업 큐에 기록한 뒤 시작 (비정상 종료 시 이어서 생성 가능)
+        titles = [item.text() for item in selected_items]
+        jobs = self.job_store.create_batch(titles, prompt, save_path)
+        self.start_batch(jobs, api_key)
+    
+    def offer_resume(self):
+        """이전 실행에서 완료되지 않은 작업 이어서 생성 여부 확인"""
+        if self.is_batch_running():
+            return
+        
+        jobs = self.job_store.get_unfinished_jobs()
+        if not jobs:
+            return
+        
+        failed_count = sum(1 for job in jobs if job["status"] in ("failed", "save_failed"))
+        msg = QMessageBox(
+            QMessageBox.Question, "미완료 작업",
+            f"이전에 완료되지 않은 글 생성 작업이 {len(jobs)}개 있습니다."
+            f" (실패 {failed_count}개 포함)\n\n지금 이어서 생성하시겠습니까?\n"
+            "'아니오'를 선택하면 작업은 보관되며 나중에 다시 생성할 수 있습니다.\n"
+            "'삭제'를 선택하면 남은 작업을 모두 삭제합니다.",
+            QMessageBox.Yes | QMessageBox.No | QMessageBox.Discard,
+            self
+        )
+        # 기본 버튼 이름은 Qt 번역 설치 여부에 따라 달라지므로 안내 문구와 같은 이름으로 고정
+        msg.button(QMessageBox.Yes).setText("예")
+        msg.button(QMessageBox.No).setText("아니오")
+        msg.button(QMessageBox.Discard).setText("삭제")
+        reply = msg.exec_()
+        if reply == QMessageBox.Yes:
+            self.retry_unfinished_jobs()
+        elif reply == QMessageBox.Discard:
+            self.discard_unfinished_jobs(len(jobs))
+    
+    def discard_unfinished_jobs(self, job_count):
+        """완료되지 않은 작업 삭제 (한 번 더 확인)"""
+        reply = QMessageBox.question(
+            self, "미완료 작업 삭제",
+            f"완료되지 않은 작업 {job_count}개를 삭제하시겠습니까?\n(이미 저장된 글 파일은 삭제되지 않습니다)",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        if reply == QMessageBox.Yes:
+            self.job_store.discard_unfinished()
+            self.generation_log_text.append(f"🗑️ 미완료 작업 {job_count}개를 삭제했습니다.")
+    
+    def retry_unfinished_jobs(self):
+        """대기/실패 상태로 남은 작업만 다시 생성"""
+        if self.is_batch_running():
+            QMessageBox.warning(self, "진행 중", "글 생성이 진행 중입니다.")
+            return
+        
+        jobs = self.job_store.get_unfinished_jobs()
+        if not jobs:
+            QMessageBox.information(self, "미완료 작업", "다시 생성할 작업이 없습니다.")
+            return
+        
+        api_key = os.getenv("GEMINI_API_KEY") or self.parent.gemini_key_input.text().strip()
+        if not api_key:
+            QMessageBox.warning(self, "API 오류", "Gemini API 키를 입력하세요.")
+            return
+        
+        self.generation_log_text.append(f"=== 미완료 작업 {len(jobs)}개 다시 생성 ===")
+        self.start_batch(jobs, api_key)
+    
+    def is_batch_running(self):
+        """일괄 생성 진행 중 여부"""
+        return self.finished_count < self.total_titles
+    
+    def start_batch(self, jobs, api_key):
+        """작업 목록을 워커 풀에 등록"""
+        self.batch_jobs = jobs
+        self.total_titles = len(jobs)
+        self.finished_count = 0
+        self.generated_count = 0
+        self.save_failed_count = 0
+        self.pending_logs = {}
+        self.next_log_index = 0
+        self.stream_buffers = {}
+        self.preview_index = None
+        self.batch_started_at = time.time()
         
         # UI 비활성화
         self.generate_content_btn.setEnabled(False)
+        self.retry_jobs_btn.setEnabled(False)
+        self.concurrency_spin.setEnabled(False)
+        self.stream_checkbox.setEnabled(False)
         self.parent.progress_bar.setVisible(True)
         self.parent.progress_bar.setRange(0, self.total_titles)
         self.parent.progress_bar.setValue(0)
         
-        # 첫 번째 제목으로 시작
-        self.generate_next_content(api_key)
+        # 워커 풀에 모든 제목 등록
+        self.batch_streaming = self.stream_checkbox.isChecked()
+        used_paths = set()
+        pool = self.get_content_pool(self.concurrency_spin.value())
+        for index, job in enumerate(jobs):
+            job["output_path"] = self.build_output_path(job, used_paths)
+            pool.submit(
+                index, job["title"], job["prompt"], api_key,
+                stream_path=job["output_path"] if self.batch_streaming else None,
+            )
     
-    def generate_next_content(self, api_key):
-        """다음 제목으로 글 생성"""
-        if self.current_title_index >= len(self.selected_titles):
-            # 모든 글 생성 완료
-            self.on_batch_generation_completed()
-            return
-        
-        title = self.selected_titles[self.current_title_index]
-        
-        # 글 생성 워커 시작
-        self.content_worker = ContentGenerateWorker(title, self.batch_prompt, api_key)
-        self.content_worker.content_generated.connect(self.on_batch_content_generated)
-        self.content_worker.generation_failed.connect(self.on_batch_content_failed)
-        self.content_worker.progress.connect(self.parent.update_status)
-        self.content_worker.start()
+    def build_output_path(self, job, used_paths):
+        """저장 파일 경로 생성 (같은 배치 안에서 겹치지 않도록)"""
+        return build_output_path(job["title"], job["save_path"], used_paths)
     
-    def on_batch_content_generated(self, title, content):
-        """일괄 생성 중 개별 글 생성 완료"""
-        try:
-            # 파일 저장
-            safe_title = sanitize_filename(title)
-            filename = f"{safe_title}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-            
-            save_path = self.save_path_input.text()
-            full_path = os.path.join(save_path, filename)
-            
-            with open(full_path, "w", encoding="utf-8") as f:
-                f.write(f"제목: {title}\n")
-                f.write(f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write("=" * 50 + "\n\n")
-                f.write(content)
-            
-            # 진행 상황 업데이트
-            self.generated_count += 1
-            self.current_title_index += 1
-            self.parent.progress_bar.setValue(self.generated_count)
-            
-            # 로그 추가
-            self.generation_log_text.append(
-                f"[{self.generated_count}/{self.total_titles}] {title} - 완료"
-            )
-            
-            # 다음 제목으로 진행
-            api_key = os.getenv("GEMINI_API_KEY") or self.parent.gemini_key_input.text().strip()
-            self.generate_next_content(api_key)
-            
-        except Exception as e:
-            self.on_batch_content_failed(f"파일 저장 오류: {str(e)}")
+    def get_content_pool(self, concurrency):
+        """글 생성 워커 풀 반환 (스레드는 배치 간에 재사용)"""
+        if self.content_pool is None:
+            self.content_pool = ContentGeneratePool(concurrency, self)
+            self.content_pool.job_started.connect(self.on_batch_content_started)
+            self.content_pool.chunk_received.connect(self.on_batch_content_chunk)
+            self.content_pool.job_completed.connect(self.on_batch_content_generated)
+            self.content_pool.job_failed.connect(self.on_batch_content_failed)
+            self.content_pool.progress.connect(self.parent.update_status)
+        else:
+            self.content_pool.resize(concurrency)
+        return self.content_pool
+    
+    def get_article_writer(self):
+        """백그라운드 글 저장 큐 반환"""
+        if self.article_writer is None:
+            self.article_writer = ArticleWriterBridge(self)
+            self.article_writer.write_completed.connect(self.on_article_saved)
+            self.article_writer.write_failed.connect(self.on_article_save_failed)
+        return self.article_writer
+    
+    def shutdown(self):
+        """워커 풀 종료 (저장 대기 중인 글은 모두 저장한 뒤 종료)"""
+        if self.content_pool is not None:
+            self.content_pool.shutdown()
+            self.content_pool = None
+        if self.article_writer is not None:
+            self.article_writer.shutdown()
+            # 저장 결과(작업 완료 기록)를 작업 저장소를 닫기 전에 처리
+            QApplication.processEvents()
+            self.article_writer = None
+        self.job_store.close()
+    
+    def on_batch_content_started(self, index):
+        """개별 작업 시작"""
+        self.job_store.mark_running(self.batch_jobs[index]["id"])
+    
+    def on_batch_content_chunk(self, index, text):
+        """스트리밍 조각 수신 - 미리보기 갱신"""
+        self.stream_buffers.setdefault(index, []).append(text)
+        
+        if self.preview_index is None:
+            # 미리보기 중인 글이 없으면 지금 작성 중인 글로 전환
+            self.preview_index = index
+            self.preview_group.setTitle(f"실시간 미리보기 - {self.batch_jobs[index]['title']}")
+            self.preview_text.setPlainText("".join(self.stream_buffers[index]))
+        elif self.preview_index == index:
+            self.preview_text.moveCursor(QTextCursor.End)
+            self.preview_text.insertPlainText(text)
+    
+    def on_batch_content_generated(self, index, title, content, usage):
+        """일괄 생성 중 개별 글 생성 완료 - 파일 저장은 백그라운드 쓰기 큐에 맡김"""
+        full_path = self.batch_jobs[index]["output_path"]
+        # 스트리밍 모드에서 받은 내용을 기록한 .part 파일은 저장에 성공하면 삭제
+        discard_path = f"{full_path}.part" if self.batch_streaming else None
+        self.get_article_writer().submit(index, full_path, title, content, usage, discard_path)
+    
+    def on_article_saved(self, index, full_path):
+        """글 파일 저장 완료"""
+        self.job_store.mark_done(self.batch_jobs[index]["id"], full_path)
+        self.generated_count += 1
+        self.on_batch_job_finished(index, f"{self.batch_jobs[index]['title']} - 완료")
     
-    def on_batch_content_failed(self, error_msg):
+    def on_article_save_failed(self, index, error_msg):
+        """글은 생성되었지만 파일 저장 실패 (생성 실패와 구분해 작업 상태에 기록)"""
+        self.job_store.mark_save_failed(self.batch_jobs[index]["id"], error_msg)
+        self.save_failed_count += 1
+        self.on_batch_job_finished(index, f"{self.batch_jobs[index]['title']} - 생성 완료, 저장 실패: {error_msg}")
+    
+    def on_batch_content_failed(self, index, title, error_msg):
         """일괄 생성 중 개별 글 생성 실패"""
-        title = self.selected_titles[self.current_title_index]
-        self.generation_log_text.append(
-            f"[{self.current_title_index + 1}/{self.total_titles}] {title} - 실패: {error_msg}"
-        )
-        
-        # 실패해도 다음으로 진행
-        self.current_title_index += 1
-        self.parent.progress_bar.setValue(self.current_title_index)
-        
-        api_key = os.getenv("GEMINI_API_KEY") or self.parent.gemini_key_input.text().strip()
-        self.generate_next_content(api_key)
+        # 실패한 작업은 작업 큐에 남겨 두고 나머지 작업은 계속 진행
+        self.job_store.mark_failed(self.batch_jobs[index]["id"], error_msg)
+        partial_path = f"{self.batch_jobs[index]['output_path']}.part"
+        if self.batch_streaming and os.path.exists(partial_path):
+            error_msg += f" (받은 내용까지 {partial_path}에 저장됨)"
+        self.on_batch_job_finished(index, f"{title} - 실패: {error_msg}")
+    
+    def on_batch_job_finished(self, index, log_message):
+        """개별 작업 종료 시 진행 상황 갱신 및 제목 순서대로 로그 출력"""
+        self.stream_buffers.pop(index, None)
+        if self.preview_index == index:
+            # 다음에 도착하는 조각의 글로 미리보기 전환
+            self.preview_index = None
+        
+        self.finished_count += 1
+        self.parent.progress_bar.setValue(self.finished_count)
+        self.parent.update_status(f"글 생성 진행: {self.finished_count}/{self.total_titles}")
+        
+        self.pending_logs[index] = log_message
+        while self.next_log_index in self.pending_logs:
+            message = self.pending_logs.pop(self.next_log_index)
+            self.next_log_index += 1
+            self.generation_log_text.append(f"[{self.next_log_index}/{self.total_titles}] {message}")
+        
+        if self.finished_count >= self.total_titles:
+            # 모든 글 생성 완료
+            self.on_batch_generation_completed()
     
     def on_batch_generation_completed(self):
         """일괄 생성 완료"""
-        self.generate_content_btn.setEnabled(True)
+        self.generate_content_btn.setEnabled(self.content_titles_list.count() > 0)
+        self.retry_jobs_btn.setEnabled(True)
+        self.concurrency_spin.setEnabled(True)
+        self.stream_checkbox.setEnabled(True)
         self.parent.progress_bar.setVisible(False)
         
         success_count = self.generated_count
         total_count = self.total_titles
         
         self.generation_log_text.append(f"=== 일괄 생성 완료 ===")
-        self.generation_log_text.append(f"성공: {success_count}개, 실패: {total_count - success_count}개")
+        failed_count = total_count - success_count - self.save_failed_count
+        result_line = f"성공: {success_count}개, 실패: {failed_count}개"
+        if self.save_failed_count:
+            result_line += f", 저장 실패: {self.save_failed_count}개"
+        self.generation_log_text.append(result_line)
         self.generation_log_text.append("")
         
         self.parent.update_status(f"일괄 생성 완료: {success_count}/{total_count}개 성공")
         
-        QMessageBox.information(
-            self, "일괄 생성 완료",
-            f"총 {total_count}개 중 {success_count}개의 글이 성공적으로 생성되었습니다!"
-        )
\ No newline at end of file
+        message = f"총 {total_count}개 중 {success_count}개의 글이 성공적으로 생성되었습니다!"
+        if self.save_failed_count:
+            message += f"\n\n{self.save_failed_count}개의 글은 생성되었지만 파일로 저장하지 못했습니다. 로그에서 복구용 사본 위치를 확인하세요."
+        if success_count < total_count:
+            message += "\n\n실패한 제목은 작업 큐에 남아 있으며 '미완료/실패 작업 다시 생성'으로 재시도할 수 있습니다."
+        
+        # 이번 배치의 Gemini 호출 소요 시간/토큰 요약
+        summary = format_summary(get_metrics().summarize(since=self.batch_started_at, stage=STAGE_GEMINI))
+        if summary:
+            self.generation_log_text.append(f"[호출 지표]\n{summary}\n")
+            message += f"\n\n[호출 지표]\n{summary}"
+        QMessageBox.information(self, "일괄 생성 완료", message)
\ No newline at end of file
@@ -0,0 +1,265 @@
+"""
+    탭 목록/표 모델 모듈
+
+    행마다 위젯을 만들지 않도록 QAbstractTableModel로 데이터를 두고, 편집기는 델리게이트가 편집할 때만 만듭니다.
+    파일 이름 -> 행 번호 색인을 함께 관리하므로 발행 상태 갱신은 행 수와 관계없이 한 칸만 다시 그립니다.
+    검색 결과 목록은 체크 상태를 비트맵과 선택 개수로 관리해 개수 표시와 전체 선택/해제에 목록을 다시 훑지 않습니다.
+"""
+
+from PyQt5.QtCore import QAbstractListModel, QAbstractTableModel, QDateTime, QEvent, QModelIndex, QRect, Qt, pyqtSignal
+from PyQt5.QtGui import QColor, QPainter
+from PyQt5.QtWidgets import QDateTimeEdit, QStyledItemDelegate
+
+SCHEDULE_FORMAT = "yyyy-MM-dd hh:mm"
+
+
+class PublishFileTableModel(QAbstractTableModel):
+    """발행할 파일 목록 (파일명, 예약 시간, 상태, 삭제)"""
+
+    COLUMN_FILE = 0
+    COLUMN_SCHEDULE = 1
+    COLUMN_STATUS = 2
+    COLUMN_DELETE = 3
+    HEADERS = ["파일명", "예약 시간", "상태", "삭제"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+        self.row_by_file = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.rows[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == self.COLUMN_FILE:
+                return row["file"]
+            if column == self.COLUMN_SCHEDULE:
+                return row["schedule"].toString(SCHEDULE_FORMAT)
+            if column == self.COLUMN_STATUS:
+                return row["status"]
+            if column == self.COLUMN_DELETE:
+                return "🗑️"
+        elif role == Qt.EditRole and column == self.COLUMN_SCHEDULE:
+            return row["schedule"]
+        elif role == Qt.UserRole and column == self.COLUMN_FILE:
+            return row["path"]
+        elif role == Qt.ToolTipRole and column == self.COLUMN_FILE:
+            tooltip = row["title"]
+            if row["keyword"]:
+                tooltip += f"\n키워드: {row['keyword']}"
+            return tooltip
+        elif role == Qt.TextAlignmentRole and column != self.COLUMN_FILE:
+            return Qt.AlignCenter
+        return None
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and index.column() == self.COLUMN_SCHEDULE:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or index.column() != self.COLUMN_SCHEDULE or role != Qt.EditRole:
+            return False
+        self.rows[index.row()]["schedule"] = QDateTime(value)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def set_articles(self, articles, start_time, interval_secs):
+        """글 목록으로 교체 (예약 시간은 start_time부터 interval_secs 간격)"""
+        self.beginResetModel()
+        self.rows = [
+            {
+                "file": article["file"],
+                "path": article["path"],
+                "title": article.get("title") or article["file"],
+                "keyword": article.get("keyword") or "",
+                "schedule": start_time.addSecs(row * interval_secs),
+                "status": "대기",
+            }
+            for row, article in enumerate(articles)
+        ]
+        self.row_by_file = {row["file"]: i for i, row in enumerate(self.rows)}
+        self.endResetModel()
+
+    def clear(self):
+        self.set_articles([], QDateTime.currentDateTime(), 0)
+
+    def file_at(self, row):
+        return self.rows[row]["file"]
+
+    def remove_file_row(self, row):
+        """행 삭제 (뒤쪽 행의 색인만 한 칸씩 당김)"""
+        if not 0 <= row < len(self.rows):
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.row_by_file[self.rows.pop(row)["file"]]
+        for i in range(row, len(self.rows)):
+            self.row_by_file[self.rows[i]["file"]] = i
+        self.endRemoveRows()
+
+    def set_status(self, filename, status):
+        """파일 이름으로 상태 변경 (해당 칸만 다시 그림)"""
+        row = self.row_by_file.get(filename)
+        if row is None:
+            return
+        self.rows[row]["status"] = status
+        index = self.index(row, self.COLUMN_STATUS)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def set_all_status(self, status):
+        if not self.rows:
+            return
+        for row in self.rows:
+            row["status"] = status
+        self.dataChanged.emit(
+            self.index(0, self.COLUMN_STATUS), self.index(len(self.rows) - 1, self.COLUMN_STATUS), [Qt.DisplayRole]
+        )
+
+    def schedules(self):
+        """(파일 경로, 파일 이름, 예약 시간) 목록"""
+        return [(row["path"], row["file"], row["schedule"]) for row in self.rows]
+
+
+class ScheduleDelegate(QStyledItemDelegate):
+    """예약 시간 편집기 (편집을 시작할 때만 QDateTimeEdit 생성)"""
+
+    def createEditor(self, parent, option, index):
+        editor = QDateTimeEdit(parent)
+        editor.setCalendarPopup(True)
+        editor.setDisplayFormat(SCHEDULE_FORMAT)
+        editor.setStyleSheet("""
+            QDateTimeEdit {
+                padding: 2px;
+                font-size: 12px;
+                border: 2px solid #2196f3;
+                border-radius: 4px;
+            }
+        """)
+        return editor
+
+    def setEditorData(self, editor, index):
+        editor.setDateTime(index.data(Qt.EditRole))
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.dateTime(), Qt.EditRole)
+
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(option.rect)
+
+
+class DeleteButtonDelegate(QStyledItemDelegate):
+    """삭제 버튼 모양을 그리기만 하고 클릭하면 delete_requested(행) 발생"""
+
+    delete_requested = pyqtSignal(int)
+
+    def paint(self, painter, option, index):
+        rect = QRect(option.rect).adjusted(6, 4, -6, -4)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor("#f44336"))
+        painter.drawRoundedRect(rect, 4, 4)
+        painter.setPen(QColor("white"))
+        painter.drawText(rect, Qt.AlignCenter, index.data(Qt.DisplayRole))
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            if option.rect.contains(event.pos()):
+                self.delete_requested.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+class SearchResultListModel(QAbstractListModel):
+    """체크할 수 있는 검색 결과 목록 (선택 개수가 바뀌면 checked_count_changed 발생)"""
+
+    checked_count_changed = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.posts = []
+        self.checked = bytearray()
+        self.checked_count = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.posts)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        post = self.posts[row]
+
+        if role == Qt.DisplayRole:
+            text = f"{row + 1:2d}. {post['title']}"
+            if post.get("cluster_size", 1) > 1:
+                text += f"  (유사 글 {post['cluster_size']}개)"
+            return text
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self.checked[row] else Qt.Unchecked
+        if role == Qt.ToolTipRole:
+            tooltip = (
+                f"블로거: {post['bloggername']}\n날짜: {post['postdate']}\n"
+                f"내용: {post['description'][:200]}...\n링크: {post['link']}"
+            )
+            if post.get("cluster_size", 1) > 1:
+                tooltip += "\n\n묶인 유사 글:\n" + "\n".join(
+                    f"- {duplicate['title']} ({duplicate['bloggername']})" for duplicate in post["duplicates"]
+                )
+            return tooltip
+        return None
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid():
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.CheckStateRole:
+            return False
+        row = index.row()
+        checked = 1 if value == Qt.Checked else 0
+        if self.checked[row] != checked:
+            self.checked[row] = checked
+            self.checked_count += 1 if checked else -1
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+            self.checked_count_changed.emit(self.checked_count)
+        return True
+
+    def set_posts(self, posts, checked=True):
+        """목록 교체 (기본적으로 모두 선택)"""
+        self.beginResetModel()
+        self.posts = list(posts)
+        self.checked = bytearray([1 if checked else 0]) * len(self.posts)
+        self.checked_count = len(self.posts) if checked else 0
+        self.endResetModel()
+        self.checked_count_changed.emit(self.checked_count)
+
+    def set_all_checked(self, checked):
+        """전체 선택/해제 (알림은 전체 범위에 한 번만)"""
+        if not self.posts:
+            return
+        self.checked = bytearray([1 if checked else 0]) * len(self.posts)
+        self.checked_count = len(self.posts) if checked else 0
+        self.dataChanged.emit(self.index(0), self.index(len(self.posts) - 1), [Qt.CheckStateRole])
+        self.checked_count_changed.emit(self.checked_count)
+
+    def checked_posts(self):
+        return [post for post, checked in zip(self.posts, self.checked) if checked]
\ No newline at end of file
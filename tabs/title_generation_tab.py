@@ -1,11 +1,22 @@
 import os
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
-    QListWidget, QListWidgetItem, QSpinBox, QGroupBox, QMessageBox,
-    QSplitter, QInputDialog, QCheckBox
+    QListWidget, QListWidgetItem, QListView, QSpinBox, QGroupBox, QMessageBox,
+    QSplitter, QInputDialog, QCheckBox, QTextEdit, QFileDialog
 )
-from PyQt5.QtCore import Qt
-from core.workers import NaverSearchWorker, TitleGenerateWorker
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QColor
+from core.context_packer import DEFAULT_TOKEN_BUDGET, estimate_cost, pack_posts
+from core.dedup import collapse_near_duplicates
+from core.naver_search import MAX_RESULTS, get_quota_limiter
+from core.title_generator import DEFAULT_BATCH_KEYWORDS, build_title_prompt
+from core.title_history import SOURCE_GENERATED, SOURCE_PUBLISHED, get_title_history
+from core.workers import NaverSearchWorker, NaverBatchSearchWorker, TitleGenerateWorker, BatchTitleGenerateWorker
+from tabs.models import SearchResultListModel
+from utils.utils import estimate_tokens, get_env_int
+
+# 생성할 제목 하나당 예상 응답 토큰 수 (비용 추정용)
+OUTPUT_TOKENS_PER_TITLE = 40
 
 
 class TitleGenerationTab(QWidget):
@@ -15,7 +26,13 @@ class TitleGenerationTab(QWidget):
         super().__init__(parent)
         self.parent = parent
         self.blog_posts = []
+        self.raw_blog_posts = []  # 유사 글 묶기 전 검색 결과
+        self.current_keyword = ""
+        self.keyword_results = {}  # 일괄 검색 결과 (키워드 -> 블로그 글 목록)
         self.generated_titles = []
+        self.title_streaming = False
+        self.title_history = get_title_history()
+        self.skipped_title_count = 0
         self.init_ui()
     
     def init_ui(self):
@@ -31,6 +48,14 @@ class TitleGenerationTab(QWidget):
         self.keyword_input.setPlaceholderText("검색할 키워드를 입력하세요")
         search_layout.addWidget(self.keyword_input)
         
+        search_layout.addWidget(QLabel("검색 개수:"))
+        self.search_count_spin = QSpinBox()
+        self.search_count_spin.setRange(10, MAX_RESULTS)
+        self.search_count_spin.setSingleStep(10)
+        self.search_count_spin.setValue(20)
+        self.search_count_spin.setToolTip(f"가져올 블로그 글 수 (최대 {MAX_RESULTS}개)")
+        search_layout.addWidget(self.search_count_spin)
+        
         self.search_btn = QPushButton("🔍 검색")
         self.search_btn.clicked.connect(self.search_blogs)
         self.search_btn.setStyleSheet("""
@@ -51,8 +76,100 @@ class TitleGenerationTab(QWidget):
         """)
         search_layout.addWidget(self.search_btn)
         
+        self.force_refresh_checkbox = QCheckBox("새로 검색")
+        self.force_refresh_checkbox.setToolTip("저장된 검색 결과(캐시)를 무시하고 네이버 API로 다시 검색")
+        search_layout.addWidget(self.force_refresh_checkbox)
+        
+        self.cache_status_label = QLabel("")
+        self.cache_status_label.setStyleSheet("color: #4caf50; font-weight: bold;")
+        search_layout.addWidget(self.cache_status_label)
+        
         layout.addWidget(search_group)
         
+        # 키워드 일괄 검색
+        batch_group = QGroupBox("키워드 일괄 검색")
+        batch_layout = QHBoxLayout(batch_group)
+        
+        self.batch_keywords_input = QTextEdit()
+        self.batch_keywords_input.setPlaceholderText("한 줄에 키워드 하나씩 입력하거나 파일에서 불러오세요")
+        self.batch_keywords_input.setMaximumHeight(90)
+        batch_layout.addWidget(self.batch_keywords_input, 2)
+        
+        batch_btn_layout = QVBoxLayout()
+        self.load_keywords_btn = QPushButton("📂 파일 불러오기")
+        self.load_keywords_btn.clicked.connect(self.load_keywords_file)
+        self.load_keywords_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #607d8b;
+                color: white;
+                border: none;
+                padding: 6px 12px;
+                font-weight: bold;
+                font-size: 12px;
+            }
+            QPushButton:hover {
+                background-color: #455a64;
+            }
+        """)
+        batch_btn_layout.addWidget(self.load_keywords_btn)
+        
+        self.batch_search_btn = QPushButton("🔍 일괄 검색")
+        self.batch_search_btn.clicked.connect(self.batch_search_blogs)
+        self.batch_search_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #2196f3;
+                color: white;
+                border: none;
+                padding: 6px 12px;
+                font-weight: bold;
+                font-size: 12px;
+            }
+            QPushButton:hover {
+                background-color: #1976d2;
+            }
+            QPushButton:disabled {
+                background-color: #bbbbbb;
+            }
+        """)
+        batch_btn_layout.addWidget(self.batch_search_btn)
+        
+        self.batch_titles_btn = QPushButton("✨ 키워드별 제목 생성")
+        self.batch_titles_btn.clicked.connect(self.generate_batch_titles)
+        self.batch_titles_btn.setEnabled(False)
+        self.batch_titles_btn.setToolTip("일괄 검색한 키워드마다 제목을 생성합니다 (여러 키워드를 한 요청으로 묶어 처리)")
+        self.batch_titles_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #ff9800;
+                color: white;
+                border: none;
+                padding: 6px 12px;
+                font-weight: bold;
+                font-size: 12px;
+            }
+            QPushButton:hover {
+                background-color: #f57c00;
+            }
+            QPushButton:disabled {
+                background-color: #bbbbbb;
+            }
+        """)
+        batch_btn_layout.addWidget(self.batch_titles_btn)
+        
+        self.quota_label = QLabel("")
+        self.quota_label.setStyleSheet("color: #666; font-size: 11px;")
+        batch_btn_layout.addWidget(self.quota_label)
+        batch_layout.addLayout(batch_btn_layout)
+        
+        # 키워드별 결과 (클릭하면 해당 키워드의 검색 결과 표시)
+        self.batch_keyword_list = QListWidget()
+        self.batch_keyword_list.setMaximumHeight(90)
+        self.batch_keyword_list.setToolTip("키워드를 클릭하면 검색 결과를 아래 목록에 표시합니다")
+        self.batch_keyword_list.itemClicked.connect(self.on_batch_keyword_clicked)
+        batch_layout.addWidget(self.batch_keyword_list, 3)
+        
+        layout.addWidget(batch_group)
+        self.update_quota_label()
+        
         # 수평 분할
         splitter = QSplitter(Qt.Horizontal)
         
@@ -109,35 +226,44 @@ class TitleGenerationTab(QWidget):
         select_btn_layout.addWidget(self.deselect_all_btn)
         select_btn_layout.addStretch()
         
+        self.dedup_checkbox = QCheckBox("유사 글 묶기")
+        self.dedup_checkbox.setChecked(True)
+        self.dedup_checkbox.setToolTip("제목과 내용이 거의 같은 글(재게시, 일부 수정 글)을 하나로 묶어 프롬프트 중복을 줄임")
+        self.dedup_checkbox.toggled.connect(lambda: self.show_search_results(self.raw_blog_posts))
+        select_btn_layout.addWidget(self.dedup_checkbox)
+        
         selected_count_label = QLabel("선택된 글: 0개")
         self.selected_count_label = selected_count_label
         select_btn_layout.addWidget(selected_count_label)
         
         search_result_layout.addLayout(select_btn_layout)
         
-        self.search_result_list = QListWidget()
+        # 체크 상태와 선택 개수는 모델이 관리 (체크할 때마다 목록 전체를 다시 세지 않음)
+        self.search_result_model = SearchResultListModel(self)
+        self.search_result_model.checked_count_changed.connect(self.update_selected_count)
+        self.search_result_list = QListView()
+        self.search_result_list.setModel(self.search_result_model)
+        self.search_result_list.setUniformItemSizes(True)
         self.search_result_list.setStyleSheet("""
-            QListWidget {
+            QListView {
                 border: 1px solid #ddd;
                 border-radius: 4px;
                 background-color: white;
                 alternate-background-color: #f8f9fa;
             }
-            QListWidget::item {
+            QListView::item {
                 padding: 8px;
                 border-bottom: 1px solid #eee;
             }
-            QListWidget::item:hover {
+            QListView::item:hover {
                 background-color: #e3f2fd;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #2196f3;
                 color: white;
             }
         """)
         self.search_result_list.setAlternatingRowColors(True)
-        # 체크박스 상태 변경 시 선택된 항목 개수 업데이트
-        self.search_result_list.itemChanged.connect(self.update_selected_count)
         search_result_layout.addWidget(self.search_result_list)
         
         left_layout.addWidget(search_result_group)
@@ -180,7 +306,67 @@ class TitleGenerationTab(QWidget):
         """)
         count_layout.addWidget(self.generate_titles_btn)
         
+        self.cancel_titles_btn = QPushButton("⏹ 중지")
+        self.cancel_titles_btn.clicked.connect(self.cancel_title_generation)
+        self.cancel_titles_btn.setEnabled(False)
+        self.cancel_titles_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #f44336;
+                color: white;
+                border: none;
+                padding: 10px 14px;
+                font-weight: bold;
+                font-size: 13px;
+            }
+            QPushButton:hover {
+                background-color: #d32f2f;
+            }
+            QPushButton:disabled {
+                background-color: #bbbbbb;
+            }
+        """)
+        count_layout.addWidget(self.cancel_titles_btn)
+        
         title_gen_layout.addLayout(count_layout)
+
+        # 프롬프트에 넣을 블로그 글 요약의 토큰 예산
+        budget_layout = QHBoxLayout()
+        budget_layout.addWidget(QLabel("컨텍스트 토큰 예산:"))
+        self.token_budget_spin = QSpinBox()
+        self.token_budget_spin.setRange(500, 200000)
+        self.token_budget_spin.setSingleStep(500)
+        self.token_budget_spin.setValue(
+            get_env_int("TITLE_CONTEXT_TOKENS", DEFAULT_TOKEN_BUDGET, minimum=500, maximum=200000)
+        )
+        self.token_budget_spin.valueChanged.connect(self.schedule_prompt_estimate)
+        self.title_count_spin.valueChanged.connect(self.schedule_prompt_estimate)
+        budget_layout.addWidget(self.token_budget_spin)
+        budget_layout.addStretch()
+        
+        self.stream_titles_checkbox = QCheckBox("실시간 표시")
+        self.stream_titles_checkbox.setChecked(True)
+        self.stream_titles_checkbox.setToolTip("생성되는 제목을 받는 대로 목록에 추가 (중지 가능)")
+        budget_layout.addWidget(self.stream_titles_checkbox)
+        
+        self.skip_used_titles_checkbox = QCheckBox("사용했던 제목 제외")
+        self.skip_used_titles_checkbox.setChecked(True)
+        self.skip_used_titles_checkbox.setToolTip(
+            "예전에 생성하거나 발행한 제목과 거의 같은 제목은 목록에 추가하지 않습니다\n"
+            "(해제하면 목록에 추가하고 주황색으로 표시)"
+        )
+        budget_layout.addWidget(self.skip_used_titles_checkbox)
+        title_gen_layout.addLayout(budget_layout)
+
+        self.prompt_estimate_label = QLabel("예상 프롬프트: -")
+        self.prompt_estimate_label.setStyleSheet("color: #666666;")
+        title_gen_layout.addWidget(self.prompt_estimate_label)
+
+        # 체크 상태가 연속으로 바뀔 때 한 번만 다시 계산
+        self.estimate_timer = QTimer(self)
+        self.estimate_timer.setSingleShot(True)
+        self.estimate_timer.setInterval(200)
+        self.estimate_timer.timeout.connect(self.update_prompt_estimate)
+
         right_layout.addWidget(title_gen_group)
         
         # 생성된 제목 리스트
@@ -263,11 +449,17 @@ class TitleGenerationTab(QWidget):
             return
         
         self.search_btn.setEnabled(False)
+        self.cache_status_label.setText("")
         self.parent.progress_bar.setVisible(True)
         self.parent.progress_bar.setRange(0, 0)
         
         # 검색 워커 시작
-        self.search_worker = NaverSearchWorker(keyword, client_id, client_secret)
+        self.search_worker = NaverSearchWorker(
+            keyword, client_id, client_secret,
+            total_count=self.search_count_spin.value(),
+            force_refresh=self.force_refresh_checkbox.isChecked(),
+        )
+        self.search_worker.cache_status.connect(self.on_search_cache_status)
         self.search_worker.search_completed.connect(self.on_search_completed)
         self.search_worker.search_failed.connect(self.on_search_failed)
         self.search_worker.progress.connect(self.parent.update_status)
@@ -275,34 +467,150 @@ class TitleGenerationTab(QWidget):
     
     def on_search_completed(self, blog_posts):
         """검색 완료 처리"""
-        self.blog_posts = blog_posts
+        self.current_keyword = self.search_worker.keyword
         self.search_btn.setEnabled(True)
-        self.generate_titles_btn.setEnabled(True)
         self.parent.progress_bar.setVisible(False)
+        self.update_quota_label()
+        
+        self.show_search_results(blog_posts)
+        
+        status = f"검색 완료: {len(blog_posts)}개 블로그 글 발견"
+        if len(self.blog_posts) < len(blog_posts):
+            status += f" (유사 글을 묶어 {len(self.blog_posts)}개 표시)"
+        self.parent.update_status(status)
+    
+    def show_search_results(self, blog_posts):
+        """검색 결과를 리스트로 표시 (유사 글 묶기를 사용하면 묶음마다 대표 글 하나만 표시)"""
+        self.raw_blog_posts = blog_posts
+        if self.dedup_checkbox.isChecked():
+            blog_posts = collapse_near_duplicates(blog_posts)
+        self.blog_posts = blog_posts
+        self.generate_titles_btn.setEnabled(bool(blog_posts))
         
-        # 검색 결과를 리스트로 표시
-        self.search_result_list.clear()
-        
-        for i, post in enumerate(blog_posts, 1):
-            item_text = f"{i:2d}. {post['title']}"
-            item = QListWidgetItem(item_text)
-            tooltip = f"블로거: {post['bloggername']}\n날짜: {post['postdate']}\n내용: {post['description'][:200]}...\n링크: {post['link']}"
-            item.setToolTip(tooltip)
-            
-            # 체크박스 기능 추가
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-            item.setCheckState(Qt.Checked)  # 기본적으로 모든 항목 선택
-            
-            self.search_result_list.addItem(item)
+        # 기본적으로 모든 항목 선택 (표시 문자열과 툴팁은 화면에 보일 때 모델에서 생성)
+        self.search_result_model.set_posts(blog_posts)
         
         # 선택 버튼들 활성화
         self.select_all_btn.setEnabled(True)
         self.deselect_all_btn.setEnabled(True)
+    
+    def update_quota_label(self):
+        """네이버 API 오늘 남은 호출 수 표시"""
+        limiter = get_quota_limiter()
+        self.quota_label.setText(f"오늘 남은 호출: {limiter.remaining()}/{limiter.daily_limit}")
+    
+    def load_keywords_file(self):
+        """키워드 목록 파일 불러오기 (한 줄에 키워드 하나)"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "키워드 파일 선택", "", "텍스트 파일 (*.txt *.csv);;모든 파일 (*)"
+        )
+        if not file_path:
+            return
+        try:
+            with open(file_path, "r", encoding="utf-8-sig") as f:
+                keywords = f.read().strip()
+        except Exception as e:
+            QMessageBox.critical(self, "파일 오류", f"키워드 파일을 읽을 수 없습니다: {str(e)}")
+            return
         
-        # 선택된 항목 개수 업데이트
-        self.update_selected_count()
+        current = self.batch_keywords_input.toPlainText().strip()
+        self.batch_keywords_input.setPlainText(f"{current}\n{keywords}" if current else keywords)
+    
+    def get_batch_keywords(self):
+        """입력된 키워드 목록 (빈 줄, 중복 제외)"""
+        keywords = []
+        for line in self.batch_keywords_input.toPlainText().splitlines():
+            keyword = line.strip().strip(",")
+            if keyword and keyword not in keywords:
+                keywords.append(keyword)
+        return keywords
+    
+    def batch_search_blogs(self):
+        """여러 키워드 일괄 검색"""
+        keywords = self.get_batch_keywords()
         
-        self.parent.update_status(f"검색 완료: {len(blog_posts)}개 블로그 글 발견")
+        client_id = os.getenv("NAVER_CLIENT_ID") or self.parent.naver_id_input.text().strip()
+        client_secret = os.getenv("NAVER_CLIENT_SECRET") or self.parent.naver_secret_input.text().strip()
+        
+        if not keywords:
+            QMessageBox.warning(self, "입력 오류", "일괄 검색할 키워드를 입력하세요.")
+            return
+        
+        if not client_id or not client_secret:
+            QMessageBox.warning(self, "API 오류", "네이버 API 정보를 입력하거나 .env 파일에 설정하세요.")
+            return
+        
+        self.keyword_results = {}
+        self.batch_keyword_list.clear()
+        self.batch_search_btn.setEnabled(False)
+        self.parent.progress_bar.setVisible(True)
+        self.parent.progress_bar.setRange(0, len(keywords))
+        self.parent.progress_bar.setValue(0)
+        
+        self.batch_search_worker = NaverBatchSearchWorker(
+            keywords, client_id, client_secret,
+            total_count=self.search_count_spin.value(),
+            force_refresh=self.force_refresh_checkbox.isChecked(),
+        )
+        self.batch_search_worker.keyword_completed.connect(self.on_keyword_search_completed)
+        self.batch_search_worker.keyword_failed.connect(self.on_keyword_search_failed)
+        self.batch_search_worker.progress.connect(self.parent.update_status)
+        self.batch_search_worker.all_completed.connect(self.on_batch_search_finished)
+        self.batch_search_worker.start()
+    
+    def on_keyword_search_completed(self, keyword, blog_posts):
+        """키워드 하나의 일괄 검색 완료"""
+        self.keyword_results[keyword] = blog_posts
+        
+        item = QListWidgetItem(f"{keyword} ({len(blog_posts)}개)")
+        item.setData(Qt.UserRole, keyword)
+        self.batch_keyword_list.addItem(item)
+        self.parent.progress_bar.setValue(self.parent.progress_bar.value() + 1)
+        self.update_quota_label()
+        
+        # 첫 결과는 바로 표시
+        if len(self.keyword_results) == 1:
+            self.batch_keyword_list.setCurrentItem(item)
+            self.on_batch_keyword_clicked(item)
+    
+    def on_keyword_search_failed(self, keyword, error_msg):
+        """키워드 하나의 일괄 검색 실패"""
+        item = QListWidgetItem(f"❌ {keyword} - {error_msg}")
+        item.setForeground(QColor("#d32f2f"))
+        self.batch_keyword_list.addItem(item)
+        self.parent.progress_bar.setValue(self.parent.progress_bar.value() + 1)
+    
+    def on_batch_search_finished(self):
+        """일괄 검색 완료"""
+        self.batch_search_btn.setEnabled(True)
+        self.batch_titles_btn.setEnabled(bool(self.keyword_results))
+        self.parent.progress_bar.setVisible(False)
+        self.update_quota_label()
+        self.parent.update_status(
+            f"일괄 검색 완료: {len(self.keyword_results)}/{len(self.batch_search_worker.keywords)}개 키워드"
+        )
+    
+    def on_batch_keyword_clicked(self, item):
+        """일괄 검색한 키워드의 결과 표시"""
+        keyword = item.data(Qt.UserRole)
+        if keyword not in self.keyword_results:
+            return
+        self.current_keyword = keyword
+        self.keyword_input.setText(keyword)
+        self.show_search_results(self.keyword_results[keyword])
+    
+    def on_search_cache_status(self, cached_pages, total_pages):
+        """검색 결과 캐시 사용 여부 표시"""
+        if cached_pages == total_pages:
+            self.cache_status_label.setText("⚡ 캐시 결과")
+        elif cached_pages > 0:
+            self.cache_status_label.setText(f"⚡ 캐시 {cached_pages}/{total_pages}페이지")
+        else:
+            self.cache_status_label.setText("")
+        self.cache_status_label.setToolTip(
+            "저장된 검색 결과를 사용했습니다. 최신 결과가 필요하면 '새로 검색'을 선택하세요."
+            if cached_pages else ""
+        )
     
     def on_search_failed(self, error_msg):
         """검색 실패 처리"""
@@ -335,28 +643,136 @@ class TitleGenerationTab(QWidget):
         self.parent.progress_bar.setRange(0, 0)
         
         # 선택된 블로그 글로 제목 생성 워커 시작
-        self.title_worker = TitleGenerateWorker(selected_posts, count, api_key)
+        self.skipped_title_count = 0
+        self.title_streaming = self.stream_titles_checkbox.isChecked()
+        self.cancel_titles_btn.setEnabled(self.title_streaming)
+        self.title_worker = TitleGenerateWorker(
+            selected_posts, count, api_key,
+            keyword=self.current_keyword, token_budget=self.token_budget_spin.value(),
+            stream=self.title_streaming,
+        )
+        self.title_worker.title_received.connect(self.on_title_received)
         self.title_worker.titles_generated.connect(self.on_titles_generated)
         self.title_worker.generation_failed.connect(self.on_title_generation_failed)
         self.title_worker.progress.connect(self.parent.update_status)
         self.title_worker.start()
     
-    def on_titles_generated(self, titles):
-        """제목 생성 완료 처리"""
-        self.generated_titles.extend(titles)
+    def generate_batch_titles(self):
+        """일괄 검색한 키워드마다 제목 생성"""
+        if not self.keyword_results:
+            QMessageBox.warning(self, "데이터 없음", "먼저 키워드 일괄 검색을 실행하세요.")
+            return
+        
+        api_key = os.getenv("GEMINI_API_KEY") or self.parent.gemini_key_input.text().strip()
+        if not api_key:
+            QMessageBox.warning(self, "API 오류", "Gemini API 키를 입력하거나 .env 파일에 설정하세요.")
+            return
         
-        # 리스트에 제목 추가
+        keyword_posts = {}
+        for keyword, blog_posts in self.keyword_results.items():
+            if not blog_posts:
+                continue
+            if self.dedup_checkbox.isChecked():
+                blog_posts = collapse_near_duplicates(blog_posts)
+            keyword_posts[keyword] = blog_posts
+        if not keyword_posts:
+            QMessageBox.warning(self, "데이터 없음", "검색 결과가 있는 키워드가 없습니다.")
+            return
+        
+        self.skipped_title_count = 0
+        self.batch_titles_btn.setEnabled(False)
+        self.generate_titles_btn.setEnabled(False)
+        self.parent.progress_bar.setVisible(True)
+        self.parent.progress_bar.setRange(0, len(keyword_posts))
+        self.parent.progress_bar.setValue(0)
+        
+        self.batch_title_worker = BatchTitleGenerateWorker(
+            keyword_posts,
+            self.title_count_spin.value(),
+            api_key,
+            token_budget=self.token_budget_spin.value(),
+            batch_size=get_env_int("TITLE_BATCH_KEYWORDS", DEFAULT_BATCH_KEYWORDS, minimum=1, maximum=20),
+        )
+        self.batch_title_worker.keyword_completed.connect(self.on_keyword_titles_generated)
+        self.batch_title_worker.keyword_failed.connect(self.on_keyword_titles_failed)
+        self.batch_title_worker.progress.connect(self.parent.update_status)
+        self.batch_title_worker.all_completed.connect(self.on_batch_titles_finished)
+        self.batch_title_worker.start()
+    
+    def add_generated_title(self, title, keyword=""):
+        """생성된 제목을 목록에 추가 (예전 제목과 비슷하면 제외하거나 표시)"""
+        similar = self.title_history.find_similar(title)
+        if similar and self.skip_used_titles_checkbox.isChecked():
+            self.skipped_title_count += 1
+            return
+        self.title_history.add(title, SOURCE_GENERATED, keyword)
+        self.generated_titles.append(title)
+        
+        item = QListWidgetItem(title)
+        tooltip = [f"키워드: {keyword}"] if keyword else []
+        if similar:
+            used_as = "발행" if similar["source"] == SOURCE_PUBLISHED else "생성"
+            tooltip.append(f"⚠ 예전에 {used_as}한 제목과 유사 ({similar['similarity']:.0%}): {similar['title']}")
+            item.setForeground(QColor("#e65100"))
+        if tooltip:
+            item.setToolTip("\n".join(tooltip))
+        self.titles_list.addItem(item)
+    
+    def skipped_titles_note(self):
+        return f" (사용했던 제목과 비슷한 {self.skipped_title_count}개 제외)" if self.skipped_title_count else ""
+    
+    def on_keyword_titles_generated(self, keyword, titles):
+        """키워드 하나의 제목 생성 완료"""
         for title in titles:
-            self.titles_list.addItem(title)
+            self.add_generated_title(title, keyword)
+        self.parent.progress_bar.setValue(self.parent.progress_bar.value() + 1)
+    
+    def on_keyword_titles_failed(self, keyword, error_msg):
+        """키워드 하나의 제목 생성 실패"""
+        self.parent.progress_bar.setValue(self.parent.progress_bar.value() + 1)
+        self.parent.update_status(f"'{keyword}' {error_msg}")
+    
+    def on_batch_titles_finished(self):
+        """키워드별 제목 일괄 생성 완료"""
+        self.batch_titles_btn.setEnabled(True)
+        self.generate_titles_btn.setEnabled(bool(self.blog_posts))
+        self.parent.progress_bar.setVisible(False)
+        self.parent.update_status(
+            f"키워드별 제목 생성 완료: 총 {self.titles_list.count()}개 제목{self.skipped_titles_note()}"
+        )
+    
+    def cancel_title_generation(self):
+        """스트리밍 제목 생성 중지"""
+        self.cancel_titles_btn.setEnabled(False)
+        self.title_worker.cancel()
+        self.parent.update_status("제목 생성 중지 중...")
+    
+    def on_title_received(self, title):
+        """스트리밍으로 받은 제목 하나를 바로 추가"""
+        self.add_generated_title(title, self.title_worker.keyword)
+    
+    def on_titles_generated(self, titles):
+        """제목 생성 완료 처리"""
+        # 스트리밍 모드에서는 받을 때마다 이미 추가됨
+        if not self.title_streaming:
+            # 리스트에 제목 추가
+            for title in titles:
+                self.add_generated_title(title, self.title_worker.keyword)
         
         self.generate_titles_btn.setEnabled(True)
+        self.cancel_titles_btn.setEnabled(False)
         self.parent.progress_bar.setVisible(False)
         
-        self.parent.update_status(f"제목 생성 완료: {len(titles)}개")
+        added_count = len(titles) - self.skipped_title_count
+        if self.title_worker.cancelled:
+            self.parent.update_status(f"제목 생성 중지: {added_count}개{self.skipped_titles_note()}")
+        else:
+            self.parent.update_status(f"제목 생성 완료: {added_count}개{self.skipped_titles_note()}")
     
     def on_title_generation_failed(self, error_msg):
         """제목 생성 실패 처리"""
         self.generate_titles_btn.setEnabled(True)
+        self.cancel_titles_btn.setEnabled(False)
         self.parent.progress_bar.setVisible(False)
         self.parent.update_status("제목 생성 실패")
         QMessageBox.critical(self, "제목 생성 실패", error_msg)
@@ -390,33 +806,37 @@ class TitleGenerationTab(QWidget):
     
     def select_all_posts(self):
         """모든 블로그 글 선택"""
-        for i in range(self.search_result_list.count()):
-            item = self.search_result_list.item(i)
-            item.setCheckState(Qt.Checked)
-        self.update_selected_count()
+        self.search_result_model.set_all_checked(True)
     
     def deselect_all_posts(self):
         """모든 블로그 글 선택 해제"""
-        for i in range(self.search_result_list.count()):
-            item = self.search_result_list.item(i)
-            item.setCheckState(Qt.Unchecked)
-        self.update_selected_count()
+        self.search_result_model.set_all_checked(False)
     
-    def update_selected_count(self):
+    def update_selected_count(self, selected_count):
         """선택된 항목 개수 업데이트"""
-        selected_count = 0
-        for i in range(self.search_result_list.count()):
-            item = self.search_result_list.item(i)
-            if item.checkState() == Qt.Checked:
-                selected_count += 1
-        
         self.selected_count_label.setText(f"선택된 글: {selected_count}개")
+        self.schedule_prompt_estimate()
+
+    def schedule_prompt_estimate(self):
+        self.estimate_timer.start()
+
+    def update_prompt_estimate(self):
+        """선택한 글과 토큰 예산으로 예상 프롬프트 크기와 비용 표시"""
+        selected_posts = self.get_selected_posts()
+        if not selected_posts:
+            self.prompt_estimate_label.setText("예상 프롬프트: -")
+            return
+
+        packed = pack_posts(selected_posts, self.current_keyword, self.token_budget_spin.value())
+        count = self.title_count_spin.value()
+        input_tokens = estimate_tokens(build_title_prompt(packed["text"], count))
+        cost = estimate_cost(input_tokens, count * OUTPUT_TOKENS_PER_TITLE)
+
+        text = f"예상 프롬프트: 약 {input_tokens:,} 토큰 (약 ${cost:.4f}) · 글 {packed['used']}/{len(selected_posts)}개 사용"
+        if packed["truncated"]:
+            text += f", 요약 축소 {packed['truncated']}개"
+        self.prompt_estimate_label.setText(text)
     
     def get_selected_posts(self):
         """선택된 블로그 글 목록 반환"""
-        selected_posts = []
-        for i in range(self.search_result_list.count()):
-            item = self.search_result_list.item(i)
-            if item.checkState() == Qt.Checked:
-                selected_posts.append(self.blog_posts[i])
-        return selected_posts
\ No newline at end of file
+        return self.search_result_model.checked_posts()
\ No newline at end of file
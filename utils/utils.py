@@ -1,4 +1,19 @@
 import os
+import re
+
+# 따옴표로 감싸지 않은 값 뒤의 " # 설명" 주석
+_INLINE_COMMENT = re.compile(r"\s+#.*$")
+
+
+def strip_env_value(value):
+    """.env 값에서 따옴표와 줄 끝 주석 제거 (따옴표 안의 #은 값으로 유지)"""
+    value = value.strip()
+    if value[:1] in ('"', "'"):
+        end = value.find(value[0], 1)
+        if end != -1:
+            return value[1:end]
+    return _INLINE_COMMENT.sub("", value).strip('"').strip("'")
+
 
 def load_env_file(file_path=".env"):
     """
@@ -14,7 +29,7 @@ def load_env_file(file_path=".env"):
                     if line and not line.startswith("#") and "=" in line:
                         key, value = line.split("=", 1)
                         key = key.strip()
-                        value = value.strip().strip('"').strip("'")
+                        value = strip_env_value(value)
                         env_vars[key] = value
                         os.environ[key] = value
         except Exception as e:
@@ -22,6 +37,41 @@ def load_env_file(file_path=".env"):
     return env_vars
 
 
+def get_data_dir():
+    """
+    작업 큐, 캐시 등 프로그램 데이터를 저장할 폴더 반환
+    환경변수 APP_DATA_DIR이 없으면 실행 경로의 .blog_generator 폴더 사용
+    """
+    data_dir = os.getenv("APP_DATA_DIR") or os.path.join(os.getcwd(), ".blog_generator")
+    os.makedirs(data_dir, exist_ok=True)
+    return data_dir
+
+
+def get_env_int(key, default, minimum=None, maximum=None):
+    """환경변수를 정수로 읽기 (없거나 잘못된 값이면 기본값 사용)"""
+    try:
+        value = int(os.getenv(key, "").strip() or default)
+    except ValueError:
+        print(f"환경변수 {key} 값이 올바르지 않아 기본값 {default}을(를) 사용합니다.")
+        value = default
+    if minimum is not None:
+        value = max(minimum, value)
+    if maximum is not None:
+        value = min(maximum, value)
+    return value
+
+
+def estimate_tokens(text):
+    """
+    텍스트의 대략적인 토큰 수 추정
+    영문/숫자는 약 4글자당 1토큰, 한글 등 그 외 문자는 1글자당 약 1토큰으로 계산
+    """
+    if not text:
+        return 0
+    ascii_count = sum(1 for c in text if ord(c) < 128)
+    return (ascii_count + 3) // 4 + (len(text) - ascii_count)
+
+
 def sanitize_filename(filename):
     """파일명에서 특수문자 제거"""
     return "".join(c for c in filename if c.isalnum() or c in (" ", "-", "_")).rstrip()
\ No newline at end of file